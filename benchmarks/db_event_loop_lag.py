@@ -0,0 +1,128 @@
+"""
+DB 접근 방식에 따른 이벤트 루프 지연 벤치마크.
+
+동시 요청 N개가 같은 쿼리를 실행하는 동안 5ms마다 깨어나는 탐침 태스크가 얼마나 늦게 깨어나는지 측정합니다.
+- sync:  async 핸들러 안에서 동기 커넥션 풀/커서를 그대로 호출 (기존 psycopg2 방식과 같은 블로킹 패턴)
+- async: psycopg AsyncConnectionPool (현재 configs/database.py 방식)
+
+사용법:
+    python benchmarks/db_event_loop_lag.py --dsn "host=127.0.0.1 port=5432 dbname=... user=... password=..."
+    python benchmarks/db_event_loop_lag.py --mode async --concurrency 50 --requests 1000 --query "SELECT pg_sleep(0.01)"
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import Dict, List
+
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
+PROBE_INTERVAL = 0.005
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0.0
+
+
+async def _probe(lags: List[float], stop: asyncio.Event):
+    while not stop.is_set():
+        expected = time.perf_counter() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def _run_sync(args) -> int:
+    pool = ConnectionPool(args.dsn, min_size=args.pool_size, max_size=args.pool_size, kwargs={"row_factory": dict_row})
+    pool.wait()
+    done = 0
+
+    async def _request():
+        nonlocal done
+        # 기존 코드처럼 이벤트 루프 스레드에서 블로킹 호출을 그대로 실행합니다.
+        with pool.connection() as conn, conn.cursor() as cursor:
+            cursor.execute(args.query)
+            cursor.fetchall()
+        done += 1
+
+    try:
+        await _drive(_request, args)
+    finally:
+        pool.close()
+    return done
+
+
+async def _run_async(args) -> int:
+    pool = AsyncConnectionPool(
+        args.dsn, min_size=args.pool_size, max_size=args.pool_size, kwargs={"row_factory": dict_row}, open=False
+    )
+    await pool.open(wait=True)
+    done = 0
+
+    async def _request():
+        nonlocal done
+        async with pool.connection() as conn, conn.cursor() as cursor:
+            await cursor.execute(args.query)
+            await cursor.fetchall()
+        done += 1
+
+    try:
+        await _drive(_request, args)
+    finally:
+        await pool.close()
+    return done
+
+
+async def _drive(request, args):
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def _limited():
+        async with semaphore:
+            await request()
+
+    await asyncio.gather(*(_limited() for _ in range(args.requests)))
+
+
+async def _measure(mode: str, args) -> Dict[str, float]:
+    lags: List[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    started = time.perf_counter()
+    done = await (_run_sync(args) if mode == "sync" else _run_async(args))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+    return {
+        "requests_per_second": done / elapsed,
+        "lag_p50_ms": _percentile(lags, 0.50) * 1000,
+        "lag_p99_ms": _percentile(lags, 0.99) * 1000,
+        "lag_max_ms": max(lags, default=0.0) * 1000,
+        "lag_mean_ms": statistics.fmean(lags) * 1000 if lags else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", default=os.getenv("BENCH_DSN"), required=os.getenv("BENCH_DSN") is None)
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--pool-size", type=int, default=20)
+    parser.add_argument("--query", default="SELECT pg_sleep(0.005)")
+    args = parser.parse_args()
+
+    modes = ["sync", "async"] if args.mode == "both" else [args.mode]
+    print(f"{'mode':<6} {'req/s':>9} {'lag p50':>9} {'lag p99':>9} {'lag max':>9}  (ms)")
+    for mode in modes:
+        result = asyncio.run(_measure(mode, args))
+        print(
+            f"{mode:<6} {result['requests_per_second']:>9.1f} {result['lag_p50_ms']:>9.2f} "
+            f"{result['lag_p99_ms']:>9.2f} {result['lag_max_ms']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
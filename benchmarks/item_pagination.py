@@ -0,0 +1,103 @@
+"""
+아이템 페이지네이션 벤치마크.
+기존 OFFSET 경로(count_items + get_items, 2회 왕복)와 키셋 경로(get_items_keyset, 1회 왕복)를 비교합니다.
+
+세션 전용 TEMP 테이블 items(기본 100만 행)를 만들어 실제 테이블을 가린 뒤,
+src/info/queries의 SQL을 그대로 prepared statement로 실행해 페이지 깊이별 지연 시간을 비교합니다.
+TEMP 테이블은 연결이 끊기면 사라지므로 실제 데이터에는 영향을 주지 않습니다.
+
+사용법:
+    python benchmarks/item_pagination.py --dsn "host=127.0.0.1 port=5432 dbname=... user=... password=..."
+    python benchmarks/item_pagination.py --rows 1000000 --limit 20 --depths 0 1000 100000 900000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import psycopg
+from psycopg.rows import dict_row
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from utils.sql_registry import sql_registry  # noqa: E402
+
+CREATE_ITEMS = """
+CREATE TEMP TABLE items (
+    item_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    effect_value INTEGER NOT NULL,
+    description TEXT,
+    weight INTEGER NOT NULL,
+    grade TEXT,
+    base_price INTEGER NOT NULL,
+    creator TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+)
+"""
+
+FILL_ITEMS = """
+INSERT INTO items (item_id, name, type, effect_value, description, weight, grade, base_price, creator)
+SELECT g, 'item-' || g, 'potion', g %% 100, 'synthetic', g %% 10, 'C', g %% 1000, 'bench'
+FROM generate_series(1, %(rows)s) AS g
+"""
+
+
+async def _timed(repeat: int, run) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+async def main_async(args):
+    count_sql = sql_registry.get("info", "count_items").text
+    offset_sql = sql_registry.get("info", "get_items").text
+    keyset_sql = sql_registry.get("info", "get_items_keyset").text
+
+    async with await psycopg.AsyncConnection.connect(args.dsn, row_factory=dict_row, autocommit=True) as conn:
+        print(f"TEMP items 테이블에 {args.rows:,}행을 생성합니다...")
+        await conn.execute(CREATE_ITEMS)
+        await conn.execute(FILL_ITEMS, {"rows": args.rows})
+        await conn.execute("ANALYZE items")
+
+        async def _offset(skip):
+            params = {"item_ids": None, "skip": skip, "limit": args.limit}
+            async with conn.cursor() as cursor:
+                await cursor.execute(count_sql, params, prepare=True)
+                await cursor.fetchone()
+                await cursor.execute(offset_sql, params, prepare=True)
+                await cursor.fetchall()
+
+        async def _keyset(after_id):
+            params = {"item_ids": None, "after_id": after_id, "limit": args.limit}
+            async with conn.cursor() as cursor:
+                await cursor.execute(keyset_sql, params, prepare=True)
+                await cursor.fetchall()
+
+        print(f"{'depth':>10} {'offset (ms)':>12} {'keyset (ms)':>12}")
+        for depth in args.depths:
+            # item_id가 1부터 연속이므로 OFFSET depth와 after_id depth는 같은 페이지를 가리킵니다.
+            offset_ms = await _timed(args.repeat, lambda d=depth: _offset(d))
+            keyset_ms = await _timed(args.repeat, lambda d=depth: _keyset(d))
+            print(f"{depth:>10,} {offset_ms:>12.2f} {keyset_ms:>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", default=os.getenv("BENCH_DSN"), required=os.getenv("BENCH_DSN") is None)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--depths", type=int, nargs="+", default=[0, 1_000, 100_000, 500_000, 900_000])
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,26 @@
 from typing import Any, Dict
 
 from fastapi import APIRouter, Body, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from fastapi_utils.cbv import cbv
-from jose import ExpiredSignatureError, jwt
 
 from common.dtos.wrapped_response import WrappedResponse
 from common.utils.get_services import get_auth_service
-from configs.setting import ALGORITHM, SECRET_KEY
 from src.auth.auth_service import AuthService
 from src.auth.dtos.login_dtos import LoginRequest, Token, TokenResponse
+from utils.claims import TokenClaims, UnauthorizedMessages, claims_dependency
 
 auth_router = APIRouter(prefix="/auth", tags=["인증 및 로그인"])
-auth_scheme = HTTPBearer()
+
+# 인증 라우트는 토큰 검증 실패 시에도 기존 응답 메시지를 그대로 돌려줍니다.
+me_claims = claims_dependency(
+    UnauthorizedMessages(
+        expired="토큰이 만료되었습니다.", invalid="인증에 실패했습니다.", malformed="인증에 실패했습니다."
+    )
+)
+_LOGOUT_FAILED = "유효하지 않은 토큰이거나 로그아웃 중 오류가 발생했습니다."
+logout_claims = claims_dependency(
+    UnauthorizedMessages(expired=_LOGOUT_FAILED, invalid=_LOGOUT_FAILED, malformed=_LOGOUT_FAILED)
+)
 
 
 @cbv(auth_router)
@@ -38,25 +46,15 @@ class AuthHandler:
     )
     async def get_me(
         self,
-        token_auth: HTTPAuthorizationCredentials = Depends(auth_scheme),
+        claims: TokenClaims = Depends(me_claims),
         auth_service: AuthService = Depends(get_auth_service),
     ):
         try:
-            token = token_auth.credentials
-            # 1. 토큰 복호화 및 유효성 검증
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            user_id: str = payload.get("sub")
-
-            if user_id is None:
-                raise ValueError("유효하지 않은 토큰이 제공되었습니다.")
-
-            # 2. 서비스 계층에서 유저 정보 조회
-            user_info = await auth_service.get_current_user_info(user_id)
+            # 서비스 계층에서 유저 정보 조회 (토큰 검증은 me_claims 의존성에서 처리)
+            user_info = await auth_service.get_current_user_info(claims.user_id)
 
             return {"data": user_info, "message": "인증되었습니다."}
 
-        except ExpiredSignatureError:
-            raise HTTPException(status_code=401, detail="토큰이 만료되었습니다.") from None
         except Exception:
             raise HTTPException(status_code=401, detail="인증에 실패했습니다.") from None
 
@@ -86,18 +84,11 @@ class AuthHandler:
     @auth_router.post("/logout")
     async def logout(
         self,
-        # HTTPBearer를 통해 'Bearer ' 접두사를 떼고 토큰 값만 가져옴
-        token_auth: HTTPAuthorizationCredentials = Depends(auth_scheme),
+        claims: TokenClaims = Depends(logout_claims),
         auth_service: AuthService = Depends(get_auth_service),
     ):
         try:
-            # 이미 Bearer가 제거된 순수 토큰 값
-            token = token_auth.credentials
-
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-            user_id: str = payload.get("sub")
-
-            await auth_service.process_logout(user_id)
+            await auth_service.process_logout(claims.user_id)
 
             return {"data": None, "message": "성공적으로 로그아웃되었습니다."}
         except Exception:
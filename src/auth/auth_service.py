@@ -4,27 +4,28 @@ from fastapi import HTTPException
 from jose import jwt
 
 from src.auth.dtos.login_dtos import TokenResponse
-from src.configs.redis_conn import redis_client
 from src.configs.setting import ALGORITHM, REFRESH_TOKEN_EXPIRE_DAYS, SECRET_KEY
-from utils.load_sql import load_sql
+from utils.password_pool import password_pool
+from utils.redis_batcher import redis_batcher
+from utils.sql_registry import sql_registry
 
-from .utils.crypt_utils import verify_password
 from .utils.token_utils import create_access_token, create_refresh_token
 
 
 class AuthService:
     def __init__(self, cursor):
         self.cursor = cursor
-        self.create_user_sql = load_sql("auth", "create_user")
-        self.get_user_by_id_sql = load_sql("auth", "get_user_by_id")
-        self.get_user_by_username_sql = load_sql("auth", "get_user_by_username")
-        self.get_user_for_auth_sql = load_sql("auth", "get_user_for_auth")
+        self.create_user_sql = sql_registry.get("auth", "create_user")
+        self.get_user_by_id_sql = sql_registry.get("auth", "get_user_by_id")
+        self.get_user_by_username_sql = sql_registry.get("auth", "get_user_by_username")
+        self.get_user_for_auth_sql = sql_registry.get("auth", "get_user_for_auth")
 
     async def signup(self, username: str, hashed_password: str, email: str):
         try:
             params = {"username": username, "password_hash": hashed_password, "email": email}
-            self.cursor.execute(self.create_user_sql, params)
-            new_user = self.cursor.fetchone()
+            async with self.cursor:
+                await self.cursor.execute(self.create_user_sql, params)
+                new_user = await self.cursor.fetchone()
             return new_user
 
         except Exception:
@@ -33,23 +34,25 @@ class AuthService:
 
     async def authenticate_user(self, username: str, password: str) -> Dict[str, Any]:
         """사용자 인증 및 토큰 세트 발행 (Redis 저장 포함)"""
-        # SQL은 파일에서 읽어온다고 가정하거나, 일단 문자열로 정의된 상수를 사용합니다.
-        self.cursor.execute(
-            self.get_user_for_auth_sql,
-            {"username": username},
-        )
-        user = self.cursor.fetchone()
+        # 커넥션은 조회가 끝나면 바로 반납하고, 느린 bcrypt 검증은 커넥션 없이 진행합니다.
+        async with self.cursor:
+            await self.cursor.execute(
+                self.get_user_for_auth_sql,
+                {"username": username},
+            )
+            user = await self.cursor.fetchone()
 
         # 유저 검증 및 비밀번호 확인
-        if not user or not verify_password(password, user["password_hash"]):
+        if not user or not await password_pool.verify(password, user["password_hash"]):
             raise HTTPException(status_code=401, detail="아이디 또는 비밀번호가 잘못되었습니다.") from None
 
         token_data = {"sub": str(user["user_id"]), "username": user["username"]}
         access_token = create_access_token(data=token_data)
         refresh_token = create_refresh_token(data=token_data)
 
-        # Redis에 Refresh Token 저장
-        redis_client.setex(
+        # Redis에 Refresh Token 저장 (동시에 들어온 다른 요청의 명령과 한 파이프라인으로 전송)
+        await redis_batcher.execute(
+            "SETEX",
             f"refresh_token:{user['user_id']}",
             60 * 60 * 24 * REFRESH_TOKEN_EXPIRE_DAYS,
             refresh_token,
@@ -69,7 +72,7 @@ class AuthService:
             username: str = payload.get("username")
 
             # Redis 체크
-            saved_token = redis_client.get(f"refresh_token:{user_id}")
+            saved_token = await redis_batcher.execute("GET", f"refresh_token:{user_id}")
             if not saved_token or saved_token != refresh_token:
                 raise ValueError("Invalid Refresh Token")
 
@@ -81,8 +84,9 @@ class AuthService:
 
     async def get_current_user_info(self, user_id: str) -> Dict[str, Any]:
         """토큰에서 추출한 user_id로 사용자 정보를 조회합니다."""
-        self.cursor.execute(self.get_user_by_id_sql, {"user_id": user_id})
-        user = self.cursor.fetchone()
+        async with self.cursor:
+            await self.cursor.execute(self.get_user_by_id_sql, {"user_id": user_id})
+            user = await self.cursor.fetchone()
 
         if not user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.") from None
@@ -95,4 +99,4 @@ class AuthService:
 
     async def process_logout(self, user_id: str):
         """Redis에서 세션 제거"""
-        redis_client.delete(f"refresh_token:{user_id}")
+        await redis_batcher.execute("DEL", f"refresh_token:{user_id}")
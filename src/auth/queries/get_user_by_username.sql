@@ -1,3 +1,4 @@
+-- name: get_user_by_username
 SELECT user_id, username, password_hash, email, is_active, created_at
 FROM users
 WHERE username = %(username)s
@@ -1,3 +1,4 @@
+-- name: get_user_for_auth
 SELECT user_id, username, password_hash
 FROM users
 WHERE username = %(username)s
@@ -0,0 +1,57 @@
+from functools import lru_cache
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi_utils.cbv import cbv
+from starlette.routing import BaseRoute
+
+from batch.batch_service import BatchExecutor, PreAuthenticatedRouter
+from batch.dtos.batch_dtos import BatchRequest, BatchResponse
+from common.dtos.wrapped_response import WrappedResponse
+from configs.setting import BATCH_MAX_CONCURRENCY, BATCH_MAX_ITEMS
+from utils.claims import TokenClaims, bearer_scheme, get_claims
+
+batch_router = APIRouter(tags=["배치 요청"])
+security = bearer_scheme
+
+
+@lru_cache(maxsize=1)
+def batchable_routes() -> List[BaseRoute]:
+    """배치로 호출할 수 있는 라우트 목록 (API_ROUTERS에 등록된 라우터, /batch 자신은 제외)"""
+    # api_routers가 이 모듈을 import하므로 순환 import를 피하기 위해 처음 사용할 때 불러옵니다.
+    from src.configs.api_routers import API_ROUTERS
+
+    return [route for router in API_ROUTERS if router is not batch_router for route in router.routes]
+
+
+@cbv(batch_router)
+class BatchHandler:
+    @batch_router.post(
+        "/batch",
+        response_model=WrappedResponse[BatchResponse],
+        summary="여러 API 요청을 한 번에 실행합니다.",
+        description=(
+            "인증은 한 번만 확인하고, 하위 요청은 서버 내부에서 동시에 실행합니다. "
+            "하위 요청마다 상태 코드와 본문을 따로 반환하며, `{{id.data.session_id}}`처럼 "
+            "앞선 하위 요청의 응답 값을 경로/쿼리/본문에서 참조할 수 있습니다."
+        ),
+    )
+    async def run_batch(
+        self,
+        request_data: BatchRequest,
+        request: Request,
+        auth: HTTPAuthorizationCredentials = Depends(security),
+        claims: TokenClaims = Depends(get_claims),  # 인증은 배치 요청에서 한 번만 확인합니다.
+    ):
+        if len(request_data.items) > BATCH_MAX_ITEMS:
+            raise HTTPException(status_code=422, detail=f"하위 요청은 최대 {BATCH_MAX_ITEMS}개까지 보낼 수 있습니다.")
+
+        executor = BatchExecutor(
+            PreAuthenticatedRouter(request, auth.credentials, claims),
+            batchable_routes(),
+            authorization=f"{auth.scheme} {auth.credentials}",
+            max_concurrency=BATCH_MAX_CONCURRENCY,
+        )
+        results = await executor.run(request_data.items)
+        return BatchResponse(results=results).model_dump(mode="json")
@@ -0,0 +1,224 @@
+import asyncio
+import re
+from typing import Any, Dict, List, Optional, Sequence, Set
+from urllib.parse import quote, unquote
+
+import httpx
+from fastapi import HTTPException, Request
+from fastapi.middleware.asyncexitstack import AsyncExitStackMiddleware
+from starlette.routing import BaseRoute, Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from batch.dtos.batch_dtos import BatchItem, BatchItemResult
+from utils.claims import VERIFIED_CLAIMS_STATE, TokenClaims
+from utils.logger import debug, error
+
+# `{{item_id.data.session_id}}` 형태로 앞선 하위 요청의 응답 값을 참조합니다. 리스트는 숫자 인덱스로 접근합니다.
+_REFERENCE = re.compile(r"\{\{\s*([A-Za-z0-9_\-]+)((?:\.[^.{}\s]+)*)\s*\}\}")
+_INTERNAL_BASE_URL = "http://batch.internal"
+
+
+class BatchReferenceError(Exception):
+    """참조한 응답 값을 찾을 수 없는 경우"""
+
+
+def find_references(value: Any) -> Set[str]:
+    """경로/쿼리/본문에 포함된 `{{id...}}` 참조의 하위 요청 ID를 모읍니다."""
+    if isinstance(value, str):
+        return {match.group(1) for match in _REFERENCE.finditer(value)}
+    if isinstance(value, dict):
+        return set().union(*(find_references(v) for v in value.values())) if value else set()
+    if isinstance(value, list):
+        return set().union(*(find_references(v) for v in value)) if value else set()
+    return set()
+
+
+def _lookup(body: Any, dotted: str) -> Any:
+    current = body
+    for key in filter(None, dotted.split(".")):
+        if isinstance(current, dict) and key in current:
+            current = current[key]
+        elif isinstance(current, list) and key.isdigit() and int(key) < len(current):
+            current = current[int(key)]
+        else:
+            raise BatchReferenceError(f"참조 경로를 찾을 수 없습니다: {dotted}")
+    return current
+
+
+def resolve_references(value: Any, bodies: Dict[str, Any]) -> Any:
+    """
+    참조를 앞선 응답 값으로 치환합니다.
+    문자열 전체가 하나의 참조이면 원래 타입(숫자, 객체 등)을 유지하고, 일부이면 문자열로 끼워 넣습니다.
+    """
+    if isinstance(value, str):
+        whole = _REFERENCE.fullmatch(value)
+        if whole:
+            return _lookup(bodies[whole.group(1)], whole.group(2))
+        return _REFERENCE.sub(lambda m: str(_lookup(bodies[m.group(1)], m.group(2))), value)
+    if isinstance(value, dict):
+        return {k: resolve_references(v, bodies) for k, v in value.items()}
+    if isinstance(value, list):
+        return [resolve_references(v, bodies) for v in value]
+    return value
+
+
+def resolve_path(path: str, bodies: Dict[str, Any]) -> str:
+    """
+    경로의 참조를 치환합니다. 값은 경로 세그먼트로 인코딩해 `?`, `#` 등이 대상 라우트를 바꾸지 못하게 합니다.
+    ASGI 서버는 라우팅 전에 `%2F`를 `/`로 되돌리므로, `/`가 들어 있는 값은 인코딩 대신 거절합니다.
+    """
+
+    def _segment(match: re.Match) -> str:
+        value = str(_lookup(bodies[match.group(1)], match.group(2)))
+        if "/" in value:
+            raise BatchReferenceError(f"경로에 넣을 참조 값에 '/'를 사용할 수 없습니다: {match.group(0)}")
+        return quote(value, safe="")
+
+    return _REFERENCE.sub(_segment, path)
+
+
+def plan_dependencies(items: Sequence[BatchItem]) -> Dict[str, Set[str]]:
+    """하위 요청별 선행 요청 목록을 만들고, 존재하지 않는 ID나 순환 의존성은 422로 거절합니다."""
+    ids = [item.id for item in items]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=422, detail="하위 요청 ID가 중복되었습니다.")
+
+    dependencies: Dict[str, Set[str]] = {}
+    for item in items:
+        deps = set(item.depends_on) | find_references([item.path, item.query, item.body])
+        unknown = deps - set(ids)
+        if unknown:
+            raise HTTPException(
+                status_code=422, detail=f"'{item.id}'이(가) 알 수 없는 하위 요청을 참조합니다: {sorted(unknown)}"
+            )
+        dependencies[item.id] = deps
+
+    # 위상 정렬로 순환 의존성을 검사합니다.
+    remaining = {item_id: set(deps) for item_id, deps in dependencies.items()}
+    while remaining:
+        ready = [item_id for item_id, deps in remaining.items() if not deps]
+        if not ready:
+            raise HTTPException(status_code=422, detail=f"순환 의존성이 있습니다: {sorted(remaining)}")
+        for item_id in ready:
+            del remaining[item_id]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return dependencies
+
+
+def is_batchable(method: str, path: str, routes: Sequence[BaseRoute]) -> bool:
+    scope = {"type": "http", "method": method, "path": path}
+    return any(route.matches(scope)[0] == Match.FULL for route in routes)
+
+
+class PreAuthenticatedRouter:
+    """
+    배치 하위 요청을 미들웨어 스택을 거치지 않고 라우터로 바로 보내는 내부 ASGI 앱.
+    인증/격벽/마감 시간 등 미들웨어는 배치 요청에서 한 번만 거치며,
+    배치 요청에서 검증한 클레임과 예외 처리기를 하위 요청에 넘겨 토큰을 다시 검증하지 않습니다.
+    """
+
+    def __init__(self, request: Request, token: str, claims: TokenClaims):
+        # 라우터 바로 바깥의 FastAPI 내부 미들웨어(의존성 정리용 종료 스택)만 함께 둡니다.
+        self.router = AsyncExitStackMiddleware(request.app.router)
+        self.app = request.scope.get("app")
+        self.exception_handlers = request.scope.get("starlette.exception_handlers")
+        self.verified = (token, claims)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            scope = {
+                **scope,
+                "app": self.app,
+                "state": {**scope.get("state", {}), VERIFIED_CLAIMS_STATE: self.verified},
+            }
+            if self.exception_handlers is not None:
+                scope["starlette.exception_handlers"] = self.exception_handlers
+        await self.router(scope, receive, send)
+
+
+class BatchExecutor:
+    """
+    하위 요청을 앱 내부(ASGI)로 직접 전달해 실행합니다. 네트워크를 거치지 않으며,
+    각 하위 요청은 일반 요청과 같은 라우트 검증/예외 처리를 거칩니다.
+    app으로 PreAuthenticatedRouter를 넘기면 미들웨어와 토큰 검증을 배치 요청에서 한 번만 수행합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        routes: Sequence[BaseRoute],
+        authorization: Optional[str],
+        max_concurrency: int,
+    ):
+        self.app = app
+        self.routes = routes
+        self.authorization = authorization
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(self, items: Sequence[BatchItem]) -> List[BatchItemResult]:
+        dependencies = plan_dependencies(items)
+        results: Dict[str, BatchItemResult] = {}
+        done: Dict[str, asyncio.Event] = {item.id: asyncio.Event() for item in items}
+
+        # 내부 호출이므로 압축은 불필요합니다.
+        headers = {"Accept-Encoding": "identity"}
+        if self.authorization:
+            headers["Authorization"] = self.authorization
+        # 처리되지 않은 예외도 500 응답으로 받아 해당 하위 요청의 결과로만 남깁니다.
+        transport = httpx.ASGITransport(app=self.app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url=_INTERNAL_BASE_URL, headers=headers) as client:
+
+            async def _run_item(item: BatchItem):
+                try:
+                    # 선행 요청을 기다린 뒤에 동시 실행 슬롯을 잡아야 의존 관계로 인한 교착이 생기지 않습니다.
+                    for dep in dependencies[item.id]:
+                        await done[dep].wait()
+                    results[item.id] = await self._execute(client, item, dependencies[item.id], results)
+                except Exception as e:
+                    error(f"batch item {item.id} 실행 중 오류: {e}")
+                    results[item.id] = BatchItemResult(
+                        id=item.id, status_code=500, body={"detail": "하위 요청 처리 중 오류가 발생했습니다."}
+                    )
+                finally:
+                    done[item.id].set()
+
+            await asyncio.gather(*(_run_item(item) for item in items))
+
+        return [results[item.id] for item in items]
+
+    async def _execute(
+        self,
+        client: httpx.AsyncClient,
+        item: BatchItem,
+        dependencies: Set[str],
+        results: Dict[str, BatchItemResult],
+    ) -> BatchItemResult:
+        failed = sorted(dep for dep in dependencies if results[dep].status_code >= 400)
+        if failed:
+            return BatchItemResult(id=item.id, status_code=424, body={"detail": f"선행 요청이 실패했습니다: {failed}"})
+
+        bodies = {dep: results[dep].body for dep in dependencies}
+        try:
+            path = resolve_path(item.path, bodies)
+            query = resolve_references(item.query, bodies)
+            body = resolve_references(item.body, bodies)
+        except BatchReferenceError as e:
+            return BatchItemResult(id=item.id, status_code=422, body={"detail": str(e)})
+
+        method = item.method.value
+        # 라우팅은 디코딩된 경로로 이루어지므로 같은 기준으로 배치 허용 여부를 확인합니다.
+        if not is_batchable(method, unquote(path), self.routes):
+            return BatchItemResult(
+                id=item.id, status_code=404, body={"detail": f"배치로 호출할 수 없는 경로입니다: {method} {path}"}
+            )
+
+        async with self._semaphore:
+            debug(f"batch item {item.id}: {method} {path}")
+            response = await client.request(method, path, params=query, json=body)
+
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = response.text
+        return BatchItemResult(id=item.id, status_code=response.status_code, body=payload)
@@ -0,0 +1,57 @@
+from enum import Enum
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class BatchMethod(str, Enum):
+    GET = "GET"
+    POST = "POST"
+    PUT = "PUT"
+    PATCH = "PATCH"
+    DELETE = "DELETE"
+
+
+class BatchItem(BaseModel):
+    """배치로 실행할 하위 요청"""
+
+    id: str = Field(..., min_length=1, description="배치 내에서 고유한 하위 요청 ID")
+    method: BatchMethod = Field(BatchMethod.GET, description="HTTP 메서드")
+    path: str = Field(..., pattern=r"^/", description="호출할 API 경로 (예: /state/session/{{start.data.session_id}})")
+    query: Optional[dict[str, Any]] = Field(None, description="쿼리 파라미터")
+    body: Optional[Any] = Field(None, description="JSON 요청 본문")
+    depends_on: List[str] = Field(
+        default_factory=list,
+        description="먼저 완료되어야 하는 하위 요청 ID. `{{id.필드경로}}` 참조는 자동으로 의존성에 추가됩니다.",
+    )
+
+
+class BatchRequest(BaseModel):
+    items: List[BatchItem] = Field(..., min_length=1, description="하위 요청 목록")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {"id": "sessions", "method": "GET", "path": "/state/sessions/active"},
+                    {
+                        "id": "snapshot",
+                        "method": "GET",
+                        "path": "/state/session/{{sessions.data.0.session_id}}/snapshot",
+                        "query": {"sections": "npcs,enemies"},
+                    },
+                    {"id": "me", "method": "GET", "path": "/user/detail"},
+                ]
+            }
+        }
+    )
+
+
+class BatchItemResult(BaseModel):
+    id: str = Field(..., description="하위 요청 ID")
+    status_code: int = Field(..., description="하위 요청의 HTTP 상태 코드 (선행 요청 실패 시 424)")
+    body: Any = Field(None, description="하위 요청의 응답 본문")
+
+
+class BatchResponse(BaseModel):
+    results: List[BatchItemResult] = Field(default_factory=list, description="요청 순서대로 정렬된 결과")
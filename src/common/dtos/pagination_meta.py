@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
@@ -8,3 +10,8 @@ class PaginationMeta(BaseModel):
     limit: int = Field(..., description="페이지당 최대 항목 수 (Limit)")
     is_last_page: bool = Field(..., description="마지막 페이지 여부")
     total_pages: int = Field(..., description="전체 페이지 수")
+
+
+# 키셋(커서) 페이지네이션 메타데이터 DTO
+class KeysetPaginationMeta(PaginationMeta):
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
@@ -0,0 +1,33 @@
+import base64
+import json
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    키셋 페이지네이션 위치. after_id보다 큰 키부터 다음 페이지를 읽습니다.
+    skip은 앞 페이지들에서 반환한 항목 수로, PaginationMeta를 채우는 데만 사용합니다.
+    """
+
+    after_id: int = 0
+    skip: int = 0
+
+
+def encode_page_cursor(cursor: PageCursor) -> str:
+    raw = json.dumps({"a": cursor.after_id, "s": cursor.skip}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_page_cursor(token: str) -> PageCursor:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = json.loads(raw)
+        cursor = PageCursor(after_id=int(data["a"]), skip=int(data["s"]))
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.") from None
+    if cursor.skip < 0:
+        raise HTTPException(status_code=400, detail="잘못된 페이지 커서입니다.")
+    return cursor
@@ -0,0 +1,51 @@
+import os
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict, Tuple
+
+
+class Priority(IntEnum):
+    """벌크헤드 대기열에서의 우선순위. 값이 클수록 먼저 처리되고 나중에 버려집니다."""
+
+    BACKGROUND = 0  # 생성/요약처럼 늦어져도 되는 작업
+    INTERACTIVE = 1  # 플레이어가 화면에서 응답을 기다리는 작업
+
+
+@dataclass(frozen=True)
+class BulkheadConfig:
+    """라우트 분류별 격벽(bulkhead) 설정"""
+
+    max_concurrent: int  # 동시에 처리할 수 있는 요청 수
+    max_queue: int  # 슬롯을 기다릴 수 있는 요청 수. 가득 차면 우선순위가 낮은 요청부터 버립니다.
+
+
+def _bulkhead_config(name: str, default: BulkheadConfig) -> BulkheadConfig:
+    """환경 변수({NAME}_BULKHEAD_MAX_CONCURRENT, {NAME}_BULKHEAD_MAX_QUEUE)로 기본 설정을 덮어씁니다."""
+    prefix = name.upper()
+    return BulkheadConfig(
+        max_concurrent=int(os.getenv(f"{prefix}_BULKHEAD_MAX_CONCURRENT", default.max_concurrent)),
+        max_queue=int(os.getenv(f"{prefix}_BULKHEAD_MAX_QUEUE", default.max_queue)),
+    )
+
+
+BULKHEADS: Dict[str, BulkheadConfig] = {
+    # LLM을 거치는 느린 요청
+    "llm": _bulkhead_config("llm", BulkheadConfig(max_concurrent=32, max_queue=64)),
+    # SSE 스트림은 수명이 길어 대기시키지 않고 한도를 넘으면 바로 거절합니다.
+    "stream": _bulkhead_config("stream", BulkheadConfig(max_concurrent=100, max_queue=0)),
+    # bcrypt 해시/검증 프로세스 풀. 동시 처리 수가 곧 워커 수이며, 코어 절반만 사용해 게임 트래픽 몫을 남깁니다.
+    "password": _bulkhead_config(
+        "password", BulkheadConfig(max_concurrent=max(1, (os.cpu_count() or 2) // 2), max_queue=32)
+    ),
+}
+
+# 경로 템플릿 → (벌크헤드 이름, 우선순위). 등록되지 않은 빠른 라우트(/auth/me 등)는 벌크헤드를 거치지 않습니다.
+ROUTE_BULKHEADS: Dict[str, Tuple[str, Priority]] = {
+    "/gm/turn": ("llm", Priority.INTERACTIVE),
+    "/gm/npc-turn": ("llm", Priority.INTERACTIVE),
+    "/gm/summary": ("llm", Priority.BACKGROUND),
+    "/scenario/generation/pure": ("llm", Priority.BACKGROUND),
+    "/minigame/tip-sentence": ("llm", Priority.BACKGROUND),
+    "/minigame/riddle": ("stream", Priority.INTERACTIVE),
+    "/minigame/quiz": ("stream", Priority.INTERACTIVE),
+}
@@ -1,15 +1,20 @@
 import sys
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
 
-import psycopg2
+import psycopg
 from fastapi import HTTPException
-from psycopg2 import extras, pool
+from psycopg.conninfo import make_conninfo
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 from sshtunnel import SSHTunnelForwarder
 
 from src.configs.setting import (
     DB_HOST,
     DB_NAME,
     DB_PASSWORD,
+    DB_POOL_ACQUIRE_TIMEOUT_SECONDS,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MIN_SIZE,
     DB_PORT,
     DB_USER,
     SSH_ENABLED,
@@ -18,6 +23,7 @@ from src.configs.setting import (
     SSH_USER,
 )
 from src.utils.logger import logger
+from utils.db_session import RELEASED_AT_REQUEST_END, LazyCursor
 
 # RDB SSH 터널 정의
 rdb_tunnel = None
@@ -35,78 +41,77 @@ if SSH_ENABLED:
     actual_db_port = rdb_tunnel.local_bind_port
     logger.info(f"🚀 PostgreSQL용 SSH 터널 활성화 (Port: {actual_db_port})")
 
-# 커넥션 풀 설정
-try:
-    connection_pool = pool.ThreadedConnectionPool(
-        minconn=1,
-        maxconn=20,
+# 비동기 커넥션 풀 설정. 이벤트 루프 안에서 열어야 하므로 서버 시작 시 open_db_pool()로 연결합니다.
+connection_pool = AsyncConnectionPool(
+    make_conninfo(
         user=DB_USER,
         password=DB_PASSWORD,
         host=DB_HOST,
         port=actual_db_port,
-        database=DB_NAME,
-    )
-    logger.info("✅ 데이터베이스 커넥션 풀이 성공적으로 생성되었습니다.")
-except Exception as e:
-    logger.error(f"❌ 데이터베이스 커넥션 풀 생성 중 치명적인 오류 발생: {e}", exc_info=True)
-    sys.exit(1)  # 커넥션 풀 생성 실패 시 애플리케이션 즉시 종료
+        dbname=DB_NAME,
+    ),
+    min_size=DB_POOL_MIN_SIZE,
+    max_size=DB_POOL_MAX_SIZE,
+    timeout=DB_POOL_ACQUIRE_TIMEOUT_SECONDS,
+    kwargs={"row_factory": dict_row},
+    name="rdb",
+    open=False,
+)
+
+
+async def open_db_pool():
+    try:
+        await connection_pool.open(wait=True, timeout=DB_POOL_ACQUIRE_TIMEOUT_SECONDS)
+        logger.info("✅ 데이터베이스 커넥션 풀이 성공적으로 생성되었습니다.")
+    except Exception as e:
+        logger.error(f"❌ 데이터베이스 커넥션 풀 생성 중 치명적인 오류 발생: {e}", exc_info=True)
+        sys.exit(1)  # 커넥션 풀 생성 실패 시 애플리케이션 즉시 종료
+
+
+async def close_db_pool():
+    await connection_pool.close()
 
 
 # DB 연결 관리 Context Manager
-def get_db_cursor():
+async def get_db_cursor():
     """
-    커넥션 풀에서 커넥션을 빌려오고,
-    결과를 딕셔너리 형태로 반환하는 커서(DictCursor)를 제공합니다.
+    요청마다 첫 쿼리에서 커넥션을 빌리는 지연 커서(LazyCursor)를 제공합니다.
+    서비스가 `async with cursor:` 블록으로 묶은 쿼리는 블록이 끝나는 즉시 커밋 후 커넥션을 반납하고,
+    블록 밖에서 실행한 쿼리는 응답이 끝날 때 커밋(예외 시 롤백)한 뒤 반납합니다.
     """
-    conn = None  # conn을 None으로 초기화합니다.
-    try:
-        # 터널이 살아있는지 먼저 확인 (디버깅용)
-        if SSH_ENABLED and (not rdb_tunnel or not rdb_tunnel.is_active):
-            raise ConnectionError("RDB SSH 터널이 활성화되어 있지 않습니다.")
+    # 터널이 살아있는지 먼저 확인 (디버깅용)
+    if SSH_ENABLED and (not rdb_tunnel or not rdb_tunnel.is_active):
+        raise ConnectionError("RDB SSH 터널이 활성화되어 있지 않습니다.")
 
-        conn = connection_pool.getconn()
-        cursor = conn.cursor(cursor_factory=extras.RealDictCursor)
+    cursor = LazyCursor(connection_pool, DB_POOL_ACQUIRE_TIMEOUT_SECONDS)
+    try:
         yield cursor
-        conn.commit()
+        await cursor.release(commit=True, reason=RELEASED_AT_REQUEST_END)
     except HTTPException:
         # FastAPI의 HTTPException은 그대로 다시 던집니다 (404 등을 유지하기 위해)
         raise
-    except psycopg2.OperationalError as e:
-        if conn:
-            conn.rollback()
+    except psycopg.OperationalError as e:
         logger.error(f"❌ 데이터베이스 연결 또는 운영 오류 발생: {e}", exc_info=True)
         raise ConnectionError("데이터베이스 연결 또는 운영 오류가 발생했습니다. 잠시 후 다시 시도해주세요.") from e
-    except psycopg2.Error as e:
-        if conn:
-            conn.rollback()
+    except psycopg.Error as e:
         logger.error(f"❌ 데이터베이스 쿼리 실행 중 오류 발생: {e}", exc_info=True)
         raise RuntimeError("데이터베이스 쿼리 실행 중 오류가 발생했습니다.") from e
     except Exception as e:
-        if conn:
-            conn.rollback()
-
-        # 만약 e가 이미 HTTPException이라면 로깅하지 않고 그대로 던짐
-        if isinstance(e, HTTPException):
-            raise e
-
         logger.error(f"❌ 데이터베이스 커서 사용 중 예상치 못한 오류 발생: {e}", exc_info=True)
         raise RuntimeError("데이터베이스 사용 중 예상치 못한 오류가 발생했습니다.") from e
     finally:
-        if conn:
-            connection_pool.putconn(conn)
+        # 예외로 끝난 요청이 아직 쥐고 있는 커넥션은 롤백 후 반납합니다. (정상 종료 시에는 이미 반납됨)
+        await cursor.release(commit=False, reason=RELEASED_AT_REQUEST_END)
 
 
-db_cursor_context = contextmanager(get_db_cursor)
+db_cursor_context = asynccontextmanager(get_db_cursor)
 
 
 # 연결 테스트
-def check_db_connection():
+async def check_db_connection():
     try:
-        with db_cursor_context() as cursor:
-            cursor.execute("SELECT 1")
+        async with db_cursor_context() as cursor:
+            await cursor.execute("SELECT 1")
             logger.info("✅ 데이터베이스 연결 상태 확인 완료")
     except Exception as e:
         logger.error(f"❌ 데이터베이스 연결 확인 실패: {e}", exc_info=True)
-
-
-check_db_connection()
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass(frozen=True)
+class RouteDeadline:
+    """라우트별 마감 시간 예산"""
+
+    budget: float  # 예산 상한 (초). 클라이언트가 요청한 예산이 더 짧으면 그 값을 사용합니다.
+    # 관측 p99 x DEADLINE_P99_MULTIPLIER로 예산을 줄일지 여부.
+    # 예산을 넘겨 취소된 요청도 업스트림에서는 이미 반영되었을 수 있으므로 다시 보내도 안전한 조회에만 켭니다.
+    # IDEMPOTENT_ROUTES(재시도 중복을 막는 상태 변경 라우트)에는 켜도 적용되지 않습니다.
+    adaptive: bool = False
+
+
+# 경로 템플릿 기준. 등록되지 않은 라우트는 DEADLINE_DEFAULT_SECONDS(기본 60초, 기존 프록시 타임아웃)를
+# 상한으로 사용합니다. 기본값과 다른 예산이 필요한 라우트만 이유와 함께 여기에 등록합니다.
+ROUTE_DEADLINES: Dict[str, RouteDeadline] = {
+    # LLM을 거치는 라우트는 업스트림 읽기 타임아웃(120초)에 맞춰 여유 있게 잡습니다.
+    "/gm/turn": RouteDeadline(budget=120.0),
+    "/gm/npc-turn": RouteDeadline(budget=120.0),
+    "/gm/summary": RouteDeadline(budget=60.0),
+    "/scenario/generation/pure": RouteDeadline(budget=120.0),
+    "/scenario/manage/scenarios/{scenario_id}/inject": RouteDeadline(budget=60.0),
+    # 다시 보내도 되는 조회는 관측 p99에 맞춰 예산을 줄여, 멈춘 업스트림을 끝까지 기다리지 않습니다.
+    "/gm/history/{session_id}": RouteDeadline(budget=60.0, adaptive=True),
+    "/minigame/tip-sentence": RouteDeadline(budget=30.0, adaptive=True),
+    # 하위 요청들이 이 예산을 나눠 쓰므로 클라이언트가 너무 오래 기다리지 않도록 줄입니다.
+    "/batch": RouteDeadline(budget=30.0),
+}
@@ -1,8 +1,93 @@
+import time
+from typing import Any, Dict, Optional
+
 import httpx
 
 
+class PoolStats:
+    """커넥션 풀의 체크아웃 대기 시간과 사용률을 집계합니다."""
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self.in_flight = 0
+        self.requests = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def observe_wait(self, seconds: float):
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "max_connections": self.max_connections,
+            "in_flight": self.in_flight,
+            "utilization": round(self.in_flight / self.max_connections, 4) if self.max_connections else 0.0,
+            "requests": self.requests,
+            "checkout_wait_avg_ms": round(self.wait_seconds_total / self.requests * 1000, 3) if self.requests else 0.0,
+            "checkout_wait_max_ms": round(self.wait_seconds_max * 1000, 3),
+        }
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """
+    실제 전송 계층을 감싸 풀 사용량과 체크아웃 대기 시간을 측정하는 트랜스포트.
+    풀에서 커넥션을 배정받은 뒤 처음 발생하는 httpcore trace 이벤트까지를 대기 시간으로 봅니다.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, stats: PoolStats):
+        self._transport = transport
+        self.stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        checked_out = False
+        upstream_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict):
+            nonlocal checked_out
+            if not checked_out:
+                checked_out = True
+                self.stats.observe_wait(time.perf_counter() - started)
+            if upstream_trace is not None:
+                await upstream_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        self.stats.requests += 1
+        self.stats.in_flight += 1
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            self.stats.in_flight -= 1
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
 class HttpClientHolder:
+    """
+    업스트림별 전용 클라이언트를 보관합니다.
+    전용 클라이언트가 없는 업스트림은 공용 클라이언트(client)를 사용합니다.
+    """
+
     client: httpx.AsyncClient = None
 
+    def __init__(self):
+        self.clients: Dict[str, httpx.AsyncClient] = {}
+        self.pool_stats: Dict[str, PoolStats] = {}
+
+    def get(self, upstream: Optional[str] = None) -> Optional[httpx.AsyncClient]:
+        return self.clients.get(upstream) or self.client
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: stats.snapshot() for name, stats in self.pool_stats.items()}
+
+    async def aclose(self):
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients.clear()
+        if self.client:
+            await self.client.aclose()
+
 
 http_holder = HttpClientHolder()
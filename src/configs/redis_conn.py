@@ -1,10 +1,24 @@
 import sys
 
 import redis
+import redis.asyncio
 from sshtunnel import SSHTunnelForwarder
 
-from configs.setting import REDIS_HOST, REDIS_PASSWORD, REDIS_PORT, SSH_ENABLED, SSH_HOST, SSH_USER, SSH_KEY_PATH
+from configs.setting import (
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+    REDIS_HOST,
+    REDIS_PASSWORD,
+    REDIS_POOL_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT_SECONDS,
+    REDIS_PORT,
+    REDIS_SOCKET_TIMEOUT_SECONDS,
+    SSH_ENABLED,
+    SSH_HOST,
+    SSH_KEY_PATH,
+    SSH_USER,
+)
 from src.utils.logger import logger
+from utils.redis_metrics import InstrumentedAsyncRedis
 
 # Redis SSH 터널 정의
 redis_tunnel = None
@@ -26,22 +40,47 @@ if SSH_ENABLED:
         logger.error(f"❌ Redis SSH 터널 생성 실패: {e}")
         sys.exit(1)
 
-# Redis 클라이언트 초기화
-redis_client = redis.StrictRedis(
-    host=REDIS_HOST,
-    port=actual_redis_port,
-    password=REDIS_PASSWORD,
-    decode_responses=True,  # 데이터를 문자열로 자동 디코딩
+
+def _build_pool(**connection_kwargs) -> redis.asyncio.BlockingConnectionPool:
+    """
+    비동기 Redis 커넥션 풀을 만듭니다. 풀이 가득 차면 커넥션을 새로 열지 않고 REDIS_POOL_TIMEOUT_SECONDS까지 기다립니다.
+    health_check_interval 이상 쉬던 커넥션만 꺼낼 때 PING으로 확인하므로 명령마다 PING을 보내지 않습니다.
+    """
+    return redis.asyncio.BlockingConnectionPool(
+        host=REDIS_HOST,
+        port=actual_redis_port,
+        password=REDIS_PASSWORD,
+        max_connections=REDIS_POOL_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT_SECONDS,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        socket_keepalive=True,
+        **connection_kwargs,
+    )
+
+
+# 세션(리프레시 토큰) 저장용 비동기 Redis 클라이언트 (명령 지연 시간은 /metrics로 노출됩니다)
+session_redis_client = InstrumentedAsyncRedis(
+    connection_pool=_build_pool(
+        decode_responses=True,  # 데이터를 문자열로 자동 디코딩
+        socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+    )
+)
+
+# 비동기 Redis 클라이언트 (이벤트 루프 내부에서 사용하는 응답 캐시 등)
+async_redis_client = InstrumentedAsyncRedis(
+    connection_pool=_build_pool(
+        socket_timeout=0.5,  # 캐시 계층이 요청 지연의 원인이 되지 않도록 짧게 설정
+    )
 )
 
 
-def check_redis_connection():
+async def check_redis_connection():
     try:
         # 터널이 살아있는지 먼저 확인 (디버깅용)
         if SSH_ENABLED and (not redis_tunnel or not redis_tunnel.is_active):
             raise ConnectionError("Redis SSH 터널이 활성화되어 있지 않습니다.")
 
-        redis_client.ping()
+        await session_redis_client.ping()
         logger.info("✅ Redis 서버와 성공적으로 연결되었습니다.")
     except redis.exceptions.ConnectionError as e:
         logger.error(
@@ -54,17 +93,7 @@ def check_redis_connection():
         sys.exit(1)  # 예상치 못한 오류 발생 시 애플리케이션 즉시 종료
 
 
-def get_redis_client():
-    try:
-        # 연결 테스트
-        redis_client.ping()
-        return redis_client
-    except redis.exceptions.ConnectionError as e:
-        logger.error(f"❌ Redis 클라이언트 요청 중 연결 오류 발생: {e}", exc_info=True)
-        raise ConnectionError("Redis 서버에 연결할 수 없습니다. 설정을 확인하거나 서버 상태를 점검하세요.") from e
-    except Exception as e:
-        logger.error(f"❌ Redis 클라이언트 요청 중 예상치 못한 오류 발생: {e}", exc_info=True)
-        raise RuntimeError("Redis 클라이언트 사용 중 예상치 못한 오류가 발생했습니다.") from e
-
-
-check_redis_connection()
+async def close_redis_clients():
+    # 클라이언트에 직접 넘긴 풀은 aclose()가 기본으로 닫지 않으므로 명시적으로 닫습니다.
+    await session_redis_client.aclose(close_connection_pool=True)
+    await async_redis_client.aclose(close_connection_pool=True)
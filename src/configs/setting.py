@@ -45,10 +45,29 @@ DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_NAME = os.getenv("DB_NAME")
 DB_PORT = int(os.getenv("DB_PORT"))
+# 비동기 커넥션 풀 크기와 커넥션을 기다리는 최대 시간(초)
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "20"))
+DB_POOL_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT_SECONDS", "5"))
+# 아이템 카탈로그 인메모리 인덱스 사용 여부와, 놓친 변경 알림을 확인하기 위해 공유 버전(Redis)을 다시 읽는 주기(초)
+ITEM_CATALOG_ENABLED = os.getenv("ITEM_CATALOG_ENABLED", "true").lower() == "true"
+ITEM_CATALOG_RESYNC_SECONDS = float(os.getenv("ITEM_CATALOG_RESYNC_SECONDS", "60"))
+# publish_item_changes() 없이 items를 직접 수정하는 환경에서만 켜는 DB 행 체크섬 확인 주기(초).
+# 워커마다 items 전체를 읽으므로 길게(예: 3600) 잡습니다. 설정하지 않으면 확인하지 않습니다.
+_checksum_seconds = os.getenv("ITEM_CATALOG_CHECKSUM_SECONDS")
+ITEM_CATALOG_CHECKSUM_SECONDS = float(_checksum_seconds) if _checksum_seconds else None
 
 # REDIS
 REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
 REDIS_PORT = int(os.getenv("REDIS_PORT"))
+# 비동기 Redis 커넥션 풀 크기, 커넥션을 기다리는 최대 시간(초), 명령 응답 대기 시간(초)
+REDIS_POOL_MAX_CONNECTIONS = int(os.getenv("REDIS_POOL_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT_SECONDS = float(os.getenv("REDIS_POOL_TIMEOUT_SECONDS", "1"))
+REDIS_SOCKET_TIMEOUT_SECONDS = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "2"))
+# 백그라운드 PING 주기(초). 이 시간 이상 쉬던 풀 커넥션도 꺼낼 때 한 번 확인합니다.
+REDIS_HEALTH_CHECK_INTERVAL_SECONDS = float(os.getenv("REDIS_HEALTH_CHECK_INTERVAL_SECONDS", "15"))
+# 같은 이벤트 루프 차례에 모인 Redis 명령을 파이프라인 하나로 보낼 때의 최대 명령 수
+REDIS_BATCH_MAX_COMMANDS = int(os.getenv("REDIS_BATCH_MAX_COMMANDS", "128"))
 
 # LLM
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -83,6 +102,46 @@ WEB_URL = f"http://{WEB_HOST}:{WEB_PORT}"
 # 인증 - JWT 인증 관련 설정
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
+# 운영 엔드포인트(/ops/*, /metrics) 접근 토큰 (Authorization: Bearer). 설정하지 않으면 모두 거절합니다.
+OPS_TOKEN = os.getenv("OPS_TOKEN")
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7  # 7일 동안 유효
 REFRESH_TOKEN_EXPIRE_SECONDS = REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60  # 7일 만료 (초단위)
+# 검증된 토큰 클레임 캐시의 최대 항목 수 (0이면 캐시하지 않음)
+CLAIMS_CACHE_MAX_ENTRIES = int(os.getenv("CLAIMS_CACHE_MAX_ENTRIES", "10000"))
+
+
+# 프록시 응답 캐시 (L1: 프로세스 내부 LRU, L2: Redis)
+PROXY_CACHE_MAX_BYTES = int(os.getenv("PROXY_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+PROXY_CACHE_REDIS_ENABLED = os.getenv("PROXY_CACHE_REDIS_ENABLED", "true").lower() == "true"
+
+# 패스스루 프록시 응답 중 응답 모델 검증을 수행할 표본 비율 (0.0 ~ 1.0)
+PASSTHROUGH_VALIDATION_SAMPLE_RATE = float(os.getenv("PASSTHROUGH_VALIDATION_SAMPLE_RATE", "0.01"))
+
+# SSE 스트리밍 중계
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+SSE_IDLE_TIMEOUT_SECONDS = float(os.getenv("SSE_IDLE_TIMEOUT_SECONDS", "120"))
+SSE_QUEUE_SIZE = int(os.getenv("SSE_QUEUE_SIZE", "16"))
+
+# 재시도 예산: 원 요청 대비 재시도/헤지 요청 비율 상한과 초당 최소 허용량
+RETRY_BUDGET_RATIO = float(os.getenv("RETRY_BUDGET_RATIO", "0.1"))
+RETRY_BUDGET_MIN_PER_SECOND = float(os.getenv("RETRY_BUDGET_MIN_PER_SECOND", "5"))
+
+# /batch 엔드포인트: 한 번에 받을 수 있는 하위 요청 수와 동시 실행 수
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "20"))
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "4"))
+
+# 응답 압축 (gzip/br/zstd): 이 크기(바이트) 미만의 응답은 압축하지 않습니다.
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+
+# 업스트림 인스턴스 DNS 조회 주기 (초)
+UPSTREAM_DNS_REFRESH_SECONDS = float(os.getenv("UPSTREAM_DNS_REFRESH_SECONDS", "30"))
+
+# 요청 마감 시간(deadline): 라우트 기본 예산(초), 관측 p99 대비 예산 배수, 적응형 예산의 하한(초)
+DEADLINE_DEFAULT_SECONDS = float(os.getenv("DEADLINE_DEFAULT_SECONDS", "60"))
+DEADLINE_P99_MULTIPLIER = float(os.getenv("DEADLINE_P99_MULTIPLIER", "2.0"))
+DEADLINE_MIN_SECONDS = float(os.getenv("DEADLINE_MIN_SECONDS", "1.0"))
+
+# Idempotency-Key: 완료된 응답을 재생하는 기간(초)과 처리 중 잠금의 최대 유지 시간(초, 가장 긴 라우트 예산보다 길게)
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", str(24 * 60 * 60)))
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "150"))
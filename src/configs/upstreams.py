@@ -0,0 +1,151 @@
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from configs.setting import (
+    GM_SERVICE_URL,
+    LLM_GATEWAY_URL,
+    RULE_ENGINE_URL,
+    SCENARIO_SERVICE_URL,
+    STATE_MANAGER_URL,
+)
+
+
+@dataclass(frozen=True)
+class UpstreamPolicy:
+    """업스트림별 보호 정책 (서킷 브레이커 + 적응형 동시성 제한)"""
+
+    failure_rate_threshold: float = 0.5  # 최근 호출 중 실패 비율이 이 값을 넘으면 차단
+    minimum_calls: int = 10  # 실패율을 판단하기 위한 최소 호출 수
+    window_size: int = 50  # 실패율 계산에 사용하는 최근 호출 수
+    open_seconds: float = 10.0  # 차단 후 반개방(half-open)까지 대기 시간
+    half_open_calls: int = 2  # 반개방 상태에서 허용하는 시험 호출 수
+    slow_call_seconds: float = 2.0  # 이보다 느린 응답은 혼잡 신호로 간주
+    initial_limit: int = 20
+    min_limit: int = 2
+    max_limit: int = 200
+
+
+# LLM을 거치는 업스트림은 정상 응답도 느리므로 혼잡 판단 기준을 완화합니다.
+_LLM_BOUND_POLICY = UpstreamPolicy(slow_call_seconds=30.0, initial_limit=10, max_limit=50)
+
+UPSTREAM_URLS: Dict[str, str] = {
+    "gm": GM_SERVICE_URL,
+    "state_manager": STATE_MANAGER_URL,
+    "scenario": SCENARIO_SERVICE_URL,
+    "rule_engine": RULE_ENGINE_URL,
+    "llm_gateway": LLM_GATEWAY_URL,
+}
+
+UPSTREAM_POLICIES: Dict[str, UpstreamPolicy] = {
+    "gm": _LLM_BOUND_POLICY,
+    "state_manager": UpstreamPolicy(),
+    "scenario": _LLM_BOUND_POLICY,
+    "rule_engine": UpstreamPolicy(slow_call_seconds=5.0),
+    "llm_gateway": _LLM_BOUND_POLICY,
+}
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """업스트림 전용 HTTP 커넥션 풀 설정"""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 3.0
+    read_timeout: Optional[float] = 60.0  # 전용 풀 도입 전 공용 클라이언트의 타임아웃과 같은 값
+    pool_timeout: float = 5.0  # 커넥션 체크아웃 대기 한도
+    http2: bool = False
+
+
+def _optional_float(value: Optional[str], default: Optional[float]) -> Optional[float]:
+    if value is None:
+        return default
+    # "none"이면 읽기 타임아웃 없이 기다립니다.
+    return None if value.lower() == "none" else float(value)
+
+
+def _pool_config(name: str, default: PoolConfig) -> PoolConfig:
+    """
+    환경 변수({NAME}_POOL_MAX_CONNECTIONS, {NAME}_POOL_READ_TIMEOUT, {NAME}_HTTP2 등)로 기본 풀 설정을 덮어씁니다.
+    """
+    prefix = name.upper()
+    return PoolConfig(
+        max_connections=int(os.getenv(f"{prefix}_POOL_MAX_CONNECTIONS", default.max_connections)),
+        max_keepalive_connections=int(os.getenv(f"{prefix}_POOL_MAX_KEEPALIVE", default.max_keepalive_connections)),
+        keepalive_expiry=float(os.getenv(f"{prefix}_POOL_KEEPALIVE_EXPIRY", default.keepalive_expiry)),
+        connect_timeout=float(os.getenv(f"{prefix}_POOL_CONNECT_TIMEOUT", default.connect_timeout)),
+        read_timeout=_optional_float(os.getenv(f"{prefix}_POOL_READ_TIMEOUT"), default.read_timeout),
+        pool_timeout=float(os.getenv(f"{prefix}_POOL_TIMEOUT", default.pool_timeout)),
+        http2=os.getenv(f"{prefix}_HTTP2", str(default.http2)).lower() == "true",
+    )
+
+
+# 빠른 조회성 업스트림과 LLM을 거치는 느린 업스트림이 서로의 커넥션을 점유하지 않도록 풀을 분리합니다.
+# 읽기 타임아웃은 기존 공용 클라이언트와 같은 60초를 유지합니다. ({NAME}_POOL_READ_TIMEOUT으로 조정)
+_FAST_POOL = PoolConfig(max_connections=100, max_keepalive_connections=50, read_timeout=60.0)
+_LLM_BOUND_POOL = PoolConfig(max_connections=50, max_keepalive_connections=20, read_timeout=120.0)
+
+UPSTREAM_POOLS: Dict[str, PoolConfig] = {
+    "gm": _pool_config("gm", _LLM_BOUND_POOL),
+    "state_manager": _pool_config("state_manager", _FAST_POOL),
+    "scenario": _pool_config("scenario", _LLM_BOUND_POOL),
+    "rule_engine": _pool_config("rule_engine", _FAST_POOL),
+    "llm_gateway": _pool_config("llm_gateway", _LLM_BOUND_POOL),
+}
+
+
+@dataclass(frozen=True)
+class DiscoveryConfig:
+    """
+    업스트림 인스턴스 목록과 클라이언트 측 부하 분산 설정.
+    - endpoints: 정적 인스턴스 목록 ({NAME}_ENDPOINTS, 쉼표 구분). 없으면 기존 단일 URL을 사용합니다.
+    - dns_host: 설정되면 ({NAME}_DNS_HOST) 주기적으로 A/AAAA 레코드를 조회해 인스턴스 목록을 갱신합니다.
+      스킴과 포트는 기존 서비스 URL의 값을 사용합니다.
+    """
+
+    endpoints: Tuple[str, ...]
+    dns_host: Optional[str] = None
+    strategy: str = "p2c"  # p2c(power-of-two-choices) 또는 least_outstanding
+    consecutive_failures: int = 5  # 연속 실패가 이 횟수에 도달하면 인스턴스를 일시 제외
+    base_ejection_seconds: float = 30.0  # 제외 시간 = 기본 시간 x 누적 제외 횟수 (최대 10배)
+    max_ejection_percent: int = 50  # 동시에 제외할 수 있는 인스턴스 비율 상한
+    hash_replicas: int = 100  # 일관 해시 링에서 인스턴스당 가상 노드 수
+    hash_load_factor: float = 1.25  # 일관 해시 시 인스턴스당 진행 중 요청 상한 = 평균 x 이 값
+
+    @property
+    def balanced(self) -> bool:
+        return len(self.endpoints) > 1 or self.dns_host is not None
+
+
+def _discovery_config(name: str, url: str) -> DiscoveryConfig:
+    prefix = name.upper()
+    static = tuple(u.strip().rstrip("/") for u in os.getenv(f"{prefix}_ENDPOINTS", "").split(",") if u.strip())
+    return DiscoveryConfig(
+        endpoints=static or (url.rstrip("/"),),
+        dns_host=os.getenv(f"{prefix}_DNS_HOST") or None,
+        strategy=os.getenv(f"{prefix}_LB_STRATEGY", "p2c"),
+    )
+
+
+UPSTREAM_DISCOVERY: Dict[str, DiscoveryConfig] = {
+    name: _discovery_config(name, url) for name, url in UPSTREAM_URLS.items()
+}
+
+_NAMES_BY_URL = {}
+for _name, _url in UPSTREAM_URLS.items():
+    _NAMES_BY_URL.setdefault(_url.rstrip("/"), _name)
+
+
+def upstream_name(base_url: str) -> str:
+    """base_url을 업스트림 이름으로 변환합니다. 등록되지 않은 URL은 호스트:포트를 이름으로 사용합니다."""
+    name = _NAMES_BY_URL.get(base_url.rstrip("/"))
+    if name:
+        return name
+    return urlsplit(base_url).netloc or base_url
+
+
+def upstream_policy(name: str) -> UpstreamPolicy:
+    return UPSTREAM_POLICIES.get(name, UpstreamPolicy())
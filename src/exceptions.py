@@ -35,6 +35,8 @@ def init_exception_handlers(app: FastAPI):
                 "message": "요청 처리 중 오류가 발생했습니다.",
                 "detail": exc.detail,
             },
+            # Retry-After, WWW-Authenticate 등 예외에 지정된 헤더를 그대로 전달
+            headers=exc.headers,
         )
 
     @app.exception_handler(RequestValidationError)
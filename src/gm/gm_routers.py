@@ -13,6 +13,7 @@ from gm.dtos.gm_dtos import (
     SummaryInput,
     UserInput,
 )
+from utils.load_balancer import session_affinity
 from utils.proxy_request import proxy_request
 
 gm_router = APIRouter(prefix="/gm", tags=["GM 서비스 중계"])
@@ -20,6 +21,8 @@ security = HTTPBearer()
 auth_dep = Depends(security)
 
 
+# GM 인스턴스는 세션별 컨텍스트(이력, LLM 프롬프트 캐시)를 유지하므로,
+# 같은 session_id의 요청은 일관 해시로 같은 인스턴스에 보냅니다.
 @cbv(gm_router)
 class GmRouter:
     base_prefix = "/game"
@@ -34,12 +37,13 @@ class GmRouter:
         session_id: str,
         auth: Annotated[HTTPAuthorizationCredentials, auth_dep],
     ):
-        return await proxy_request(
-            "GET",
-            GM_SERVICE_URL,
-            f"/api/v1{self.base_prefix}/history/{session_id}",
-            auth.credentials,
-        )
+        with session_affinity(session_id):
+            return await proxy_request(
+                "GET",
+                GM_SERVICE_URL,
+                f"/api/v1{self.base_prefix}/history/{session_id}",
+                auth.credentials,
+            )
 
     @gm_router.post(
         "/turn",
@@ -51,13 +55,14 @@ class GmRouter:
         request: UserInput,
         auth: Annotated[HTTPAuthorizationCredentials, auth_dep],
     ):
-        return await proxy_request(
-            "POST",
-            GM_SERVICE_URL,
-            f"/api/v1{self.base_prefix}/turn",
-            auth.credentials,
-            json=request.model_dump(),
-        )
+        with session_affinity(request.session_id):
+            return await proxy_request(
+                "POST",
+                GM_SERVICE_URL,
+                f"/api/v1{self.base_prefix}/turn",
+                auth.credentials,
+                json=request.model_dump(),
+            )
 
     @gm_router.post(
         "/npc-turn",
@@ -69,13 +74,14 @@ class GmRouter:
         request: NpcTurnInput,
         auth: Annotated[HTTPAuthorizationCredentials, auth_dep],
     ):
-        return await proxy_request(
-            "POST",
-            GM_SERVICE_URL,
-            f"/api/v1{self.base_prefix}/npc-turn",
-            auth.credentials,
-            json=request.model_dump(),
-        )
+        with session_affinity(request.session_id):
+            return await proxy_request(
+                "POST",
+                GM_SERVICE_URL,
+                f"/api/v1{self.base_prefix}/npc-turn",
+                auth.credentials,
+                json=request.model_dump(),
+            )
 
     @gm_router.post(
         "/summary",
@@ -87,10 +93,11 @@ class GmRouter:
         request: SummaryInput,
         auth: Annotated[HTTPAuthorizationCredentials, auth_dep],
     ):
-        return await proxy_request(
-            "POST",
-            GM_SERVICE_URL,
-            f"/api/v1{self.base_prefix}/summary",
-            auth.credentials,
-            json=request.model_dump(),
-        )
+        with session_affinity(request.session_id):
+            return await proxy_request(
+                "POST",
+                GM_SERVICE_URL,
+                f"/api/v1{self.base_prefix}/summary",
+                auth.credentials,
+                json=request.model_dump(),
+            )
@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Query
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi.security import HTTPAuthorizationCredentials
 from fastapi_utils.cbv import cbv
 
 from common.dtos.wrapped_response import WrappedResponse
@@ -11,10 +11,22 @@ from info.dtos.item_dtos import ItemRequest, PaginatedItemResponse
 from info.dtos.npc_dtos import NpcDetailResponse, NpcRequest, PaginatedNpcResponse
 from info.dtos.personality_dtos import PaginatedPersonalityResponse, PersonalityRequest
 from info.dtos.world_dtos import WorldInfoKey, WorldResponse
+from utils.claims import bearer_scheme, get_claims
 from utils.proxy_request import proxy_request
+from utils.response_cache import CachePolicy
+from utils.retry_policy import RetryPolicy
 
 info_router = APIRouter(prefix="/info", tags=["게임 정보 중계"])
-security = HTTPBearer()
+security = bearer_scheme
+# 전역 캐시 응답은 업스트림이 토큰을 보지 않은 채 반환되므로, 캐시 라우트는 토큰을 로컬에서 먼저 검증합니다.
+verified = [Depends(get_claims)]
+
+# 적/NPC/월드 정보는 게임 참조 데이터이므로 전역 캐시를 사용합니다.
+# 캐시된 본문을 재직렬화 없이(압축 본문은 그대로) 전달하도록 패스스루로 응답합니다.
+reference_cache = CachePolicy(ttl=300, stale_ttl=600)
+reference_retry = RetryPolicy()
+# 목록 조회 POST는 본문으로 필터를 전달할 뿐 상태를 바꾸지 않으므로 재시도해도 안전합니다.
+lookup_retry = RetryPolicy(idempotent=True)
 
 
 @cbv(info_router)
@@ -25,38 +37,73 @@ class InfoHandler:
     @info_router.post("/items", response_model=WrappedResponse[PaginatedItemResponse], summary="아이템 조회")
     async def read_items(self, request_data: ItemRequest, auth: HTTPAuthorizationCredentials = Depends(security)):
         return await proxy_request(
-            "POST", RULE_ENGINE_URL, f"{self.base_prefix}/items", auth.credentials, json=request_data.model_dump()
+            "POST",
+            RULE_ENGINE_URL,
+            f"{self.base_prefix}/items",
+            auth.credentials,
+            json=request_data.model_dump(),
+            retry=lookup_retry,
         )
 
     # --- 2. 적 정보 조회 (목록) ---
     @info_router.post("/enemies", response_model=WrappedResponse[PaginatedEnemyResponse], summary="적 정보 조회(목록)")
     async def read_enemies(self, request_data: EnemyRequest, auth: HTTPAuthorizationCredentials = Depends(security)):
         return await proxy_request(
-            "POST", RULE_ENGINE_URL, f"{self.base_prefix}/enemies", auth.credentials, json=request_data.model_dump()
+            "POST",
+            RULE_ENGINE_URL,
+            f"{self.base_prefix}/enemies",
+            auth.credentials,
+            json=request_data.model_dump(),
+            retry=lookup_retry,
         )
 
     @info_router.get(
         "/enemies/{enemy_id}",
         response_model=WrappedResponse[EnemyDetailResponse],
         summary="적 정보 상세 조회 - 드롭 아이템 목록 포함",
+        dependencies=verified,
     )
     async def read_enemy_detail(self, enemy_id: int, auth: HTTPAuthorizationCredentials = Depends(security)):
-        return await proxy_request("GET", RULE_ENGINE_URL, f"{self.base_prefix}/enemies/{enemy_id}", auth.credentials)
+        return await proxy_request(
+            "GET",
+            RULE_ENGINE_URL,
+            f"{self.base_prefix}/enemies/{enemy_id}",
+            auth.credentials,
+            cache=reference_cache,
+            passthrough=True,
+            response_model=WrappedResponse[EnemyDetailResponse],
+            retry=reference_retry,
+        )
 
     # --- 3. NPC 정보 조회 (목록) ---
     @info_router.post("/npcs", response_model=WrappedResponse[PaginatedNpcResponse], summary="NPC 정보 조회 (목록)")
     async def read_npcs(self, request_data: NpcRequest, auth: HTTPAuthorizationCredentials = Depends(security)):
         return await proxy_request(
-            "POST", RULE_ENGINE_URL, f"{self.base_prefix}/npcs", auth.credentials, json=request_data.model_dump()
+            "POST",
+            RULE_ENGINE_URL,
+            f"{self.base_prefix}/npcs",
+            auth.credentials,
+            json=request_data.model_dump(),
+            retry=lookup_retry,
         )
 
     @info_router.get(
         "/npc/{npc_id}",
         response_model=WrappedResponse[NpcDetailResponse],
         summary="NPC 정보 상세 조회 - 거래 아이템 목록 포함",
+        dependencies=verified,
     )
     async def get_npc_detail(self, npc_id: int, auth: HTTPAuthorizationCredentials = Depends(security)):
-        return await proxy_request("GET", RULE_ENGINE_URL, f"{self.base_prefix}/npc/{npc_id}", auth.credentials)
+        return await proxy_request(
+            "GET",
+            RULE_ENGINE_URL,
+            f"{self.base_prefix}/npc/{npc_id}",
+            auth.credentials,
+            cache=reference_cache,
+            passthrough=True,
+            response_model=WrappedResponse[NpcDetailResponse],
+            retry=reference_retry,
+        )
 
     # --- 4. 성격 정보 조회 ---
     @info_router.post(
@@ -73,11 +120,15 @@ class InfoHandler:
             f"{self.base_prefix}/personalities",
             auth.credentials,
             json=request_data.model_dump(),
+            retry=lookup_retry,
         )
 
     # --- 5. 월드 정보 조회 (GET Query Params) ---
     @info_router.get(
-        "/world", response_model=WrappedResponse[WorldResponse], summary="월드 정보 조회 (GET Query Params)"
+        "/world",
+        response_model=WrappedResponse[WorldResponse],
+        summary="월드 정보 조회 (GET Query Params)",
+        dependencies=verified,
     )
     async def read_world(
         self,
@@ -85,4 +136,14 @@ class InfoHandler:
         auth: HTTPAuthorizationCredentials = Depends(security),
     ):
         params = [("include_keys", k.value) for k in include_keys] if include_keys else None
-        return await proxy_request("GET", RULE_ENGINE_URL, f"{self.base_prefix}/world", auth.credentials, params=params)
+        return await proxy_request(
+            "GET",
+            RULE_ENGINE_URL,
+            f"{self.base_prefix}/world",
+            auth.credentials,
+            params=params,
+            cache=reference_cache,
+            passthrough=True,
+            response_model=WrappedResponse[WorldResponse],
+            retry=reference_retry,
+        )
@@ -0,0 +1,264 @@
+import asyncio
+import json
+import time
+from array import array
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from configs.setting import ITEM_CATALOG_CHECKSUM_SECONDS, ITEM_CATALOG_RESYNC_SECONDS
+from utils.logger import info, warning
+from utils.sql_registry import sql_registry
+
+# 아이템 변경 알림 채널과 변경마다 1씩 증가하는 공유 버전 키
+ITEM_CATALOG_CHANNEL = "item_catalog:changes"
+ITEM_CATALOG_VERSION_KEY = "item_catalog:version"
+
+
+async def publish_item_changes(redis, item_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    아이템을 변경한 쪽에서 호출해 모든 워커의 카탈로그를 갱신시킵니다.
+    공유 버전을 올린 뒤 변경된 item_id 목록과 함께 알립니다. item_ids가 없으면 전체 재적재를 요청합니다.
+    """
+    version = await redis.incr(ITEM_CATALOG_VERSION_KEY)
+    payload = {"version": version, "item_ids": sorted(set(item_ids)) if item_ids else None}
+    await redis.publish(ITEM_CATALOG_CHANNEL, json.dumps(payload))
+    return version
+
+
+class ItemCatalog:
+    """
+    정적 참조 데이터인 items 테이블을 프로세스 메모리에 올려 두는 인덱스.
+    행은 컬럼 이름을 공유하는 튜플로 item_id에 대해 보관하고, 정렬된 item_id 배열을 미리 만들어 두어
+    item_ids 필터링과 OFFSET/키셋 페이지 계산을 DB 왕복 없이 처리합니다.
+
+    변경은 Redis 공유 버전과 pub/sub 알림으로 전파됩니다. 바로 다음 버전의 알림이면 변경된 행만 다시 읽고,
+    버전이 건너뛰었거나(알림 유실) 대상 id가 없으면 전체를 다시 적재합니다.
+    pub/sub은 전달을 보장하지 않으므로 resync_seconds마다 공유 버전을 직접 읽어 뒤처진 워커를 따라잡게 합니다.
+    publish_item_changes()를 호출하지 않는 쓰기(관리 도구, 마이그레이션 등)가 있는 환경에서는 checksum_seconds를 설정해
+    그 주기마다 DB의 행 체크섬과 비교합니다. items 전체를 읽는 작업이므로 기본으로는 꺼져 있습니다.
+    """
+
+    def __init__(
+        self,
+        resync_seconds: float = ITEM_CATALOG_RESYNC_SECONDS,
+        checksum_seconds: Optional[float] = ITEM_CATALOG_CHECKSUM_SECONDS,
+    ):
+        self.resync_seconds = resync_seconds
+        self.checksum_seconds = checksum_seconds
+        self.version = 0
+        self.loaded_at: Optional[float] = None
+        self.full_reloads = 0
+        self.partial_reloads = 0
+        self.reload_errors = 0
+        self._columns: Tuple[str, ...] = ()
+        self._rows: Dict[int, tuple] = {}
+        self._order = array("q")
+        # item_id별 DB 행 체크섬 (checksum_seconds 설정 시). 알림으로 반영한 행은 다음 확인 때 한 번 다시 읽습니다.
+        self._checksums: Dict[int, str] = {}
+        self._checksummed_at = 0.0
+        self._resynced_at = 0.0
+        self._cursor_factory: Optional[Callable] = None
+        self._redis = None
+        self._listener: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    # 조회
+
+    def _select(self, item_ids: Optional[Sequence[int]]) -> Sequence[int]:
+        if not item_ids:
+            return self._order
+        return sorted({item_id for item_id in item_ids if item_id in self._rows})
+
+    def _materialize(self, item_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        # 호출자가 결과를 수정해도 인덱스가 바뀌지 않도록 매번 새 dict를 만듭니다.
+        return [dict(zip(self._columns, self._rows[item_id], strict=True)) for item_id in item_ids]
+
+    def page(self, item_ids: Optional[Sequence[int]], skip: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """OFFSET 페이지와 필터 전체 개수를 반환합니다. (get_items.sql + count_items.sql과 같은 결과)"""
+        selected = self._select(item_ids)
+        return self._materialize(selected[skip : skip + limit]), len(selected)
+
+    def after(self, item_ids: Optional[Sequence[int]], after_id: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """after_id 다음 키셋 페이지와 필터 전체 개수를 반환합니다. (get_items_keyset.sql과 같은 결과)"""
+        selected = self._select(item_ids)
+        start = bisect_right(selected, after_id)
+        return self._materialize(selected[start : start + limit]), len(selected)
+
+    # 적재
+
+    def _replace(self, rows: List[Dict[str, Any]], version: int):
+        if rows:
+            self._columns = tuple(rows[0].keys())
+        self._rows = {row["item_id"]: tuple(row.values()) for row in rows}
+        self._order = array("q", sorted(self._rows))
+        self.version = version
+        self.loaded_at = time.time()
+
+    def _merge(self, item_ids: Iterable[int], rows: List[Dict[str, Any]], version: int):
+        merged = dict(self._rows)
+        for item_id in item_ids:
+            merged.pop(item_id, None)
+            self._checksums.pop(item_id, None)
+        for row in rows:
+            if not self._columns:
+                self._columns = tuple(row.keys())
+            merged[row["item_id"]] = tuple(row.values())
+        # 조회 중인 요청이 중간 상태를 보지 않도록 await 없이 한 번에 교체합니다.
+        self._rows = merged
+        self._order = array("q", sorted(merged))
+        self.version = version
+        self.loaded_at = time.time()
+
+    async def _fetch(self, query_name: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        async with self._cursor_factory() as cursor:
+            async with cursor:
+                await cursor.execute(sql_registry.get("info", query_name), params)
+                return await cursor.fetchall()
+
+    async def _shared_version(self) -> Optional[int]:
+        if self._redis is None:
+            return None
+        try:
+            value = await self._redis.get(ITEM_CATALOG_VERSION_KEY)
+        except Exception as e:
+            warning(f"⚠️ 아이템 카탈로그 공유 버전 조회 실패: {e}")
+            return None
+        return int(value or 0)
+
+    async def _fetch_checksums(self) -> Dict[int, str]:
+        return {row["item_id"]: row["checksum"] for row in await self._fetch("get_item_checksums")}
+
+    async def reload(self, version: Optional[int] = None):
+        """
+        전체 카탈로그를 다시 적재합니다. 적재 중 들어온 변경은 다음 버전 알림이나 재동기화로 다시 반영됩니다.
+        체크섬을 행보다 먼저 읽으므로, 그 사이 바뀐 행은 다음 체크섬 확인에서 값이 달라 다시 읽힙니다.
+        """
+        if version is None:
+            version = await self._shared_version()
+        checksums = await self._fetch_checksums() if self.checksum_seconds is not None else {}
+        rows = await self._fetch("get_all_items")
+        self._replace(rows, self.version if version is None else version)
+        self._checksums = checksums
+        self._checksummed_at = time.monotonic()
+        self.full_reloads += 1
+        info(f"📦 아이템 카탈로그를 적재했습니다. (items={len(self)}, version={self.version})")
+
+    async def apply_change(self, message: Dict[str, Any]):
+        """pub/sub 알림 하나를 반영합니다. 이미 반영한 버전은 무시합니다."""
+        version = int(message["version"])
+        item_ids = message.get("item_ids")
+        async with self._lock:
+            if version <= self.version:
+                return
+            if item_ids and version == self.version + 1:
+                rows = await self._fetch("get_items_by_ids", {"item_ids": list(item_ids)})
+                if not rows or not self._columns or tuple(rows[0].keys()) == self._columns:
+                    self._merge(item_ids, rows, version)
+                    self.partial_reloads += 1
+                    return
+                # 컬럼 구성이 바뀌었으면(스키마 변경) 기존 행과 섞지 않고 전체를 다시 적재합니다.
+                await self.reload(version)
+            else:
+                await self.reload(version)
+
+    async def resync(self):
+        """
+        공유 버전과 다르면(알림 유실, Redis 초기화) 전체를 다시 적재합니다.
+        기동 시 적재에 실패한 카탈로그도 여기서 다시 적재를 시도합니다.
+        checksum_seconds가 설정되어 있으면 그 주기마다 DB의 행 체크섬과 비교해 알림 없이 바뀐 행만 다시 읽습니다.
+        """
+        self._resynced_at = time.monotonic()
+        shared = await self._shared_version()
+        async with self._lock:
+            if not self.loaded or (shared is not None and shared != self.version):
+                warning(f"⚠️ 아이템 카탈로그 버전이 달라 전체를 다시 적재합니다. ({self.version} -> {shared})")
+                await self.reload(shared)
+                return
+
+            if self.checksum_seconds is None or time.monotonic() - self._checksummed_at < self.checksum_seconds:
+                return
+            checksums = await self._fetch_checksums()
+            self._checksummed_at = time.monotonic()
+            changed = [
+                item_id
+                for item_id in checksums.keys() | self._checksums.keys() | self._rows.keys()
+                if checksums.get(item_id) != self._checksums.get(item_id)
+            ]
+            if not changed:
+                return
+            rows = await self._fetch("get_items_by_ids", {"item_ids": sorted(changed)})
+            if rows and self._columns and tuple(rows[0].keys()) != self._columns:
+                await self.reload(shared)
+                return
+            self._merge(changed, rows, self.version)
+            self._checksums = checksums
+            self.partial_reloads += 1
+            warning(f"⚠️ 변경 알림 없이 바뀐 아이템 {len(changed)}개를 DB에서 다시 읽었습니다.")
+
+    async def _listen(self):
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(ITEM_CATALOG_CHANNEL)
+                    # 구독 전에 발생한 변경을 놓치지 않도록 구독 직후 한 번 확인합니다.
+                    await self.resync()
+                    while True:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=self.resync_seconds)
+                        if message is not None:
+                            await self.apply_change(json.loads(message["data"]))
+                        # 알림이 계속 들어와도 주기적인 재동기화가 밀리지 않게 마지막 확인 시각으로 판단합니다.
+                        if time.monotonic() - self._resynced_at >= self.resync_seconds:
+                            await self.resync()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.reload_errors += 1
+                warning(f"⚠️ 아이템 카탈로그 변경 구독 오류, 재연결합니다: {e}")
+                await asyncio.sleep(min(self.resync_seconds, 5.0))
+
+    async def start(self, cursor_factory: Callable, redis=None):
+        """
+        카탈로그를 적재하고 변경 알림 구독을 시작합니다.
+        적재에 실패해도 서버는 기동되며, 그동안 ItemService는 SQL 경로로 조회합니다.
+        """
+        self._cursor_factory = cursor_factory
+        self._redis = redis
+        try:
+            await self.reload()
+        except Exception as e:
+            self.reload_errors += 1
+            warning(f"⚠️ 아이템 카탈로그 적재 실패, DB 조회로 대체합니다: {e}")
+        if redis is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self):
+        if self._listener is None:
+            return
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "items": len(self),
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "full_reloads": self.full_reloads,
+            "partial_reloads": self.partial_reloads,
+            "reload_errors": self.reload_errors,
+            "subscribed": self._listener is not None and not self._listener.done(),
+        }
+
+
+item_catalog = ItemCatalog()
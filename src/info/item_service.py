@@ -1,34 +1,93 @@
 from typing import List, Optional
 
-from common.dtos.pagination_meta import PaginationMeta
-from utils.load_sql import load_sql
+from common.dtos.pagination_meta import KeysetPaginationMeta, PaginationMeta
+from common.utils.page_cursor import PageCursor, decode_page_cursor, encode_page_cursor
+from info.item_catalog import ItemCatalog, item_catalog
+from utils.sql_registry import sql_registry
 
 
 class ItemService:
-    def __init__(self, cursor):
+    """
+    아이템 목록 조회 서비스.
+    인메모리 카탈로그가 적재되어 있으면 필터링과 페이지 계산을 메모리에서 처리하고,
+    적재 전이거나 비활성화된 경우에만 SQL로 조회합니다.
+    """
+
+    def __init__(self, cursor, catalog: ItemCatalog = item_catalog):
         self.cursor = cursor
-        self.get_items_sql = load_sql("info", "get_items")
-        self.count_items_sql = load_sql("info", "count_items")
+        self.catalog = catalog
+        self.get_items_sql = sql_registry.get("info", "get_items")
+        self.count_items_sql = sql_registry.get("info", "count_items")
+        self.get_items_keyset_sql = sql_registry.get("info", "get_items_keyset")
 
     async def get_items(self, item_ids: Optional[List[int]], skip: int, limit: int):
+        if self.catalog.loaded:
+            items, total_count = self.catalog.page(item_ids, skip, limit)
+            return items, self._offset_meta(total_count, skip, limit)
+
         params = {"item_ids": item_ids if item_ids else None, "limit": limit, "skip": skip}
 
-        # 전체 개수 조회
-        self.cursor.execute(self.count_items_sql, params)
-        count_result = self.cursor.fetchone()
-        # RealDictCursor를 사용하므로 키값으로 접근 (count, COUNT(*), 혹은 별칭)
-        total_count = count_result["count"] if count_result else 0
+        async with self.cursor:
+            # 전체 개수 조회
+            await self.cursor.execute(self.count_items_sql, params)
+            count_result = await self.cursor.fetchone()
+            # dict_row 커서를 사용하므로 키값으로 접근 (count, COUNT(*), 혹은 별칭)
+            total_count = count_result["count"] if count_result else 0
+
+            # 데이터 목록 조회
+            await self.cursor.execute(self.get_items_sql, params)
+            items = await self.cursor.fetchall()
 
-        # 데이터 목록 조회
-        self.cursor.execute(self.get_items_sql, params)
-        items = self.cursor.fetchall()
+        return items, self._offset_meta(total_count, skip, limit)
 
+    @staticmethod
+    def _offset_meta(total_count: int, skip: int, limit: int) -> PaginationMeta:
         # 페이지네이션 메타데이터 계산
         total_pages = (total_count + limit - 1) // limit if total_count > 0 else 0
         is_last_page = (skip + limit) >= total_count
 
-        meta = PaginationMeta(
+        return PaginationMeta(
             total_count=total_count, skip=skip, limit=limit, is_last_page=is_last_page, total_pages=total_pages
         )
 
+    async def get_items_after(self, item_ids: Optional[List[int]], cursor: Optional[str], limit: int):
+        """
+        item_id 키셋(커서) 페이지네이션으로 아이템을 조회합니다.
+        OFFSET 없이 인덱스에서 바로 다음 페이지를 읽고, 전체 개수도 같은 쿼리에서 받아 한 번에 왕복합니다.
+        """
+        # item_id는 1부터 시작하므로 첫 페이지는 after_id=0에서 시작합니다.
+        position = decode_page_cursor(cursor) if cursor else PageCursor()
+        if self.catalog.loaded:
+            items, total_count = self.catalog.after(item_ids, position.after_id, limit)
+        else:
+            items, total_count = await self._fetch_keyset_page(item_ids, position.after_id, limit)
+
+        skip = position.skip
+        total_pages = (total_count + limit - 1) // limit if total_count > 0 else 0
+        is_last_page = len(items) < limit or (skip + len(items)) >= total_count
+        next_cursor = None
+        if not is_last_page:
+            next_cursor = encode_page_cursor(PageCursor(after_id=items[-1]["item_id"], skip=skip + len(items)))
+
+        meta = KeysetPaginationMeta(
+            total_count=total_count,
+            skip=skip,
+            limit=limit,
+            is_last_page=is_last_page,
+            total_pages=total_pages,
+            next_cursor=next_cursor,
+        )
+
         return items, meta
+
+    async def _fetch_keyset_page(self, item_ids: Optional[List[int]], after_id: int, limit: int):
+        params = {"item_ids": item_ids if item_ids else None, "after_id": after_id, "limit": limit}
+
+        async with self.cursor:
+            await self.cursor.execute(self.get_items_keyset_sql, params)
+            rows = await self.cursor.fetchall()
+
+        # 빈 페이지에서는 아이템 컬럼이 NULL인 개수 행 하나만 반환됩니다.
+        total_count = rows[0]["total_count"] if rows else 0
+        items = [{k: v for k, v in row.items() if k != "total_count"} for row in rows if row["item_id"] is not None]
+        return items, total_count
@@ -0,0 +1,4 @@
+-- name: get_all_items
+-- 아이템 카탈로그 전체 적재 (인메모리 인덱스 구성용)
+SELECT * FROM items
+ORDER BY item_id ASC;
@@ -0,0 +1,5 @@
+-- name: get_item_checksums
+-- 아이템별 행 체크섬 (변경 알림 없이 DB에서 직접 바뀐 행을 카탈로그 재동기화 때 찾아냅니다)
+SELECT item_id, md5(items::text) AS checksum
+FROM items
+ORDER BY item_id ASC;
@@ -0,0 +1,5 @@
+-- name: get_items_by_ids
+-- 변경된 아이템만 다시 읽어 인메모리 카탈로그에 반영 (결과에 없는 id는 삭제된 아이템)
+SELECT * FROM items
+WHERE item_id = ANY(%(item_ids)s)
+ORDER BY item_id ASC;
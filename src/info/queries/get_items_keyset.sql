@@ -0,0 +1,18 @@
+-- name: get_items_keyset
+-- 키셋 페이지네이션: after_id 다음 아이템 목록과 필터 전체 개수를 한 번에 조회
+-- 개수 행에 목록을 LEFT JOIN 하므로 빈 페이지에서도 전체 개수 행 하나가 반환됩니다. (아이템 컬럼은 NULL)
+SELECT page.*, total.total_count
+FROM (
+    SELECT COUNT(*) AS total_count
+    FROM items
+    WHERE (%(item_ids)s IS NULL OR item_id = ANY(%(item_ids)s))
+) AS total
+LEFT JOIN LATERAL (
+    SELECT *
+    FROM items
+    WHERE (%(item_ids)s IS NULL OR item_id = ANY(%(item_ids)s))
+      AND item_id > %(after_id)s
+    ORDER BY item_id ASC
+    LIMIT %(limit)s
+) AS page ON TRUE
+ORDER BY page.item_id ASC;
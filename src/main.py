@@ -9,11 +9,11 @@ except ImportError:
 
 from configs.redis_conn_rule import redis_rule_tunnel
 from configs.database import check_db_connection, rdb_tunnel
-from configs.redis_conn import check_redis_connection, redis_tunnel
+from configs.redis_conn import redis_tunnel
 from contextlib import asynccontextmanager
 from typing import Dict
 
-from fastapi import FastAPI, HTTPException, Request, status
+from fastapi import FastAPI, HTTPException, status
 from starlette.middleware.cors import CORSMiddleware
 
 from exceptions import init_exception_handlers
@@ -23,13 +23,20 @@ from src.configs.logging_config import LOGGING_CONFIG
 from src.configs.origins import origins
 from src.configs.setting import APP_ENV, APP_HOST, APP_PORT, REMOTE_HOST
 from utils.lifespan_handlers import shutdown_event_handler, startup_event_handler
+from utils.bulkhead_middleware import BulkheadMiddleware
+from utils.compression_middleware import CompressionMiddleware
+from utils.deadline_middleware import DeadlineMiddleware
+from utils.etag_middleware import ConditionalGetMiddleware
+from utils.idempotency_middleware import IdempotencyMiddleware
 from utils.logger import info
+from utils.metrics_middleware import MetricsMiddleware
+from utils.redis_health import redis_health
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 서버가 시작될 때 실행
-    startup_event_handler()
+    await startup_event_handler()
     yield  # 서버가 동작하는 지점
     # 서버가 종료될 때 실행
     await shutdown_event_handler()
@@ -61,24 +68,40 @@ app = FastAPI(
 )
 
 
-@app.middleware("http")
-async def error_logging_middleware(request: Request, call_next):
-    # 이제 에러 로그는 핸들러가 담당하므로 미들웨어는 통과만 시킵니다.
-    response = await call_next(request)
-    return response
-
-
 # 커스덤 에러 핸들러 초기화
 init_exception_handlers(app)
 
+# LLM/스트림 라우트 격리 (벌크헤드별 동시 처리 수 + 우선순위 대기열).
+# 대기 시간도 마감 시간에 포함되도록 마감 시간 미들웨어보다 안쪽에 둡니다.
+app.add_middleware(BulkheadMiddleware)
+
+# Idempotency-Key 중복 요청 방지 (처리 중이면 원 요청 결과 대기, 완료되었으면 저장된 응답 재생).
+# 중복 요청이 벌크헤드 슬롯을 차지하지 않도록 벌크헤드보다 바깥에, 대기 시간이 마감 시간에 포함되도록 그 안쪽에 둡니다.
+app.add_middleware(IdempotencyMiddleware)
+
+# 요청 마감 시간 (라우트 예산/클라이언트 헤더 → 업스트림 전달, 초과 시 작업 취소 후 504).
+# 504 응답에도 CORS 헤더가 붙도록 CORS보다 안쪽에 둡니다.
+app.add_middleware(DeadlineMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,  # 허용할 출처(CORS) 목록
     allow_credentials=True,  # 쿠키 등 자격 증명 허용 여부
     allow_methods=["*"],  # 모든 HTTP 메서드 허용 (GET, POST 등)
     allow_headers=["*"],  # 모든 HTTP 헤더 허용
+    # 브라우저 클라이언트가 재시도/대기 힌트를 읽을 수 있도록 노출
+    expose_headers=["Retry-After", "X-Queue-Position", "X-Queue-Wait-Ms", "Idempotent-Replayed"],
 )
 
+# 조건부 GET (ETag / If-None-Match → 304). 압축 전 원본 바이트로 ETag를 계산하도록 압축보다 안쪽에 둡니다.
+app.add_middleware(ConditionalGetMiddleware)
+
+# 응답 압축 (zstd/br/gzip 협상, 스트리밍 응답은 청크 단위 압축)
+app.add_middleware(CompressionMiddleware)
+
+# 라우트별 요청 수/지연 시간 지표 (/metrics). 가장 바깥에서 전체 처리 시간을 측정합니다.
+app.add_middleware(MetricsMiddleware)
+
 for router in API_ROUTERS:
     app.include_router(router)
 
@@ -90,11 +113,13 @@ def read_root():
 
 # health check
 @app.get("/health")
-def health_check() -> Dict[str, str]:
+async def health_check() -> Dict[str, str]:
     health_status = {"status": "ok", "db": "connected", "redis": "connected"}
     try:
-        check_db_connection()
-        check_redis_connection()
+        await check_db_connection()
+        # Redis는 요청마다 PING하지 않고 백그라운드 상태 확인 결과를 사용합니다.
+        if not redis_health.healthy:
+            raise ConnectionError(f"Redis 상태 확인 실패: {redis_health.last_error}")
         return health_status
     except Exception as e:
         # 하나라도 실패하면 503 에러 반환
@@ -1,17 +1,19 @@
-from fastapi import APIRouter, Depends
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import APIRouter, Depends, Request
+from fastapi.security import HTTPAuthorizationCredentials
 from fastapi_utils.cbv import cbv
-from jose import jwt
 from starlette.responses import StreamingResponse
 
-from configs.setting import ALGORITHM, RULE_ENGINE_URL, SECRET_KEY
+from configs.setting import RULE_ENGINE_URL
 from minigame.dtos.minigame_dtos import AnswerRequest
 from minigame.minigame_service import get_game_tip_sentence
+from utils.claims import TokenClaims, bearer_scheme, get_claims
 from utils.proxy_request import proxy_request
 from utils.proxy_stream import proxy_stream
 
 minigame_router = APIRouter(prefix="/minigame", tags=["미니게임"])
-auth_scheme = HTTPBearer()
+auth_scheme = bearer_scheme
+# 프록시/브라우저가 SSE 이벤트를 버퍼링하지 않도록 지정합니다.
+sse_headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
 
 
 @cbv(minigame_router)
@@ -32,52 +34,51 @@ class MinigameRouter:
     )
     async def proxy_riddle(
         self,
+        request: Request,
         token_auth: HTTPAuthorizationCredentials = Depends(auth_scheme),
+        claims: TokenClaims = Depends(get_claims),
     ):
-        # 1. 토큰에서 user_id 추출 (이미 구현된 토큰 디코딩 함수가 있다고 가정)
+        # 1. 검증된 토큰 클레임에서 user_id 추출
         token = token_auth.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 
         # 2. rule-engine 마이크로서비스 엔드포인트 호출
-        user_id: str = payload.get("sub")
-        path = f"{self.base_prefix}/riddle/{user_id}"
+        path = f"{self.base_prefix}/riddle/{claims.user_id}"
 
-        # 3. 스트리밍 중계 실행
-        generator = await proxy_stream(RULE_ENGINE_URL, path, token)
+        # 3. 스트리밍 중계 실행 (클라이언트 연결 종료 시 업스트림 스트림도 함께 종료)
+        generator = await proxy_stream(RULE_ENGINE_URL, path, token, request=request)
 
-        return StreamingResponse(generator, media_type="text/event-stream")
+        return StreamingResponse(generator, media_type="text/event-stream", headers=sse_headers)
 
     @minigame_router.get("/quiz", summary="GM과 동굴 탐험대 퀴즈 미니게임을 진행합니다.")
     async def proxy_quiz(
         self,
+        request: Request,
         token_auth: HTTPAuthorizationCredentials = Depends(auth_scheme),
+        claims: TokenClaims = Depends(get_claims),
     ):
-        # 1. 토큰에서 user_id 추출 (이미 구현된 토큰 디코딩 함수가 있다고 가정)
+        # 1. 검증된 토큰 클레임에서 user_id 추출
         token = token_auth.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 
         # 2. rule-engine 마이크로서비스 엔드포인트 호출
-        user_id: str = payload.get("sub")
-        path = f"{self.base_prefix}/quiz/{user_id}"
+        path = f"{self.base_prefix}/quiz/{claims.user_id}"
 
-        # 3. 스트리밍 중계 실행
-        generator = await proxy_stream(RULE_ENGINE_URL, path, token)
+        # 3. 스트리밍 중계 실행 (클라이언트 연결 종료 시 업스트림 스트림도 함께 종료)
+        generator = await proxy_stream(RULE_ENGINE_URL, path, token, request=request)
 
-        return StreamingResponse(generator, media_type="text/event-stream")
+        return StreamingResponse(generator, media_type="text/event-stream", headers=sse_headers)
 
     @minigame_router.post("/answer", summary="사용자가 입력한 답안의 정답 여부를 확인합니다.")
     async def proxy_answer(
         self,
         request: AnswerRequest,
         token_auth: HTTPAuthorizationCredentials = Depends(auth_scheme),
+        claims: TokenClaims = Depends(get_claims),
     ):
-        # 1. 토큰에서 유저 정보 추출
+        # 1. 검증된 토큰 클레임에서 유저 정보 추출
         token = token_auth.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
 
         # 2. rule-engine 마이크로서비스 경로 설정
-        path = f"{self.base_prefix}/answer/{user_id}"
+        path = f"{self.base_prefix}/answer/{claims.user_id}"
 
         # 3. proxy_request를 통해 rule-engine 마이크로서비스로 요청 전달
         response_data = await proxy_request(
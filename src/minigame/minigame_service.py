@@ -1,13 +1,15 @@
 from fastapi import HTTPException, status
 from configs.http_client import http_holder
 from configs.setting import LLM_GATEWAY_URL
+from utils.deadline import bounded_timeout, deadline_headers
 from utils.logger import error
 
 async def get_game_tip_sentence() -> str:
     """
     LLM을 호출하여 타자 연습용 게임 팁 문장을 가져옵니다.
     """
-    if not http_holder.client:
+    client = http_holder.get("llm_gateway")
+    if not client:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="HTTP Client not initialized",
@@ -29,10 +31,11 @@ async def get_game_tip_sentence() -> str:
         }
 
     try:
-        response = await http_holder.client.post(
+        response = await client.post(
             f"{LLM_GATEWAY_URL}/api/v1/chat/completions",
             json=payload,
-            timeout=30.0,
+            headers=deadline_headers(),
+            timeout=bounded_timeout(30.0),
         )
         response.raise_for_status()
 
@@ -0,0 +1,77 @@
+import hmac
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi_utils.cbv import cbv
+from starlette.responses import Response
+
+from common.dtos.wrapped_response import WrappedResponse
+from configs.http_client import http_holder
+from configs.setting import OPS_TOKEN
+from info.item_catalog import item_catalog
+from utils.bulkhead import bulkheads
+from utils.claims import claims_cache
+from utils.deadline import route_budgets
+from utils.idempotency import idempotency_store
+from utils.load_balancer import upstream_balancers
+from utils.metrics import registry
+from utils.proxy_stream import stream_stats
+from utils.redis_batcher import redis_batcher
+from utils.redis_health import redis_health
+from utils.response_cache import response_cache
+from utils.retry_policy import retry_budget
+from utils.single_flight import upstream_flights
+from utils.upstream_guard import upstream_guards
+
+ops_scheme = HTTPBearer(auto_error=False)
+
+
+async def require_ops_token(auth: Optional[HTTPAuthorizationCredentials] = Depends(ops_scheme)):
+    """
+    운영 엔드포인트는 업스트림 주소/IP, 풀과 캐시 상태 등 내부 구성을 드러내므로 운영 토큰을 가진 호출만 허용합니다.
+    OPS_TOKEN이 설정되지 않았으면 모든 호출을 거절합니다.
+    """
+    if not OPS_TOKEN or auth is None or not hmac.compare_digest(auth.credentials.encode(), OPS_TOKEN.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="운영 엔드포인트에 접근할 권한이 없습니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+ops_router = APIRouter(prefix="/ops", tags=["운영 상태 조회"], dependencies=[Depends(require_ops_token)])
+# Prometheus 스크레이프 경로는 관례상 /metrics를 사용합니다. 스크레이프 설정의 bearer 토큰으로 OPS_TOKEN을 전달합니다.
+metrics_router = APIRouter(tags=["운영 상태 조회"], dependencies=[Depends(require_ops_token)])
+
+
+@cbv(ops_router)
+class OpsRouter:
+    @ops_router.get(
+        "/upstreams",
+        response_model=WrappedResponse[Dict[str, Any]],
+        summary="업스트림별 서킷 브레이커/동시성 제한/커넥션 풀 상태를 조회합니다.",
+    )
+    async def get_upstreams(self):
+        return {
+            "data": {
+                "upstreams": upstream_guards.snapshot(),
+                "endpoints": upstream_balancers.snapshot(),
+                "pools": http_holder.snapshot(),
+                "coalescing": upstream_flights.snapshot(),
+                "response_cache": response_cache.snapshot(),
+                "streams": stream_stats.snapshot(),
+                "retry_budget": retry_budget.snapshot(),
+                "deadlines": route_budgets.snapshot(),
+                "bulkheads": bulkheads.snapshot(),
+                "idempotency": idempotency_store.snapshot(),
+                "claims_cache": claims_cache.snapshot(),
+                "item_catalog": item_catalog.snapshot(),
+                "redis": {"health": redis_health.snapshot(), "batching": redis_batcher.snapshot()},
+            }
+        }
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+def get_metrics():
+    return Response(content=registry.render(), media_type=registry.content_type)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum
 from typing import Annotated, Any, List, Optional, Union
 from uuid import UUID
 
@@ -229,3 +230,32 @@ class SessionResponse(BaseModel):
 class PaginatedSessionResponse(BaseModel):
     sessions: List[SessionResponse]
     meta: PaginationMeta
+
+
+class SnapshotSection(str, Enum):
+    """세션 스냅샷에 포함할 수 있는 구성 요소"""
+
+    SESSION = "session"
+    SEQUENCE = "sequence"
+    ACT = "act"
+    NPCS = "npcs"
+    ENEMIES = "enemies"
+    INVENTORY = "inventory"
+    ITEMS = "items"
+
+
+class SnapshotSectionError(BaseModel):
+    """조회에 실패한 스냅샷 구성 요소의 오류 정보"""
+
+    status_code: int
+    detail: Any = None
+
+
+class SessionSnapshot(BaseModel):
+    """게임 화면 렌더링에 필요한 세션 상태를 한 번에 담은 응답"""
+
+    session_id: str
+    sections: dict[SnapshotSection, Any] = Field(default_factory=dict, description="성공한 구성 요소별 데이터")
+    errors: dict[SnapshotSection, SnapshotSectionError] = Field(
+        default_factory=dict, description="실패한 구성 요소별 오류 (부분 실패 허용)"
+    )
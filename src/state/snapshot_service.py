@@ -0,0 +1,79 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException
+
+from configs.setting import STATE_MANAGER_URL
+from state.dtos.state_dtos import SessionSnapshot, SnapshotSection, SnapshotSectionError
+from utils.proxy_request import proxy_request
+from utils.retry_policy import RetryPolicy
+
+# 스냅샷 구성 요소별 state-manager 경로
+SNAPSHOT_PATHS: Dict[SnapshotSection, str] = {
+    SnapshotSection.SESSION: "/state/session/{session_id}",
+    SnapshotSection.SEQUENCE: "/state/session/{session_id}/sequence/details",
+    SnapshotSection.ACT: "/state/session/{session_id}/act/details",
+    SnapshotSection.NPCS: "/state/session/{session_id}/npcs",
+    SnapshotSection.ENEMIES: "/state/session/{session_id}/enemies",
+    SnapshotSection.INVENTORY: "/state/session/{session_id}/inventory",
+    SnapshotSection.ITEMS: "/state/session/{session_id}/items",
+}
+
+# 팬아웃 요청은 이미 여러 건이 동시에 나가므로 헤징 없이 재시도만 적용합니다.
+snapshot_retry = RetryPolicy()
+
+
+def parse_sections(values: Optional[List[str]]) -> List[SnapshotSection]:
+    """
+    sections 쿼리 값을 해석합니다. `sections=npcs,enemies`와 `sections=npcs&sections=enemies`를 모두 지원하며,
+    지정하지 않으면 전체 구성 요소를 조회합니다.
+    """
+    if not values:
+        return list(SnapshotSection)
+
+    names = [name.strip() for value in values for name in value.split(",") if name.strip()]
+    try:
+        selected = [SnapshotSection(name) for name in names]
+    except ValueError:
+        allowed = ", ".join(section.value for section in SnapshotSection)
+        raise HTTPException(
+            status_code=422,
+            detail=f"지원하지 않는 sections 값입니다. 사용 가능한 값: {allowed}",
+        ) from None
+    # 중복을 제거하되 요청 순서는 유지합니다.
+    return list(dict.fromkeys(selected))
+
+
+def _unwrap(body: Any) -> Any:
+    if isinstance(body, dict) and "data" in body:
+        return body["data"]
+    return body
+
+
+async def build_session_snapshot(session_id: str, token: str, sections: List[SnapshotSection]) -> SessionSnapshot:
+    """
+    선택된 구성 요소를 state-manager에 동시에 요청해 하나의 스냅샷으로 합칩니다.
+    일부 구성 요소가 실패해도 나머지는 반환하며, 실패 내역은 errors에 담습니다.
+    모든 구성 요소가 실패하면 첫 번째 오류를 그대로 반환합니다.
+    """
+
+    async def _fetch(section: SnapshotSection) -> Any:
+        path = SNAPSHOT_PATHS[section].format(session_id=session_id)
+        return _unwrap(await proxy_request("GET", STATE_MANAGER_URL, path, token, retry=snapshot_retry))
+
+    results = await asyncio.gather(*(_fetch(section) for section in sections), return_exceptions=True)
+
+    snapshot = SessionSnapshot(session_id=session_id)
+    failures: List[HTTPException] = []
+    for section, result in zip(sections, results, strict=True):
+        if isinstance(result, HTTPException):
+            failures.append(result)
+            snapshot.errors[section] = SnapshotSectionError(status_code=result.status_code, detail=result.detail)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            snapshot.sections[section] = result
+
+    if failures and len(failures) == len(sections):
+        raise failures[0]
+    return snapshot
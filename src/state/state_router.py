@@ -1,7 +1,7 @@
-from typing import Annotated, Any, List
+from typing import Annotated, Any, List, Optional
 
 from fastapi import APIRouter, Depends, Query
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi.security import HTTPAuthorizationCredentials
 from fastapi_utils.cbv import cbv
 
 from common.dtos.wrapped_response import WrappedResponse
@@ -15,14 +15,27 @@ from state.dtos.state_dtos import (
     ScenarioInfo,
     SequenceDetailInfo,
     SessionInfo,
+    SessionSnapshot,
     SessionStartRequest,
 )
-from utils.get_user_id import get_user_id
+from state.snapshot_service import build_session_snapshot, parse_sections
+from utils.claims import TokenClaims, bearer_scheme, get_claims
 from utils.proxy_request import proxy_request
+from utils.response_cache import CachePolicy
+from utils.retry_policy import RetryPolicy
 
 state_router = APIRouter(prefix="/state", tags=["게임 상태 중계"])
-security = HTTPBearer()
+security = bearer_scheme
 auth_dep = Depends(security)
+claims_dep = Depends(get_claims)
+
+# 시나리오는 거의 변하지 않는 참조 데이터이므로 전역 캐시를 사용합니다.
+# 캐시 적중 시 업스트림이 토큰을 보지 않으므로, 캐시 라우트는 claims_dep로 토큰을 로컬에서 먼저 검증합니다.
+scenario_cache = CachePolicy(ttl=60, stale_ttl=300)
+# 상태 조회는 멱등이므로 일시적 오류는 재시도하고, 느린 복제본은 헤지 요청으로 꼬리 지연을 줄입니다.
+state_read_retry = RetryPolicy(hedge=True)
+# 상태 변경 요청은 원본 바이트 대신 검증된 모델(model_dump())을 전달해
+# 알 수 없는 필드를 걸러내고 형 변환과 기본값을 반영합니다.
 
 
 @cbv(state_router)
@@ -34,6 +47,7 @@ class StateRouter:
         "/scenarios",
         response_model=WrappedResponse[List[ScenarioInfo]],
         summary="시나리오 조회 - 게임 시작에 필요한 scenario_id를 가져올 수 있습니다.",
+        dependencies=[claims_dep],
     )
     async def get_scenarios(
         self,
@@ -44,12 +58,17 @@ class StateRouter:
             STATE_MANAGER_URL,
             f"{self.base_prefix}/scenarios",
             auth.credentials,
+            cache=scenario_cache,
+            passthrough=True,
+            response_model=WrappedResponse[List[ScenarioInfo]],
+            retry=state_read_retry,
         )
 
     @state_router.get(
         "/scenario/{scenario_id}",
         response_model=WrappedResponse[ScenarioInfo],
         summary="시나리오 상세를 조회합니다.",
+        dependencies=[claims_dep],
     )
     async def get_scenario(
         self,
@@ -61,6 +80,10 @@ class StateRouter:
             STATE_MANAGER_URL,
             f"{self.base_prefix}/scenario/{scenario_id}",
             auth.credentials,
+            cache=scenario_cache,
+            passthrough=True,
+            response_model=WrappedResponse[ScenarioInfo],
+            retry=state_read_retry,
         )
 
     # 사용자 게임 세션 생성
@@ -73,8 +96,9 @@ class StateRouter:
         self,
         request: SessionStartRequest,
         auth: Annotated[HTTPAuthorizationCredentials, auth_dep],
+        claims: Annotated[TokenClaims, claims_dep],
     ):
-        user_id: str = get_user_id(auth)
+        user_id = claims.user_id
         params = {**request.model_dump(), "user_id": user_id}
         return await proxy_request(
             "POST",
@@ -93,17 +117,19 @@ class StateRouter:
     async def get_sessions_by_user_id(
         self,
         auth: Annotated[HTTPAuthorizationCredentials, auth_dep],
+        claims: Annotated[TokenClaims, claims_dep],
         skip: int = Query(0, description="페이지네이션: 건너뛸 항목 수", ge=0),
         limit: int = Query(10, description="페이지네이션: 한 번에 가져올 항목 수", ge=1, le=100),
         is_deleted: bool = Query(False, description="삭제된 세션 포함 여부 (true: 삭제됨, false: 활성 상태)"),
     ):
-        user_id: str = get_user_id(auth)
+        user_id = claims.user_id
 
         return await proxy_request(
             "GET",
             RULE_ENGINE_URL,
             (f"/session/list?user_id={user_id}&skip={skip}&limit={limit}&is_deleted={is_deleted}"),
             auth.credentials,
+            retry=state_read_retry,
         )
 
     # 전체 활성화 세션 목록 조회
@@ -121,6 +147,7 @@ class StateRouter:
             STATE_MANAGER_URL,
             f"{self.base_prefix}/sessions/active",
             auth.credentials,
+            retry=state_read_retry,
         )
 
     # 세션 정보 조회
@@ -139,6 +166,7 @@ class StateRouter:
             STATE_MANAGER_URL,
             f"{self.base_prefix}/session/{session_id}",
             auth.credentials,
+            retry=state_read_retry,
         )
 
     # 플레이어 상태 조회
@@ -157,6 +185,7 @@ class StateRouter:
             STATE_MANAGER_URL,
             f"{self.base_prefix}/player/{player_id}",
             auth.credentials,
+            retry=state_read_retry,
         )
 
     # 시퀀스 상세 조회
@@ -175,6 +204,9 @@ class StateRouter:
             STATE_MANAGER_URL,
             f"{self.base_prefix}/session/{session_id}/sequence/details",
             auth.credentials,
+            passthrough=True,
+            response_model=WrappedResponse[SequenceDetailInfo],
+            retry=state_read_retry,
         )
 
     @state_router.get(
@@ -192,6 +224,7 @@ class StateRouter:
             STATE_MANAGER_URL,
             f"{self.base_prefix}/session/{session_id}/act/details",
             auth.credentials,
+            retry=state_read_retry,
         )
 
     @state_router.get(
@@ -209,6 +242,7 @@ class StateRouter:
             STATE_MANAGER_URL,
             f"{self.base_prefix}/session/{session_id}/npcs",
             auth.credentials,
+            retry=state_read_retry,
         )
 
     @state_router.get(
@@ -226,6 +260,7 @@ class StateRouter:
             STATE_MANAGER_URL,
             f"{self.base_prefix}/session/{session_id}/enemies",
             auth.credentials,
+            retry=state_read_retry,
         )
 
     @state_router.get(
@@ -243,6 +278,7 @@ class StateRouter:
             STATE_MANAGER_URL,
             f"{self.base_prefix}/session/{session_id}/inventory",
             auth.credentials,
+            retry=state_read_retry,
         )
 
     @state_router.get(
@@ -260,8 +296,27 @@ class StateRouter:
             STATE_MANAGER_URL,
             f"{self.base_prefix}/session/{session_id}/items",
             auth.credentials,
+            retry=state_read_retry,
         )
 
+    @state_router.get(
+        "/session/{session_id}/snapshot",
+        response_model=WrappedResponse[SessionSnapshot],
+        summary="게임 화면에 필요한 세션 상태(세션/시퀀스/액트/NPC/적/인벤토리/아이템)를 한 번에 조회합니다.",
+        description=(
+            "구성 요소를 state-manager에 동시에 요청합니다. 일부가 실패해도 나머지는 반환하며 실패 내역은 "
+            "`errors`에 담깁니다. `sections=npcs,enemies`처럼 필요한 구성 요소만 선택할 수 있습니다."
+        ),
+    )
+    async def get_session_snapshot(
+        self,
+        session_id: str,
+        auth: Annotated[HTTPAuthorizationCredentials, auth_dep],
+        sections: Optional[List[str]] = Query(None, description="조회할 구성 요소 (쉼표 구분 또는 반복 지정)"),
+    ):
+        snapshot = await build_session_snapshot(session_id, auth.credentials, parse_sections(sections))
+        return snapshot.model_dump(mode="json")
+
     @state_router.put(
         "/inventory/update",
         response_model=WrappedResponse[dict[str, Any]],
@@ -278,6 +333,8 @@ class StateRouter:
             f"{self.base_prefix}/inventory/update",
             auth.credentials,
             json=request.model_dump(),
+            passthrough=True,
+            response_model=WrappedResponse[dict[str, Any]],
         )
 
     @state_router.post(
@@ -296,6 +353,8 @@ class StateRouter:
             f"{self.base_prefix}/player/item/earn",
             auth.credentials,
             json=request.model_dump(),
+            passthrough=True,
+            response_model=WrappedResponse[dict[str, Any]],
         )
 
     @state_router.post(
@@ -314,4 +373,6 @@ class StateRouter:
             f"{self.base_prefix}/player/item/use",
             auth.credentials,
             json=request.model_dump(),
+            passthrough=True,
+            response_model=WrappedResponse[dict[str, Any]],
         )
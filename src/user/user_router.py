@@ -1,18 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi.security import HTTPAuthorizationCredentials
 from fastapi_utils.cbv import cbv
 
 from auth.auth_service import AuthService
-from auth.utils.crypt_utils import get_password_hash, verify_password
 from common.dtos.wrapped_response import WrappedResponse
 from common.utils.get_services import get_auth_service
 from configs.setting import RULE_ENGINE_URL
 from user.dtos.user_dtos import UserCreateRequest, UserInfo, UserPWUpdateRequest, UserUpdateRequest
-from utils.get_user_id import get_user_id
+from utils.claims import TokenClaims, bearer_scheme, get_claims
+from utils.password_pool import password_pool
 from utils.proxy_request import proxy_request
 
 user_router = APIRouter(prefix="/user", tags=["회원 서비스 중계"])
-security = HTTPBearer()
+security = bearer_scheme
 
 
 @cbv(user_router)
@@ -20,8 +20,12 @@ class UserHandler:
     base_prefix = "/user"
 
     @user_router.get("/detail", response_model=WrappedResponse[UserInfo], summary="회원 정보 조회")
-    async def get_user(self, auth: HTTPAuthorizationCredentials = Depends(security)):
-        user_id: str = get_user_id(auth)
+    async def get_user(
+        self,
+        auth: HTTPAuthorizationCredentials = Depends(security),
+        claims: TokenClaims = Depends(get_claims),
+    ):
+        user_id = claims.user_id
         return await proxy_request("GET", RULE_ENGINE_URL, f"{self.base_prefix}/{user_id}", auth.credentials)
 
     @user_router.post("/create", response_model=WrappedResponse[UserInfo], summary="회원 가입")
@@ -32,7 +36,7 @@ class UserHandler:
     ):
         created = await auth_service.signup(
             username=request_data.username,
-            hashed_password=get_password_hash(request_data.password),
+            hashed_password=await password_pool.hash(request_data.password),
             email=request_data.email,
         )
         return {
@@ -42,9 +46,12 @@ class UserHandler:
 
     @user_router.put("/update", response_model=WrappedResponse[UserInfo], summary="회원 정보 수정")
     async def update_user(
-        self, request_data: UserUpdateRequest, auth: HTTPAuthorizationCredentials = Depends(security)
+        self,
+        request_data: UserUpdateRequest,
+        auth: HTTPAuthorizationCredentials = Depends(security),
+        claims: TokenClaims = Depends(get_claims),
     ):
-        user_id: str = get_user_id(auth)
+        user_id = claims.user_id
         params = {**request_data.model_dump(), "user_id": user_id}
         return await proxy_request("PUT", RULE_ENGINE_URL, f"{self.base_prefix}/update", auth.credentials, json=params)
 
@@ -54,22 +61,27 @@ class UserHandler:
         request_data: UserPWUpdateRequest,
         auth_service: AuthService = Depends(get_auth_service),
         auth: HTTPAuthorizationCredentials = Depends(security),
+        claims: TokenClaims = Depends(get_claims),
     ):
-        user_id: str = get_user_id(auth)
+        user_id = claims.user_id
         user = await auth_service.get_current_user_info(user_id)
 
-        if not user or not verify_password(request_data.old_pw, user["password_hash"]):
+        if not user or not await password_pool.verify(request_data.old_pw, user["password_hash"]):
             raise HTTPException(status_code=401, detail="기존 비밀번호가 일치하지 않습니다.")
 
         params = {
             "user_id": int(user_id),
-            "password_hash": get_password_hash(request_data.new_pw),
+            "password_hash": await password_pool.hash(request_data.new_pw),
         }
         return await proxy_request(
             "PATCH", RULE_ENGINE_URL, f"{self.base_prefix}/password", auth.credentials, json=params
         )
 
     @user_router.delete("/delete", response_model=WrappedResponse[int], summary="회윈 탈퇴")
-    async def delete_user(self, auth: HTTPAuthorizationCredentials = Depends(security)):
-        user_id: str = get_user_id(auth)
+    async def delete_user(
+        self,
+        auth: HTTPAuthorizationCredentials = Depends(security),
+        claims: TokenClaims = Depends(get_claims),
+    ):
+        user_id = claims.user_id
         return await proxy_request("DELETE", RULE_ENGINE_URL, f"{self.base_prefix}/delete/{user_id}", auth.credentials)
@@ -0,0 +1,151 @@
+import asyncio
+import bisect
+import itertools
+import math
+from typing import Any, Dict, List, Optional
+
+from configs.bulkheads import BULKHEADS, BulkheadConfig, Priority
+from utils.metrics import Counter, GaugeCollector, registry
+
+bulkhead_rejected_total = registry.register(
+    Counter("bulkhead_rejected_total", "벌크헤드에서 거절된 요청 수", ("bulkhead", "reason"))
+)
+
+
+class BulkheadRejected(Exception):
+    """벌크헤드 대기열이 가득 차 거절(또는 더 높은 우선순위 요청에 밀려 제외)된 경우"""
+
+    def __init__(self, name: str, reason: str, position: int, retry_after: int):
+        super().__init__(f"{name} 벌크헤드가 가득 찼습니다. ({reason})")
+        self.name = name
+        self.reason = reason
+        self.position = position
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    def __init__(self, priority: Priority, seq: int):
+        self.priority = priority
+        self.seq = seq
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    @property
+    def order(self):
+        # 우선순위가 높은 요청이 앞에, 같은 우선순위는 먼저 온 요청이 앞에 섭니다.
+        return (-self.priority, self.seq)
+
+
+class Bulkhead:
+    """
+    라우트 분류 하나의 동시 처리 수를 제한하는 격벽.
+    슬롯이 없으면 우선순위 대기열에서 기다리고, 대기열이 가득 차면 가장 낮은 우선순위의 대기 요청을 버리거나
+    (새 요청의 우선순위가 더 낮거나 같으면) 새 요청을 거절합니다.
+    슬롯은 반환 시 다음 대기자에게 바로 넘겨 새로 온 요청이 대기열을 앞지르지 않게 합니다.
+    """
+
+    # 평균 처리 시간(EWMA) 가중치. Retry-After 추정에 사용합니다.
+    smoothing = 0.2
+
+    def __init__(self, name: str, config: BulkheadConfig):
+        self.name = name
+        self.config = config
+        self.active = 0
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self.admitted = 0
+        self.queued = 0
+        self.avg_service_seconds: Optional[float] = None
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self, position: int) -> int:
+        """앞선 요청들이 빠질 때까지의 예상 시간(초)."""
+        service = self.avg_service_seconds or 1.0
+        return max(1, math.ceil(service * position / self.config.max_concurrent))
+
+    async def acquire(self, priority: Priority) -> int:
+        """슬롯을 얻을 때까지 기다립니다. 도착 시점의 대기 순번(바로 처리되면 0)을 반환합니다."""
+        if self.active < self.config.max_concurrent and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return 0
+
+        if len(self._waiters) >= self.config.max_queue:
+            self._make_room(priority)
+
+        waiter = _Waiter(priority, next(self._seq))
+        orders = [w.order for w in self._waiters]
+        index = bisect.bisect(orders, waiter.order)
+        self._waiters.insert(index, waiter)
+        position = index + 1
+        self.queued += 1
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+                # 슬롯을 넘겨받은 직후 취소된 경우 슬롯을 다음 대기자에게 돌려줍니다.
+                self.release(None)
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        self.admitted += 1
+        return position
+
+    def _make_room(self, priority: Priority):
+        lowest = self._waiters[-1] if self._waiters else None
+        if lowest is None or lowest.priority >= priority:
+            position = len(self._waiters) + 1
+            bulkhead_rejected_total.inc(self.name, "full")
+            raise BulkheadRejected(self.name, "full", position, self.retry_after(position))
+
+        # 새 요청보다 우선순위가 낮은 마지막 대기자를 버리고 자리를 만듭니다.
+        self._waiters.pop()
+        position = len(self._waiters) + 1
+        bulkhead_rejected_total.inc(self.name, "shed")
+        lowest.future.set_exception(BulkheadRejected(self.name, "shed", position, self.retry_after(position)))
+
+    def release(self, elapsed: Optional[float]):
+        if elapsed is not None:
+            previous = self.avg_service_seconds
+            self.avg_service_seconds = elapsed if previous is None else previous + self.smoothing * (elapsed - previous)
+        while self._waiters:
+            waiter = self._waiters.pop(0)
+            if not waiter.future.done():
+                waiter.future.set_result(None)
+                return
+        self.active -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.config.max_concurrent,
+            "max_queue": self.config.max_queue,
+            "active": self.active,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "avg_service_seconds": round(self.avg_service_seconds, 3) if self.avg_service_seconds else None,
+        }
+
+
+class BulkheadRegistry:
+    def __init__(self, configs: Dict[str, BulkheadConfig]):
+        self._bulkheads: Dict[str, Bulkhead] = {name: Bulkhead(name, config) for name, config in configs.items()}
+
+    def get(self, name: str) -> Bulkhead:
+        return self._bulkheads[name]
+
+    def usage(self):
+        for name, bulkhead in self._bulkheads.items():
+            yield (name, "active"), bulkhead.active
+            yield (name, "waiting"), bulkhead.waiting
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: bulkhead.snapshot() for name, bulkhead in self._bulkheads.items()}
+
+
+bulkheads = BulkheadRegistry(BULKHEADS)
+registry.register(
+    GaugeCollector("bulkhead_requests", "벌크헤드별 처리 중/대기 중 요청 수", ("bulkhead", "state"), bulkheads.usage)
+)
@@ -0,0 +1,72 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from configs.bulkheads import ROUTE_BULKHEADS
+from utils.bulkhead import BulkheadRejected, bulkheads
+from utils.route_match import route_template
+
+QUEUE_POSITION_HEADER = "X-Queue-Position"
+QUEUE_WAIT_HEADER = "X-Queue-Wait-Ms"
+
+
+class BulkheadMiddleware:
+    """
+    LLM 호출/SSE 스트림처럼 느린 라우트를 벌크헤드로 격리하는 순수 ASGI 미들웨어.
+    - 슬롯은 응답이 끝날 때까지(스트림은 스트림 종료까지) 점유합니다.
+    - 대기열에서 기다렸다 처리된 응답에는 도착 시 대기 순번과 대기 시간을 헤더로 붙입니다.
+    - 거절된 요청은 503과 함께 Retry-After, 대기 순번 힌트를 반환합니다.
+    등록되지 않은 빠른 라우트는 그대로 통과하므로, 느린 요청이 몰려도 대화형 요청은 영향을 받지 않습니다.
+    마감 시간 미들웨어 안쪽에 두어 대기 시간도 요청 예산에 포함되도록 합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route_class = ROUTE_BULKHEADS.get(route_template(scope))
+        if route_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        name, priority = route_class
+        bulkhead = bulkheads.get(name)
+        arrived = time.monotonic()
+        try:
+            position = await bulkhead.acquire(priority)
+        except BulkheadRejected as e:
+            response = JSONResponse(
+                status_code=503,
+                content={
+                    "status": "error",
+                    "message": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                    "detail": str(e),
+                },
+                headers={"Retry-After": str(e.retry_after), QUEUE_POSITION_HEADER: str(e.position)},
+            )
+            await response(scope, receive, send)
+            return
+
+        admitted = time.monotonic()
+        waited_ms = int((admitted - arrived) * 1000)
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start" and position:
+                headers = MutableHeaders(raw=message["headers"])
+                headers[QUEUE_POSITION_HEADER] = str(position)
+                headers[QUEUE_WAIT_HEADER] = str(waited_ms)
+            await send(message)
+
+        completed = False
+        try:
+            await self.app(scope, receive, send_wrapper)
+            completed = True
+        finally:
+            # 취소된 요청의 처리 시간은 평균 처리 시간(Retry-After 추정)에 반영하지 않습니다.
+            bulkhead.release(time.monotonic() - admitted if completed else None)
@@ -0,0 +1,170 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import ExpiredSignatureError, JWTError, jwt
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+from configs.setting import ALGORITHM, CLAIMS_CACHE_MAX_ENTRIES, SECRET_KEY
+from utils.token_digest import token_digest
+
+bearer_scheme = HTTPBearer()
+
+# 서버 내부 호출(배치 하위 요청)에 이미 검증한 (토큰, 클레임)을 넘길 때 사용하는 요청 state 키.
+# scope의 state는 서버 내부에서만 채울 수 있으므로 클라이언트가 이 값을 주입할 수 없습니다.
+VERIFIED_CLAIMS_STATE = "verified_claims"
+
+
+class TokenClaims(BaseModel):
+    """검증을 마친 접근 토큰의 클레임"""
+
+    model_config = ConfigDict(extra="allow", frozen=True, coerce_numbers_to_str=True)
+
+    sub: str
+    username: Optional[str] = None
+    exp: Optional[int] = None
+
+    @property
+    def user_id(self) -> str:
+        return self.sub
+
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+@dataclass
+class ClaimsCacheStats:
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+
+
+class ClaimsCache:
+    """
+    검증된 토큰의 클레임을 토큰 다이제스트 기준으로 보관하는 프로세스 내부 LRU 캐시.
+    같은 토큰으로 반복되는 요청(배치 하위 요청 포함)이 서명 검증과 JSON 파싱을 다시 하지 않도록 합니다.
+    항목은 토큰의 exp 시각까지만 유효하며, exp가 없는 토큰은 캐시하지 않습니다.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.stats = ClaimsCacheStats()
+        self._entries: "OrderedDict[str, Tuple[TokenClaims, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> Optional[TokenClaims]:
+        key = token_digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        claims, expires_at = entry
+        if time.time() >= expires_at:
+            # 만료된 토큰은 다시 검증해 만료 응답을 돌려주도록 캐시에서 제거합니다.
+            del self._entries[key]
+            self.stats.expired += 1
+            self.stats.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return claims
+
+    def set(self, token: str, claims: TokenClaims):
+        if claims.exp is None or self.max_entries <= 0:
+            return
+        key = token_digest(token)
+        self._entries[key] = (claims, float(claims.exp))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "expired": self.stats.expired,
+            "evictions": self.stats.evictions,
+        }
+
+
+claims_cache = ClaimsCache(CLAIMS_CACHE_MAX_ENTRIES)
+
+
+@dataclass(frozen=True)
+class UnauthorizedMessages:
+    """토큰 검증 실패 시 돌려줄 401 메시지. 라우트마다 기존에 쓰던 메시지를 유지할 때 사용합니다."""
+
+    expired: str = "로그인 세션이 만료되었습니다. 다시 로그인해주세요."
+    invalid: str = "인증에 실패하였습니다."
+    malformed: str = "유효하지 않은 인증 정보입니다."
+
+
+DEFAULT_MESSAGES = UnauthorizedMessages()
+
+
+def verify_token(token: str, messages: UnauthorizedMessages = DEFAULT_MESSAGES) -> TokenClaims:
+    """접근 토큰을 검증하고 클레임을 반환합니다. 캐시에 있으면 서명 검증을 건너뜁니다."""
+    claims = claims_cache.get(token)
+    if claims is not None:
+        return claims
+
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except ExpiredSignatureError:
+        # 토큰 만료 시
+        raise _unauthorized(messages.expired) from None
+    except JWTError:
+        # 그 외 토큰 변조 등 에러 시
+        raise _unauthorized(messages.invalid) from None
+
+    try:
+        claims = TokenClaims.model_validate(payload)
+    except ValidationError:
+        raise _unauthorized(messages.malformed) from None
+
+    claims_cache.set(token, claims)
+    return claims
+
+
+async def get_claims(request: Request, auth: HTTPAuthorizationCredentials = Depends(bearer_scheme)) -> TokenClaims:
+    """
+    요청당 한 번만 토큰을 검증하는 인증 의존성.
+    FastAPI가 요청 안에서 의존성 결과를 재사용하므로 여러 의존성이 함께 사용해도 검증은 한 번입니다.
+    배치 하위 요청처럼 같은 토큰을 이미 검증해 둔 내부 호출이면 그 클레임을 그대로 사용합니다.
+    """
+    return _claims_for(request, auth.credentials, DEFAULT_MESSAGES)
+
+
+def _claims_for(request: Request, token: str, messages: UnauthorizedMessages) -> TokenClaims:
+    verified = getattr(request.state, VERIFIED_CLAIMS_STATE, None)
+    if verified is not None and verified[0] == token:
+        return verified[1]
+    return verify_token(token, messages)
+
+
+def claims_dependency(messages: UnauthorizedMessages):
+    """get_claims와 같은 검증을 하되 실패 시 주어진 401 메시지를 돌려주는 인증 의존성을 만듭니다."""
+
+    async def _get_claims(request: Request, auth: HTTPAuthorizationCredentials = Depends(bearer_scheme)) -> TokenClaims:
+        return _claims_for(request, auth.credentials, messages)
+
+    return _get_claims
@@ -0,0 +1,110 @@
+import gzip
+import zlib
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional
+
+from configs.setting import COMPRESSION_MINIMUM_SIZE
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 설치되지 않았으면 br을 협상하지 않습니다.
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성: 설치되지 않았으면 zstd를 협상하지 않습니다.
+    zstandard = None
+
+# 현재 요청에서 클라이언트와 협상된 인코딩 (압축 미들웨어가 설정)
+negotiated_encoding: ContextVar[Optional[str]] = ContextVar("negotiated_encoding", default=None)
+
+# JSON 응답은 반복이 많아 빠른 압축 수준으로도 충분히 줄어듭니다.
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 5
+_ZSTD_LEVEL = 3
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml", "image/svg+xml")
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data)
+
+
+# 같은 q 값이면 앞선 인코딩을 우선합니다 (압축률/속도 순).
+CODECS: Dict[str, Callable[[bytes], bytes]] = {}
+if zstandard is not None:
+    CODECS["zstd"] = _zstd_compress
+if brotli is not None:
+    CODECS["br"] = lambda data: brotli.compress(data, quality=_BROTLI_QUALITY)
+CODECS["gzip"] = lambda data: gzip.compress(data, compresslevel=_GZIP_LEVEL, mtime=0)
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding 헤더(q 값 포함)를 해석해 사용할 인코딩을 고릅니다. 없으면 None."""
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            weights[name] = q
+
+    wildcard = weights.get("*")
+    best, best_q = None, 0.0
+    for encoding in CODECS:
+        q = weights.get(encoding, wildcard if wildcard is not None else 0.0)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    return bool(content_type) and content_type.lower().startswith(_COMPRESSIBLE_TYPES)
+
+
+def should_compress(body: bytes, content_type: Optional[str]) -> bool:
+    return len(body) >= COMPRESSION_MINIMUM_SIZE and is_compressible(content_type)
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    return CODECS[encoding](data)
+
+
+class StreamCompressor:
+    """
+    스트리밍 응답용 압축기. 청크마다 flush하므로 SSE 이벤트가 압축 버퍼에 묶여 지연되지 않습니다.
+    """
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._gzip = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 31)
+        elif encoding == "br":
+            self._brotli = brotli.Compressor(quality=_BROTLI_QUALITY)
+        elif encoding == "zstd":
+            self._zstd = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compressobj()
+        else:
+            raise ValueError(f"지원하지 않는 인코딩입니다: {encoding}")
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "gzip":
+            return self._gzip.compress(chunk) + self._gzip.flush(zlib.Z_SYNC_FLUSH)
+        if self.encoding == "br":
+            return self._brotli.process(chunk) + self._brotli.flush()
+        return self._zstd.compress(chunk) + self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        if self.encoding == "gzip":
+            return self._gzip.flush(zlib.Z_FINISH)
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zstd.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
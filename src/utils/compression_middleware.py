@@ -0,0 +1,117 @@
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.compression import (
+    StreamCompressor,
+    compress,
+    is_compressible,
+    negotiate,
+    negotiated_encoding,
+    should_compress,
+)
+from utils.etag import weaken
+
+# 본문이 없거나 변경되면 안 되는 상태 코드
+_NO_BODY_STATUSES = frozenset({204, 206, 304})
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding 협상 결과(zstd/br/gzip)로 응답을 압축하는 순수 ASGI 미들웨어.
+    - 한 번에 전송되는 응답은 COMPRESSION_MINIMUM_SIZE 이상일 때만 압축합니다.
+    - StreamingResponse(SSE 포함)는 청크 단위로 압축하고 매 청크를 flush해 실시간성을 유지합니다.
+    - 이미 Content-Encoding이 지정된 응답(캐시의 사전 압축 본문 등)은 그대로 전달합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        token = negotiated_encoding.set(encoding)
+        try:
+            await self.app(scope, receive, _CompressingSender(send, encoding))
+        finally:
+            negotiated_encoding.reset(token)
+
+
+class _CompressingSender:
+    def __init__(self, send: Send, encoding: Optional[str]):
+        self.send = send
+        self.encoding = encoding
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[StreamCompressor] = None
+        self.started = False
+
+    async def __call__(self, message: Message):
+        if message["type"] == "http.response.start":
+            # 첫 본문 청크를 보고 압축 여부(단일/스트리밍)를 결정하기 위해 헤더 전송을 미룹니다.
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        if not self.started:
+            self.started = True
+            await self._start(message)
+            return
+
+        if self.compressor is None:
+            await self.send(message)
+            return
+
+        more_body = message.get("more_body", False)
+        body = self.compressor.compress(message.get("body", b""))
+        if not more_body:
+            body += self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _start(self, message: Message):
+        start = self.start_message
+        headers = MutableHeaders(raw=start["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        compressible = is_compressible(headers.get("content-type")) and start["status"] not in _NO_BODY_STATUSES
+        if compressible:
+            headers.add_vary_header("Accept-Encoding")
+
+        if not compressible or self.encoding is None or "content-encoding" in headers:
+            await self.send(start)
+            await self.send(message)
+            return
+
+        if more_body:
+            # 스트리밍 응답: 길이를 알 수 없으므로 Content-Length를 제거하고 청크별로 압축합니다.
+            self.compressor = StreamCompressor(self.encoding)
+            del headers["content-length"]
+            _mark_encoded(headers, self.encoding)
+            await self.send(start)
+            await self.send({"type": "http.response.body", "body": self.compressor.compress(body), "more_body": True})
+            return
+
+        if not should_compress(body, headers.get("content-type")):
+            await self.send(start)
+            await self.send(message)
+            return
+
+        compressed = compress(body, self.encoding)
+        _mark_encoded(headers, self.encoding)
+        headers["content-length"] = str(len(compressed))
+        await self.send(start)
+        await self.send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+
+def _mark_encoded(headers: MutableHeaders, encoding: str):
+    headers["content-encoding"] = encoding
+    # 압축 본문은 원본과 바이트가 다르므로 강한 ETag를 약한 ETag로 바꿉니다.
+    if "etag" in headers:
+        headers["etag"] = weaken(headers["etag"])
@@ -0,0 +1,106 @@
+import time
+from typing import Any, Optional, Union
+
+from fastapi import HTTPException
+from psycopg_pool import PoolTimeout
+
+from utils.deadline import capped
+from utils.logger import warning
+from utils.metrics import db_connection_hold_seconds, db_pool_wait_seconds
+from utils.sql_registry import SqlQuery
+
+# 커넥션 보유 시간 지표의 반납 시점 라벨
+RELEASED_AFTER_UNIT = "unit_of_work"  # `async with cursor:` 블록이 끝나자마자 반납
+RELEASED_AT_REQUEST_END = "request_end"  # 블록 밖에서 실행해 응답이 끝날 때 반납
+
+
+class LazyCursor:
+    """
+    첫 쿼리를 실행할 때 커넥션을 빌리고, 작업 단위가 끝나면 바로 반납하는 커서.
+    서비스는 쿼리 묶음을 `async with self.cursor:` 블록으로 감싸 작업 단위를 표시합니다.
+    블록이 정상 종료되면 커밋, 예외로 끝나면 롤백한 뒤 커넥션을 풀에 돌려주므로,
+    bcrypt 검증이나 업스트림 호출처럼 DB와 무관한 느린 단계 동안 커넥션을 붙잡지 않습니다.
+    블록 밖에서 실행한 쿼리의 커넥션은 get_db_cursor 의존성이 응답 종료 시 반납합니다.
+    """
+
+    def __init__(self, pool, acquire_timeout: float):
+        self.pool = pool
+        self.acquire_timeout = acquire_timeout
+        self._conn = None
+        self._cursor = None
+        self._acquired_at: Optional[float] = None
+        self._depth = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None
+
+    async def _ensure_cursor(self):
+        if self._cursor is not None:
+            return self._cursor
+
+        started = time.monotonic()
+        try:
+            # 커넥션 대기 시간도 남은 요청 예산을 넘지 않게 합니다.
+            conn = await self.pool.getconn(timeout=capped(self.acquire_timeout))
+        except PoolTimeout as e:
+            warning(f"⚠️ 데이터베이스 커넥션 대기 시간 초과: {e}")
+            raise HTTPException(
+                status_code=503,
+                detail="데이터베이스 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": "1"},
+            ) from e
+        self._acquired_at = time.monotonic()
+        db_pool_wait_seconds.observe(self._acquired_at - started)
+        self._conn = conn
+        self._cursor = conn.cursor()
+        return self._cursor
+
+    def _require_cursor(self):
+        if self._cursor is None:
+            raise RuntimeError("실행된 쿼리가 없습니다. execute()를 먼저 호출해주세요.")
+        return self._cursor
+
+    async def execute(self, query: Union[SqlQuery, str], params: Any = None) -> "LazyCursor":
+        """
+        쿼리를 실행합니다. 레지스트리의 SqlQuery는 첫 실행부터 서버 측 prepared statement로 실행해
+        커넥션마다 한 번만 준비하고, 이후에는 커넥션의 준비된 문장 캐시를 재사용합니다.
+        """
+        cursor = await self._ensure_cursor()
+        if isinstance(query, SqlQuery):
+            await cursor.execute(query.text, params, prepare=True)
+        else:
+            await cursor.execute(query, params)
+        return self
+
+    async def fetchone(self):
+        return await self._require_cursor().fetchone()
+
+    async def fetchall(self):
+        return await self._require_cursor().fetchall()
+
+    async def release(self, commit: bool = True, reason: str = RELEASED_AFTER_UNIT):
+        """트랜잭션을 커밋(또는 롤백)하고 커넥션을 반납합니다. 빌린 커넥션이 없으면 아무것도 하지 않습니다."""
+        conn, cursor, acquired_at = self._conn, self._cursor, self._acquired_at
+        if conn is None:
+            return
+        self._conn = self._cursor = self._acquired_at = None
+        try:
+            await cursor.close()
+            if commit:
+                await conn.commit()
+            else:
+                await conn.rollback()
+        finally:
+            db_connection_hold_seconds.observe(time.monotonic() - acquired_at, reason)
+            await self.pool.putconn(conn)
+
+    async def __aenter__(self) -> "LazyCursor":
+        self._depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._depth -= 1
+        if self._depth == 0:
+            await self.release(commit=exc_type is None)
+        return False
@@ -0,0 +1,134 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Union
+
+import httpx
+from fastapi import status
+
+from configs.deadlines import ROUTE_DEADLINES, RouteDeadline
+from configs.setting import DEADLINE_DEFAULT_SECONDS, DEADLINE_MIN_SECONDS, DEADLINE_P99_MULTIPLIER
+from utils.idempotency import IDEMPOTENT_ROUTES
+from utils.metrics import http_deadline_exceeded_total
+from utils.upstream_guard import LatencyWindow, UpstreamRejected
+
+# 클라이언트가 요청 예산을, 라우터가 업스트림에 남은 예산을 밀리초 단위로 전달하는 헤더
+DEADLINE_HEADER = "X-Request-Timeout-Ms"
+
+
+class Deadline:
+    """요청 하나의 마감 시각 (monotonic 기준)"""
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+current_deadline: ContextVar[Optional[Deadline]] = ContextVar("current_deadline", default=None)
+
+
+class DeadlineExceeded(UpstreamRejected):
+    """남은 예산이 없어 업스트림을 호출하지 않거나 호출을 중단한 경우의 예외"""
+
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail="요청 처리 시간(마감 시간)을 초과했습니다."
+        )
+
+
+def parse_timeout_header(value: Optional[str]) -> Optional[float]:
+    """DEADLINE_HEADER 값을 초 단위로 변환합니다. 잘못된 값은 무시합니다."""
+    try:
+        millis = int(value)
+    except (TypeError, ValueError):
+        return None
+    return millis / 1000 if millis > 0 else None
+
+
+def remaining_budget() -> Optional[float]:
+    deadline = current_deadline.get()
+    return deadline.remaining() if deadline else None
+
+
+def deadline_headers() -> Dict[str, str]:
+    """업스트림에 전달할 남은 예산 헤더. 마감 시간이 없으면 빈 dict를 반환합니다."""
+    remaining = remaining_budget()
+    return {DEADLINE_HEADER: str(max(1, int(remaining * 1000)))} if remaining is not None else {}
+
+
+def capped(seconds: Optional[float]) -> Optional[float]:
+    """타임아웃을 남은 예산 이하로 줄입니다. None(무제한)은 남은 예산으로 바뀝니다."""
+    remaining = remaining_budget()
+    if remaining is None:
+        return seconds
+    return remaining if seconds is None else min(seconds, remaining)
+
+
+def bounded_timeout(timeout: Union[float, httpx.Timeout]) -> httpx.Timeout:
+    timeout = httpx.Timeout(timeout)
+    return httpx.Timeout(
+        connect=capped(timeout.connect),
+        read=capped(timeout.read),
+        write=capped(timeout.write),
+        pool=capped(timeout.pool),
+    )
+
+
+class _RouteLatency(LatencyWindow):
+    # p99는 표본이 적으면 최댓값과 같아지므로 더 많은 표본이 쌓인 뒤에 사용합니다.
+    min_samples = 100
+
+
+class RouteBudgets:
+    """
+    라우트별 마감 시간 예산.
+    설정된 예산(없으면 기본값)을 상한으로, adaptive로 등록된 조회 라우트만 관측된 p99 x multiplier까지 예산을 줄입니다.
+    느린 요청을 끝까지 기다리지 않되, floor 아래로는 줄이지 않아 정상 요청이 잘리지 않도록 합니다.
+    재시도 중복을 막아야 하는 상태 변경 라우트(IDEMPOTENT_ROUTES)는 설정과 무관하게 줄이지 않습니다.
+    """
+
+    def __init__(self, routes: Dict[str, RouteDeadline], default: float, multiplier: float, floor: float):
+        self.routes = routes
+        self.default = default
+        self.multiplier = multiplier
+        self.floor = floor
+        self._latency: Dict[str, _RouteLatency] = {}
+
+    def budget_for(self, route: Optional[str]) -> float:
+        config = self.routes.get(route)
+        ceiling = config.budget if config else self.default
+        window = self._latency.get(route)
+        if config is None or not config.adaptive or route in IDEMPOTENT_ROUTES or window is None:
+            return ceiling
+        p99 = window.quantile(0.99)
+        if p99 is None:
+            return ceiling
+        return min(ceiling, max(self.floor, p99 * self.multiplier))
+
+    def observe(self, route: str, seconds: float):
+        window = self._latency.get(route)
+        if window is None:
+            window = self._latency[route] = _RouteLatency()
+        window.observe(seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            route: {
+                "budget": round(self.budget_for(route), 3),
+                "p99": window.quantile(0.99),
+                "exceeded": int(http_deadline_exceeded_total.value(route)),
+            }
+            for route, window in self._latency.items()
+        }
+
+
+route_budgets = RouteBudgets(ROUTE_DEADLINES, DEADLINE_DEFAULT_SECONDS, DEADLINE_P99_MULTIPLIER, DEADLINE_MIN_SECONDS)
@@ -0,0 +1,78 @@
+import asyncio
+import time
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.deadline import DEADLINE_HEADER, Deadline, current_deadline, parse_timeout_header, route_budgets
+from utils.metrics import http_deadline_exceeded_total
+from utils.metrics_middleware import UNMATCHED_ROUTE
+from utils.route_match import route_template
+
+
+class DeadlineMiddleware:
+    """
+    요청마다 마감 시간을 정하고, 예산이 소진되면 처리 중인 작업을 취소하고 504를 반환하는 순수 ASGI 미들웨어.
+    - 예산 = min(라우트 예산, 클라이언트 X-Request-Timeout-Ms, 상위 요청의 남은 예산(/batch 하위 요청 등))
+    - 마감 시간은 컨텍스트 변수로 공유되어 업스트림 호출의 타임아웃과 전달 헤더에 반영됩니다.
+    - 응답을 시작한 뒤(스트리밍 본문)에는 적용하지 않습니다. SSE는 유휴 타임아웃으로 관리합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = route_template(scope)
+        budget = route_budgets.budget_for(route)
+        requested = parse_timeout_header(Headers(scope=scope).get(DEADLINE_HEADER))
+        if requested is not None:
+            budget = min(budget, requested)
+        deadline = Deadline.after(budget)
+        parent = current_deadline.get()
+        if parent is not None and parent.expires_at < deadline.expires_at:
+            deadline = parent
+
+        started = time.perf_counter()
+        first_byte: Optional[float] = None
+        status_code: Optional[int] = None
+        completed = False
+        token = current_deadline.set(deadline)
+        try:
+            async with asyncio.timeout(deadline.remaining()) as timer:
+
+                async def send_wrapper(message: Message):
+                    nonlocal first_byte, status_code
+                    if message["type"] == "http.response.start":
+                        first_byte = time.perf_counter() - started
+                        status_code = message["status"]
+                        timer.reschedule(None)
+                    await send(message)
+
+                await self.app(scope, receive, send_wrapper)
+            completed = True
+        except TimeoutError:
+            if not timer.expired() or first_byte is not None:
+                raise
+            http_deadline_exceeded_total.inc(route or UNMATCHED_ROUTE)
+            response = JSONResponse(
+                status_code=504,
+                content={
+                    "status": "error",
+                    "message": "요청 처리 시간이 초과되었습니다.",
+                    "detail": "마감 시간 안에 처리를 완료하지 못해 작업을 중단했습니다.",
+                },
+            )
+            await response(scope, receive, send)
+        finally:
+            current_deadline.reset(token)
+            # 정상 완료된 2xx/3xx만 예산 조정에 반영합니다. 빠른 오류(401/404/422, 503 거절)나
+            # 이 미들웨어가 낸 504가 섞이면 p99가 실제 처리 시간보다 낮아져 예산이 계속 줄어듭니다.
+            if route is not None and completed and status_code is not None and status_code < 400:
+                # 스트리밍 응답은 응답 시작까지의 시간을 기준으로 예산을 조정합니다.
+                route_budgets.observe(route, first_byte)
@@ -0,0 +1,29 @@
+import hashlib
+from typing import Optional
+
+
+def compute_etag(body: bytes) -> str:
+    """압축 전 정규 응답 바이트로 강한 ETag를 계산합니다."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def weaken(etag: str) -> str:
+    """
+    표현(인코딩)이 바뀐 응답에는 약한 ETag를 사용합니다.
+    압축 본문은 원본과 바이트가 다르므로 강한 ETag를 그대로 쓸 수 없습니다.
+    """
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+def _opaque(etag: str) -> str:
+    return etag.strip()[2:] if etag.strip().startswith("W/") else etag.strip()
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """If-None-Match는 약한 비교를 사용하므로 W/ 접두사를 무시하고 비교합니다."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = _opaque(etag)
+    return any(_opaque(candidate) == target for candidate in if_none_match.split(","))
@@ -0,0 +1,75 @@
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.etag import compute_etag, etag_matches
+
+# 304 응답에 남겨 둘 헤더 (RFC 9110 15.4.5)
+_NOT_MODIFIED_HEADERS = ("etag", "vary", "cache-control", "content-location", "date", "expires")
+# CORS보다 바깥에 있으므로 CORS가 붙인 헤더도 남겨야 브라우저가 교차 출처 304를 받아들입니다.
+_NOT_MODIFIED_PREFIXES = ("access-control-",)
+
+
+def _kept_on_not_modified(name: bytes) -> bool:
+    key = name.decode("latin-1").lower()
+    return key in _NOT_MODIFIED_HEADERS or key.startswith(_NOT_MODIFIED_PREFIXES)
+
+
+class ConditionalGetMiddleware:
+    """
+    GET/HEAD 200 응답에 ETag를 붙이고, If-None-Match가 일치하면 본문 없이 304를 반환하는 순수 ASGI 미들웨어.
+    - 응답에 이미 ETag가 있으면(업스트림 검증자, 캐시 항목) 그대로 사용하고 다시 계산하지 않습니다.
+    - HEAD 응답은 본문이 비어 있어 GET과 같은 ETag를 계산할 수 없으므로, 이미 있는 ETag로만 비교합니다.
+    - 스트리밍 응답은 본문 전체를 알 수 없으므로 건드리지 않습니다.
+    압축보다 안쪽에 두어 압축 전 정규 바이트로 ETag를 계산합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        is_head = scope["method"] == "HEAD"
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: Optional[Message] = None
+        started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start_message, started
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or started:
+                await send(message)
+                return
+
+            started = True
+            headers = MutableHeaders(raw=start_message["headers"])
+            if start_message["status"] != 200 or message.get("more_body", False):
+                await send(start_message)
+                await send(message)
+                return
+
+            etag = headers.get("etag")
+            if etag is None and is_head:
+                await send(start_message)
+                await send(message)
+                return
+            if etag is None:
+                etag = compute_etag(message.get("body", b""))
+                headers["etag"] = etag
+
+            if etag_matches(if_none_match, etag):
+                kept = [(k, v) for k, v in start_message["headers"] if _kept_on_not_modified(k)]
+                await send({"type": "http.response.start", "status": 304, "headers": kept})
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+                return
+
+            await send(start_message)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
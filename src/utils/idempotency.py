@@ -0,0 +1,207 @@
+import asyncio
+import base64
+import json
+import uuid
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from configs.setting import IDEMPOTENCY_LOCK_SECONDS, IDEMPOTENCY_TTL_SECONDS
+from utils.logger import warning
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+# 모바일 클라이언트가 재시도하는 상태 변경 요청. 중복 실행 시 LLM 턴이나 인벤토리 변경이 반복됩니다.
+IDEMPOTENT_ROUTES = frozenset(
+    {
+        "/gm/turn",
+        "/state/player/item/earn",
+        "/state/player/item/use",
+        "/state/session/start",
+    }
+)
+
+# 다시 보내면 결과가 달라질 수 있는 일시적 오류는 저장하지 않습니다. (5xx 포함)
+_TRANSIENT_STATUSES = frozenset({408, 429})
+
+
+def is_replayable(status_code: int) -> bool:
+    return status_code < 500 and status_code not in _TRANSIENT_STATUSES
+
+
+class ClaimResult(str, Enum):
+    OWNER = "owner"  # 이 요청이 실제로 처리합니다.
+    CONFLICT = "conflict"  # 같은 키가 다른 요청 본문으로 사용되었습니다.
+
+
+@dataclass
+class StoredResponse:
+    status: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+
+    def to_record(self, fingerprint: str) -> Dict[str, Any]:
+        return {
+            "state": "done",
+            "fingerprint": fingerprint,
+            "status": self.status,
+            "headers": self.headers,
+            "body": base64.b64encode(self.body).decode("ascii"),
+        }
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "StoredResponse":
+        return cls(
+            status=record["status"],
+            headers=[tuple(h) for h in record["headers"]],
+            body=base64.b64decode(record["body"]),
+        )
+
+
+@dataclass
+class _Flight:
+    """이 프로세스에서 처리 중인 키. 같은 프로세스의 중복 요청은 Redis를 폴링하지 않고 이 결과를 기다립니다."""
+
+    fingerprint: str
+    future: asyncio.Future
+    pending: Optional[bytes] = None  # Redis에 기록한 처리 중 표식 (소유권 확인용)
+
+
+@dataclass
+class IdempotencyStats:
+    owners: int = 0
+    replays: int = 0
+    waits: int = 0
+    conflicts: int = 0
+    shared_errors: int = 0
+
+
+class IdempotencyStore:
+    """
+    Idempotency-Key 처리 상태를 Redis에 기록합니다.
+    - 처음 온 요청이 SET NX로 처리 중 표식을 남기고 실제로 처리한 뒤, 응답을 ttl 동안 저장합니다.
+    - 처리 중인 키로 들어온 중복 요청은 원 요청이 끝날 때까지 기다렸다가 저장된 응답을 받습니다.
+    - 원 요청이 실패(5xx, 취소)하면 표식을 지워 다음 재시도가 새로 처리되도록 합니다.
+    Redis가 연결되지 않았거나 오류가 나면 같은 프로세스 안의 중복 요청만 묶습니다.
+    """
+
+    key_prefix = "idempotency:"
+    poll_interval = 0.1
+
+    def __init__(self, ttl: int, lock_seconds: int):
+        self.ttl = ttl
+        self.lock_seconds = lock_seconds
+        self.redis = None
+        self.stats = IdempotencyStats()
+        self._flights: Dict[str, _Flight] = {}
+
+    def attach_redis(self, redis_client):
+        self.redis = redis_client
+
+    async def claim(self, key: str, fingerprint: str) -> Union[ClaimResult, StoredResponse]:
+        """키의 처리 권한을 얻거나, 이미 처리된(처리 중이면 끝날 때까지 기다린) 응답을 반환합니다."""
+        while (flight := self._flights.get(key)) is not None:
+            if flight.fingerprint != fingerprint:
+                self.stats.conflicts += 1
+                return ClaimResult.CONFLICT
+            self.stats.waits += 1
+            stored = await asyncio.shield(flight.future)
+            if stored is not None:
+                self.stats.replays += 1
+                return stored
+            # 원 요청이 저장할 응답 없이 끝났으면 이 요청이 다시 처리를 시도합니다.
+
+        flight = _Flight(fingerprint, asyncio.get_running_loop().create_future())
+        self._flights[key] = flight
+        try:
+            result = await self._claim_shared(key, flight)
+        except BaseException:
+            self._settle(key, flight, None)
+            raise
+
+        if result is ClaimResult.OWNER:
+            self.stats.owners += 1
+            return result
+        self._settle(key, flight, result if isinstance(result, StoredResponse) else None)
+        if result is ClaimResult.CONFLICT:
+            self.stats.conflicts += 1
+        else:
+            self.stats.replays += 1
+        return result
+
+    async def _claim_shared(self, key: str, flight: _Flight) -> Union[ClaimResult, StoredResponse]:
+        if self.redis is None:
+            return ClaimResult.OWNER
+
+        flight.pending = json.dumps(
+            {"state": "pending", "fingerprint": flight.fingerprint, "owner": uuid.uuid4().hex}
+        ).encode()
+        redis_key = self.key_prefix + key
+        waited = False
+        try:
+            while True:
+                if await self.redis.set(redis_key, flight.pending, nx=True, ex=self.lock_seconds):
+                    return ClaimResult.OWNER
+                raw = await self.redis.get(redis_key)
+                if raw is None:
+                    # 원 요청이 실패해 표식이 지워졌으면 다시 처리 권한을 얻습니다.
+                    continue
+                record = json.loads(raw)
+                if record["fingerprint"] != flight.fingerprint:
+                    return ClaimResult.CONFLICT
+                if record["state"] == "done":
+                    return StoredResponse.from_record(record)
+                if not waited:
+                    waited = True
+                    self.stats.waits += 1
+                await asyncio.sleep(self.poll_interval)
+        except Exception as e:
+            # 멱등성 저장소 오류로 요청을 막지 않습니다. (같은 프로세스 안의 중복만 묶입니다)
+            self.stats.shared_errors += 1
+            warning(f"Idempotency-Key 저장소 조회 실패: {e}")
+            flight.pending = None
+            return ClaimResult.OWNER
+
+    async def complete(self, key: str, stored: Optional[StoredResponse]):
+        """처리 결과를 저장하고 기다리던 중복 요청들을 깨웁니다. stored가 None이면 처리 중 표식만 지웁니다."""
+        flight = self._flights.get(key)
+        if flight is None:
+            return
+        try:
+            if self.redis is not None and flight.pending is not None:
+                await self._complete_shared(key, flight, stored)
+        finally:
+            self._settle(key, flight, stored)
+
+    async def _complete_shared(self, key: str, flight: _Flight, stored: Optional[StoredResponse]):
+        redis_key = self.key_prefix + key
+        try:
+            if stored is not None:
+                record = json.dumps(stored.to_record(flight.fingerprint)).encode()
+                await self.redis.set(redis_key, record, ex=self.ttl)
+            elif await self.redis.get(redis_key) == flight.pending:
+                # 잠금이 만료되어 다른 요청이 새로 얻은 표식은 지우지 않습니다.
+                await self.redis.delete(redis_key)
+        except Exception as e:
+            self.stats.shared_errors += 1
+            warning(f"Idempotency-Key 결과 저장 실패: {e}")
+
+    def _settle(self, key: str, flight: _Flight, stored: Optional[StoredResponse]):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.future.done():
+            flight.future.set_result(stored)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._flights),
+            "owners": self.stats.owners,
+            "replays": self.stats.replays,
+            "waits": self.stats.waits,
+            "conflicts": self.stats.conflicts,
+            "shared_errors": self.stats.shared_errors,
+        }
+
+
+idempotency_store = IdempotencyStore(IDEMPOTENCY_TTL_SECONDS, IDEMPOTENCY_LOCK_SECONDS)
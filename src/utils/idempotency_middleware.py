@@ -0,0 +1,122 @@
+import hashlib
+from typing import List, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.idempotency import (
+    IDEMPOTENCY_HEADER,
+    IDEMPOTENT_ROUTES,
+    REPLAYED_HEADER,
+    ClaimResult,
+    StoredResponse,
+    idempotency_store,
+    is_replayable,
+)
+from utils.route_match import route_template
+from utils.token_digest import token_digest
+
+_MAX_KEY_LENGTH = 255
+
+
+def _error(status_code: int, message: str, detail: str) -> JSONResponse:
+    return JSONResponse(status_code=status_code, content={"status": "error", "message": message, "detail": detail})
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks: List[bytes] = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+class IdempotencyMiddleware:
+    """
+    Idempotency-Key 헤더가 있는 상태 변경 요청(IDEMPOTENT_ROUTES)의 중복 실행을 막는 순수 ASGI 미들웨어.
+    - 키는 사용자(토큰)와 라우트 단위로 구분하고, 요청 본문 지문이 다르면 422로 거절합니다.
+    - 처리 중인 키의 중복 요청은 원 요청의 결과를 기다리고, 완료된 키는 저장된 응답을 그대로 재생합니다.
+    압축보다 안쪽에 두어 압축 전 본문을 저장하고, 벌크헤드보다 바깥에 두어 중복 요청이 슬롯을 차지하지 않게 합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        key = headers.get(IDEMPOTENCY_HEADER)
+        route = route_template(scope) if key is not None else None
+        if route not in IDEMPOTENT_ROUTES:
+            await self.app(scope, receive, send)
+            return
+
+        if not key or len(key) > _MAX_KEY_LENGTH:
+            response = _error(400, "잘못된 Idempotency-Key입니다.", f"1~{_MAX_KEY_LENGTH}자의 키를 사용해주세요.")
+            await response(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        fingerprint = hashlib.sha256(body).hexdigest()
+        token = headers.get("authorization", "").removeprefix("Bearer ").strip()
+        storage_key = hashlib.sha256(f"{token_digest(token)}:{route}:{key}".encode()).hexdigest()
+
+        result = await idempotency_store.claim(storage_key, fingerprint)
+        if result is ClaimResult.CONFLICT:
+            response = _error(
+                422,
+                "Idempotency-Key가 다른 요청에 이미 사용되었습니다.",
+                "같은 키로는 같은 요청 본문만 다시 보낼 수 있습니다.",
+            )
+            await response(scope, receive, send)
+            return
+        if isinstance(result, StoredResponse):
+            await _replay(result, send)
+            return
+
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def capture(message: Message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        stored = None
+        try:
+            await self.app(scope, replay_receive, capture)
+            if start is not None and is_replayable(start["status"]):
+                stored = StoredResponse(
+                    status=start["status"],
+                    headers=[(k.decode("latin-1"), v.decode("latin-1")) for k, v in start.get("headers", [])],
+                    body=b"".join(chunks),
+                )
+        finally:
+            await idempotency_store.complete(storage_key, stored)
+
+
+async def _replay(stored: StoredResponse, send: Send):
+    headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in stored.headers]
+    headers.append((REPLAYED_HEADER.lower().encode("latin-1"), b"true"))
+    await send({"type": "http.response.start", "status": stored.status, "headers": headers})
+    await send({"type": "http.response.body", "body": stored.body, "more_body": False})
@@ -1,16 +1,98 @@
+import importlib.util
+
 import httpx
 
-from configs.database import check_db_connection
-from configs.http_client import http_holder
-from configs.redis_conn import check_redis_connection
-from configs.setting import APP_PORT
-from utils.logger import info
+from configs.database import check_db_connection, close_db_pool, connection_pool, db_cursor_context, open_db_pool
+from configs.http_client import InstrumentedTransport, PoolStats, http_holder
+from configs.redis_conn import async_redis_client, check_redis_connection, close_redis_clients, session_redis_client
+from configs.setting import APP_PORT, ITEM_CATALOG_ENABLED
+from configs.upstreams import UPSTREAM_POOLS, PoolConfig
+from info.item_catalog import item_catalog
+from utils.idempotency import idempotency_store
+from utils.load_balancer import upstream_balancers
+from utils.logger import info, warning
+from utils.metrics import GaugeCollector, db_pool_usage, registry
+from utils.password_pool import password_pool
+from utils.redis_batcher import redis_batcher
+from utils.redis_health import redis_health
+from utils.response_cache import response_cache
+from utils.sql_registry import sql_registry
+
+
+def _build_upstream_client(name: str, config: PoolConfig) -> httpx.AsyncClient:
+    http2 = config.http2
+    if http2 and importlib.util.find_spec("h2") is None:
+        # HTTP/2는 선택 의존성(h2)이 설치된 경우에만 사용합니다.
+        warning(f"⚠️ '{name}' 업스트림에 HTTP/2가 설정되었지만 h2 패키지가 없어 HTTP/1.1을 사용합니다.")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+    stats = PoolStats(config.max_connections)
+    http_holder.pool_stats[name] = stats
+    return httpx.AsyncClient(
+        transport=InstrumentedTransport(httpx.AsyncHTTPTransport(limits=limits, http2=http2), stats),
+        timeout=httpx.Timeout(
+            connect=config.connect_timeout,
+            read=config.read_timeout,
+            write=config.read_timeout,
+            pool=config.pool_timeout,
+        ),
+    )
 
 
 def _initialize_http_client():
     info("HTTP 클라이언트를 구성합니다...")
+    # 등록되지 않은 업스트림용 공용 클라이언트
     http_holder.client = httpx.AsyncClient(
-        timeout=httpx.Timeout(10.0), limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        timeout=httpx.Timeout(60.0), limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    for name, config in UPSTREAM_POOLS.items():
+        http_holder.clients[name] = _build_upstream_client(name, config)
+
+
+def _initialize_session_store():
+    info("세션 저장소의 Redis 파이프라인 배처와 백그라운드 상태 확인을 시작합니다...")
+    redis_batcher.attach_redis(session_redis_client)
+    redis_health.start(session_redis_client)
+
+
+def _initialize_response_cache():
+    info("프록시 응답 캐시의 Redis 계층을 연결합니다...")
+    response_cache.attach_redis(async_redis_client)
+
+
+def _initialize_idempotency_store():
+    info("Idempotency-Key 저장소의 Redis 계층을 연결합니다...")
+    idempotency_store.attach_redis(async_redis_client)
+
+
+async def _load_item_catalog():
+    if not ITEM_CATALOG_ENABLED:
+        return
+    info("아이템 카탈로그를 메모리에 적재하고 변경 알림을 구독합니다...")
+    await item_catalog.start(db_cursor_context, async_redis_client)
+
+
+def _register_pool_metrics():
+    registry.register(
+        GaugeCollector(
+            "db_pool_connections",
+            "PostgreSQL 커넥션 풀 사용량",
+            ("state",),
+            lambda: db_pool_usage(connection_pool),
+        )
+    )
+    registry.register(
+        GaugeCollector(
+            "http_pool_in_flight",
+            "업스트림 HTTP 커넥션 풀의 진행 중 요청 수",
+            ("upstream",),
+            lambda: [((name,), stats.in_flight) for name, stats in http_holder.pool_stats.items()],
+        )
     )
 
 
@@ -21,14 +103,30 @@ def _print_startup_message():
     print("⭐" * 40 + "\n")
 
 
-def startup_event_handler():
-    check_db_connection()
-    check_redis_connection()
+async def startup_event_handler():
+    # 첫 로그인 요청이 워커 기동을 기다리지 않도록 비밀번호 해시 워커를 미리 띄웁니다.
+    password_pool.start()
+    sql_registry.load()
+    await open_db_pool()
+    await check_db_connection()
+    await check_redis_connection()
+    _initialize_session_store()
     _initialize_http_client()
+    _initialize_response_cache()
+    _initialize_idempotency_store()
+    await _load_item_catalog()
+    upstream_balancers.start_discovery()
+    _register_pool_metrics()
     _print_startup_message()
 
 
 async def shutdown_event_handler():
-    await http_holder.client.aclose()
+    await upstream_balancers.stop_discovery()
+    await item_catalog.stop()
+    await redis_health.stop()
+    password_pool.shutdown()
+    await http_holder.aclose()
     info("HTTP 클라이언트 종료 중...")
+    await close_db_pool()
+    await close_redis_clients()
     info("BE router 종료 중...")
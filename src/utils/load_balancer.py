@@ -0,0 +1,241 @@
+import asyncio
+import bisect
+import hashlib
+import math
+import random
+import socket
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from configs.setting import UPSTREAM_DNS_REFRESH_SECONDS
+from configs.upstreams import UPSTREAM_DISCOVERY, UPSTREAM_URLS, DiscoveryConfig
+from utils.logger import info, warning
+
+_MAX_EJECTION_MULTIPLIER = 10
+
+# 요청 단위 친화성(affinity) 키. 설정되어 있으면 이 키의 일관 해시로 인스턴스를 고릅니다.
+affinity_key: ContextVar[Optional[str]] = ContextVar("affinity_key", default=None)
+
+
+@contextmanager
+def session_affinity(key: str):
+    """블록 안의 업스트림 호출을 key(예: session_id)에 고정된 인스턴스로 보냅니다."""
+    token = affinity_key.set(key)
+    try:
+        yield
+    finally:
+        affinity_key.reset(token)
+
+
+def _ring_hash(value: str) -> int:
+    # 내장 hash()는 프로세스마다 달라지므로 라우터 인스턴스 간에 같은 결과를 내는 해시를 사용합니다.
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class Endpoint:
+    """업스트림 인스턴스 하나의 진행 중 요청 수와 이상치(outlier) 상태"""
+
+    def __init__(self, url: str, host: Optional[str] = None):
+        self.url = url
+        # DNS로 찾은 인스턴스는 IP로 접속하므로 원래 호스트(base_url의 호스트:포트)를 기억해 두었다가
+        # Host 헤더와 TLS SNI로 보내, 가상 호스트 라우팅과 인증서 검증이 IP가 아닌 원래 이름으로 이루어지게 합니다.
+        self.host = host
+        self.outstanding = 0
+        self.requests = 0
+        self.consecutive_failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+
+    @property
+    def sni_hostname(self) -> Optional[str]:
+        return urlsplit(f"//{self.host}").hostname if self.host else None
+
+    def is_available(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "consecutive_failures": self.consecutive_failures,
+            "ejections": self.ejections,
+            "ejected": not self.is_available(now),
+        }
+
+
+class LoadBalancer:
+    """
+    클라이언트 측 부하 분산기.
+    - least_outstanding: 진행 중 요청이 가장 적은 인스턴스를 고릅니다.
+    - p2c: 무작위로 두 인스턴스를 골라 진행 중 요청이 적은 쪽을 사용합니다 (power-of-two-choices).
+    - 친화성 키가 주어지면 전략과 무관하게 bounded-load 일관 해시로 고릅니다.
+    연속 실패가 누적된 인스턴스는 일정 시간 제외하되(passive outlier ejection),
+    max_ejection_percent를 넘겨 제외하지 않아 전체 인스턴스가 빠지는 일이 없도록 합니다.
+    """
+
+    def __init__(self, name: str, config: DiscoveryConfig):
+        self.name = name
+        self.config = config
+        self.endpoints: List[Endpoint] = [Endpoint(url) for url in config.endpoints]
+        self._ring: List[Tuple[int, Endpoint]] = []
+        self._ring_hashes: List[int] = []
+        self._build_ring()
+
+    def _build_ring(self):
+        # 인스턴스 URL 기반 가상 노드로 링을 구성하므로 인스턴스가 추가/제거되어도 나머지 키의 배치는 유지됩니다.
+        self._ring = sorted(
+            ((_ring_hash(f"{e.url}#{i}"), e) for e in self.endpoints for i in range(self.config.hash_replicas)),
+            key=lambda node: node[0],
+        )
+        self._ring_hashes = [h for h, _ in self._ring]
+
+    def pick(self, key: Optional[str] = None) -> Endpoint:
+        now = time.monotonic()
+        candidates = [e for e in self.endpoints if e.is_available(now)] or self.endpoints
+        if len(candidates) == 1:
+            chosen = candidates[0]
+        elif key is not None:
+            chosen = self._pick_by_hash(key, candidates)
+        elif self.config.strategy == "least_outstanding":
+            fewest = min(e.outstanding for e in candidates)
+            chosen = random.choice([e for e in candidates if e.outstanding == fewest])
+        else:
+            first, second = random.sample(candidates, 2)
+            chosen = first if first.outstanding <= second.outstanding else second
+
+        chosen.outstanding += 1
+        chosen.requests += 1
+        return chosen
+
+    def _pick_by_hash(self, key: str, candidates: List[Endpoint]) -> Endpoint:
+        """
+        bounded-load 일관 해시: 링에서 key 위치부터 시계 방향으로 돌며,
+        진행 중 요청이 (전체 진행 중 요청 + 1) / 인스턴스 수 x hash_load_factor 미만인 첫 인스턴스를 고릅니다.
+        평소에는 같은 키가 항상 같은 인스턴스로 가고, 한 인스턴스에 몰릴 때만 다음 인스턴스로 넘칩니다.
+        """
+        allowed = {id(e) for e in candidates}
+        total = sum(e.outstanding for e in candidates) + 1
+        capacity = math.ceil(total * self.config.hash_load_factor / len(candidates))
+
+        start = bisect.bisect(self._ring_hashes, _ring_hash(key))
+        for offset in range(len(self._ring)):
+            endpoint = self._ring[(start + offset) % len(self._ring)][1]
+            if id(endpoint) in allowed and endpoint.outstanding < capacity:
+                return endpoint
+        return min(candidates, key=lambda e: e.outstanding)
+
+    def release(self, endpoint: Endpoint, ok: Optional[bool]):
+        """ok=None은 결과를 알 수 없는 경우(취소 등)로, 이상치 판단에 반영하지 않습니다."""
+        endpoint.outstanding = max(0, endpoint.outstanding - 1)
+        if ok is None:
+            return
+        if ok:
+            endpoint.consecutive_failures = 0
+            return
+
+        endpoint.consecutive_failures += 1
+        if endpoint.consecutive_failures >= self.config.consecutive_failures:
+            self._eject(endpoint)
+
+    def _eject(self, endpoint: Endpoint):
+        now = time.monotonic()
+        if not endpoint.is_available(now):
+            return
+        ejected = sum(1 for e in self.endpoints if not e.is_available(now))
+        if (ejected + 1) * 100 > len(self.endpoints) * self.config.max_ejection_percent:
+            return
+
+        endpoint.ejections += 1
+        multiplier = min(endpoint.ejections, _MAX_EJECTION_MULTIPLIER)
+        endpoint.ejected_until = now + self.config.base_ejection_seconds * multiplier
+        endpoint.consecutive_failures = 0
+        warning(f"⚠️ 업스트림 '{self.name}' 인스턴스 {endpoint.url}를 일시적으로 제외합니다. (x{multiplier})")
+
+    def update(self, urls: Iterable[str], host: Optional[str] = None):
+        """DNS 조회 결과로 인스턴스 목록을 교체합니다. 기존 인스턴스의 상태는 유지합니다."""
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return
+        existing = {e.url: e for e in self.endpoints}
+        self.endpoints = [existing.get(url) or Endpoint(url, host) for url in urls]
+        for endpoint in self.endpoints:
+            endpoint.host = host
+        self._build_ring()
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "strategy": self.config.strategy,
+            "endpoints": [e.snapshot(now) for e in self.endpoints],
+        }
+
+
+async def resolve_endpoints(base_url: str, host: str) -> List[str]:
+    """host의 A/AAAA 레코드를 조회해 base_url의 스킴/포트/경로를 사용하는 인스턴스 URL 목록을 만듭니다."""
+    parts = urlsplit(base_url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    loop = asyncio.get_running_loop()
+    infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    urls = []
+    for family, _, _, _, sockaddr in infos:
+        address = f"[{sockaddr[0]}]" if family == socket.AF_INET6 else sockaddr[0]
+        urls.append(f"{parts.scheme}://{address}:{port}{parts.path.rstrip('/')}")
+    return sorted(set(urls))
+
+
+class UpstreamBalancerRegistry:
+    """인스턴스가 여러 개로 설정된 업스트림에만 부하 분산기를 둡니다. 단일 인스턴스는 기존 URL을 그대로 사용합니다."""
+
+    def __init__(self, configs: Dict[str, DiscoveryConfig]):
+        self._configs = configs
+        self._balancers: Dict[str, LoadBalancer] = {
+            name: LoadBalancer(name, config) for name, config in configs.items() if config.balanced
+        }
+        self._discovery: Optional[asyncio.Task] = None
+
+    def get(self, name: str) -> Optional[LoadBalancer]:
+        return self._balancers.get(name)
+
+    async def refresh(self):
+        for name, balancer in self._balancers.items():
+            host = self._configs[name].dns_host
+            if not host:
+                continue
+            base_url = UPSTREAM_URLS[name]
+            try:
+                balancer.update(await resolve_endpoints(base_url, host), host=urlsplit(base_url).netloc)
+            except OSError as e:
+                # 조회 실패 시 마지막으로 알려진 목록을 계속 사용합니다.
+                warning(f"⚠️ 업스트림 '{name}' DNS 조회 실패 ({host}): {e}")
+
+    def start_discovery(self):
+        if self._discovery is not None or not any(c.dns_host for c in self._configs.values() if c.balanced):
+            return
+
+        async def _loop():
+            while True:
+                await self.refresh()
+                await asyncio.sleep(UPSTREAM_DNS_REFRESH_SECONDS)
+
+        info("업스트림 인스턴스 DNS 조회를 시작합니다...")
+        self._discovery = asyncio.create_task(_loop())
+
+    async def stop_discovery(self):
+        if self._discovery is None:
+            return
+        self._discovery.cancel()
+        try:
+            await self._discovery
+        except asyncio.CancelledError:
+            pass
+        self._discovery = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: balancer.snapshot() for name, balancer in self._balancers.items()}
+
+
+upstream_balancers = UpstreamBalancerRegistry(UPSTREAM_DISCOVERY)
@@ -0,0 +1,221 @@
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Prometheus 기본 버킷 (초 단위)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Redis 명령은 대부분 밀리초 이하이므로 더 촘촘한 버킷을 사용합니다.
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5)
+
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Sequence[str]) -> Tuple[str, ...]:
+        if len(labels) != len(self.label_names):
+            raise ValueError(f"{self.name}: 라벨 개수가 맞지 않습니다. ({self.label_names})")
+        return tuple(str(label) for label in labels)
+
+    def samples(self) -> Iterable[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, dict(zip(self.label_names, key, strict=True)), value
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 조합별 [버킷별 개수..., +Inf 개수], 합계
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, seconds: float, *labels: str):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+                self._sums[key] = 0.0
+            counts[index] += 1
+            self._sums[key] += seconds
+
+    def count(self, *labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            items = [(key, list(counts), self._sums[key]) for key, counts in self._counts.items()]
+        for key, counts, total in items:
+            labels = dict(zip(self.label_names, key, strict=True))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts, strict=True):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_count", labels, cumulative
+            yield f"{self.name}_sum", labels, total
+
+
+class GaugeCollector(_Metric):
+    """스크레이프 시점에 값을 읽어오는 게이지. 이미 다른 곳에서 집계 중인 상태를 노출할 때 사용합니다."""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str],
+        collect: Callable[[], Iterable[Tuple[Sequence[str], float]]],
+    ):
+        super().__init__(name, documentation, label_names)
+        self._collect = collect
+
+    def samples(self) -> Iterable[Sample]:
+        for labels, value in self._collect():
+            yield self.name, dict(zip(self.label_names, self._key(labels), strict=True)), value
+
+
+class MetricsRegistry:
+    """Prometheus 텍스트 노출 형식(0.0.4)으로 지표를 렌더링하는 레지스트리."""
+
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        # 재등록 시 최신 정의로 교체합니다 (수집 함수가 바뀌는 풀 게이지 등).
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self._metrics.values()):
+            try:
+                samples = list(metric.samples())
+            except Exception:
+                # 수집 함수 하나의 오류로 전체 스크레이프가 실패하지 않도록 합니다.
+                continue
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for name, labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# --- 라우트 ---
+http_requests_total = registry.register(
+    Counter("http_requests_total", "라우트별 요청 수", ("method", "route", "status"))
+)
+http_request_duration_seconds = registry.register(
+    Histogram("http_request_duration_seconds", "라우트별 요청 처리 시간", ("method", "route"))
+)
+http_deadline_exceeded_total = registry.register(
+    Counter("http_deadline_exceeded_total", "마감 시간 초과로 중단된 요청 수", ("route",))
+)
+
+# --- 업스트림 ---
+upstream_requests_total = registry.register(
+    Counter("upstream_requests_total", "업스트림 호출 수", ("upstream", "kind", "outcome"))
+)
+upstream_request_duration_seconds = registry.register(
+    Histogram(
+        "upstream_request_duration_seconds",
+        "업스트림 호출 시간 (스트림은 응답 헤더 수신까지)",
+        ("upstream", "kind"),
+    )
+)
+
+# --- Redis ---
+redis_command_duration_seconds = registry.register(
+    Histogram("redis_command_duration_seconds", "Redis 명령 실행 시간", ("client", "command"), buckets=FAST_BUCKETS)
+)
+
+# --- PostgreSQL ---
+db_pool_wait_seconds = registry.register(
+    Histogram("db_pool_wait_seconds", "DB 커넥션 풀에서 커넥션을 빌리기까지 기다린 시간", buckets=FAST_BUCKETS)
+)
+db_connection_hold_seconds = registry.register(
+    Histogram("db_connection_hold_seconds", "DB 커넥션을 빌린 뒤 반납하기까지의 시간", ("release",))
+)
+
+
+def status_class(status_code: int) -> str:
+    """라벨 카디널리티를 고정하기 위해 상태 코드를 2xx/4xx 형태로 묶습니다."""
+    return f"{status_code // 100}xx"
+
+
+def observe_upstream(upstream: str, kind: str, outcome: str, seconds: float):
+    upstream_requests_total.inc(upstream, kind, outcome)
+    upstream_request_duration_seconds.observe(seconds, upstream, kind)
+
+
+def db_pool_usage(pool) -> List[Tuple[Sequence[str], float]]:
+    """psycopg AsyncConnectionPool의 사용 중/유휴/최대 커넥션 수와 커넥션 대기 요청 수를 읽습니다."""
+    stats = pool.get_stats()
+    return [
+        (("in_use",), stats["pool_size"] - stats["pool_available"]),
+        (("idle",), stats["pool_available"]),
+        (("max",), stats["pool_max"]),
+        (("waiting",), stats.get("requests_waiting", 0)),
+    ]
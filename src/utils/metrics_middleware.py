@@ -0,0 +1,44 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.metrics import http_request_duration_seconds, http_requests_total, status_class
+
+# 라우트에 매칭되지 않은 요청(404 스캔 등)은 하나의 라벨로 묶어 카디널리티를 고정합니다.
+UNMATCHED_ROUTE = "__unmatched__"
+_KNOWN_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+
+
+class MetricsMiddleware:
+    """
+    라우트별 요청 수/처리 시간을 기록하는 순수 ASGI 미들웨어.
+    BaseHTTPMiddleware와 달리 응답 본문을 감싸지 않으므로 스트리밍 응답에도 부하가 거의 없습니다.
+    라우트 라벨에는 실제 경로가 아닌 경로 템플릿(예: /state/session/{session_id})을 사용합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 라우터가 매칭 결과를 scope에 기록하므로 응답이 끝난 뒤에 읽습니다.
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            method = scope["method"] if scope["method"] in _KNOWN_METHODS else "OTHER"
+            http_requests_total.inc(method, route_path, status_class(status_code))
+            http_request_duration_seconds.observe(time.perf_counter() - started, method, route_path)
@@ -0,0 +1,114 @@
+import asyncio
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.context import ForkServerContext, ForkServerProcess
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, status
+
+from configs.bulkheads import Priority
+from utils import password_worker
+from utils.bulkhead import Bulkhead, BulkheadRejected, bulkheads
+from utils.logger import info
+from utils.metrics import Histogram, registry
+
+password_hash_seconds = registry.register(
+    Histogram(
+        "password_hash_seconds",
+        "비밀번호 해시/검증 시간 (wait: 풀 대기, run: 워커 실행)",
+        ("operation", "stage"),
+    )
+)
+
+
+class _WorkerProcess(ForkServerProcess):
+    """
+    forkserver/spawn 자식 프로세스는 부모의 __main__을 다시 실행합니다. (main.py를 직접 실행하면 터널/DB 연결까지)
+    프로세스를 띄우는 동안만 __main__을 워커 진입 모듈로 바꿔, 포크 서버와 워커가 main 대신 그 모듈만 불러오게 합니다.
+    """
+
+    def start(self):
+        main = sys.modules["__main__"]
+        sys.modules["__main__"] = password_worker
+        try:
+            super().start()
+        finally:
+            sys.modules["__main__"] = main
+
+
+class _WorkerContext(ForkServerContext):
+    Process = _WorkerProcess
+
+
+class PasswordPool:
+    """
+    bcrypt 해시/검증을 이벤트 루프 밖의 프로세스 풀에서 실행합니다.
+    - 워커 수와 대기열 길이는 "password" 벌크헤드 설정을 따르며, 대기열이 가득 차면 503으로 바로 거절합니다.
+      로그인이 몰려도 CPU를 전부 차지하지 않고, 대기 중인 요청 수는 bulkhead_requests 지표로 확인할 수 있습니다.
+    - 워커는 forkserver 방식으로 만듭니다. 이벤트 루프와 터널 스레드가 도는 서버 프로세스를 직접 fork하지 않고,
+      단일 스레드 포크 서버에서 워커 진입 모듈(utils.password_worker)만 불러온 프로세스를 만듭니다.
+    """
+
+    def __init__(self, bulkhead: Bulkhead):
+        self.bulkhead = bulkhead
+        self._executor: Optional[Executor] = None
+
+    @property
+    def workers(self) -> int:
+        return self.bulkhead.config.max_concurrent
+
+    def start(self):
+        if self._executor is not None:
+            return
+        info(f"비밀번호 해시 프로세스 풀을 시작합니다... (워커 {self.workers}개)")
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_WorkerContext())
+        # 첫 작업 제출 시점에 포크 서버와 워커가 생성되므로 빈 작업으로 미리 띄워 첫 요청이 기다리지 않게 합니다.
+        self._executor.submit(password_worker.noop).result()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, operation: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """벌크헤드 슬롯을 얻은 뒤 워커 프로세스에서 fn을 실행합니다."""
+        if self._executor is None:
+            self.start()
+
+        arrived = time.monotonic()
+        try:
+            await self.bulkhead.acquire(Priority.INTERACTIVE)
+        except BulkheadRejected as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(e.retry_after)},
+            ) from None
+
+        admitted = time.monotonic()
+        password_hash_seconds.observe(admitted - arrived, operation, "wait")
+        future = asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        try:
+            result = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # 실행 중인 워커는 멈출 수 없으므로 작업이 실제로 끝날 때 슬롯을 반환합니다.
+            future.add_done_callback(lambda _: self.bulkhead.release(None))
+            raise
+        except BaseException:
+            self.bulkhead.release(None)
+            raise
+
+        elapsed = time.monotonic() - admitted
+        password_hash_seconds.observe(elapsed, operation, "run")
+        self.bulkhead.release(elapsed)
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self.run("hash", password_worker.get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run("verify", password_worker.verify_password, plain_password, hashed_password)
+
+
+password_pool = PasswordPool(bulkheads.get("password"))
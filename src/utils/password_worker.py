@@ -0,0 +1,13 @@
+"""
+비밀번호 해시 워커 프로세스의 진입 모듈.
+워커는 main 대신 이 모듈을 __main__으로 불러오므로, 서버 모듈(터널/DB/Redis 연결)을 import하지 않고
+bcrypt 해시/검증에 필요한 passlib만 적재합니다. 이 모듈에는 서버 모듈 import를 추가하지 마세요.
+"""
+
+from auth.utils.crypt_utils import get_password_hash, verify_password
+
+__all__ = ["get_password_hash", "noop", "verify_password"]
+
+
+def noop():
+    return None
@@ -1,56 +1,231 @@
+import json as jsonlib
+import random
+import time
+from functools import lru_cache
+from typing import Any, Optional
+
 import httpx
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter, ValidationError
+from starlette.responses import Response
 
 from configs.http_client import http_holder
-from utils.logger import debug
+from configs.setting import PASSTHROUGH_VALIDATION_SAMPLE_RATE
+from configs.upstreams import upstream_name
+from utils.compression import negotiated_encoding
+from utils.deadline import DeadlineExceeded, bounded_timeout, current_deadline, deadline_headers
+from utils.etag import weaken
+from utils.load_balancer import affinity_key, upstream_balancers
+from utils.logger import debug, warning
+from utils.metrics import observe_upstream, status_class, upstream_requests_total
+from utils.response_cache import CacheEntry, CachePolicy, request_key, response_cache
+from utils.retry_policy import RetryPolicy, call_with_retry
+from utils.single_flight import upstream_flights
+from utils.token_digest import token_digest
+from utils.upstream_guard import upstream_guards
+
+
+async def proxy_request(
+    method: str,
+    base_url: str,
+    path: str,
+    token: str = None,
+    params=None,
+    json=None,
+    cache: Optional[CachePolicy] = None,
+    passthrough: bool = False,
+    response_model: Any = None,
+    retry: Optional[RetryPolicy] = None,
+):
+    """
+    마이크로서비스로 요청을 전달하는 공통 비동기 메서드.
+    cache 정책이 지정된 GET 요청은 2단계 응답 캐시를 거치며,
+    동시에 들어온 같은 토큰의 동일한 GET 요청은 하나의 업스트림 호출을 공유합니다.
 
-async def proxy_request(method: str, base_url: str, path: str, token: str = None, params=None, json=None):
-    """마이크로서비스로 요청을 전달하는 공통 비동기 메서드"""
+    passthrough=True이면 업스트림 응답 바이트를 파싱/재직렬화 없이 그대로 반환합니다.
+    이때 response_model이 주어지면 일부 응답만 표본으로 골라 모델 검증을 수행합니다.
+    retry 정책은 GET과 idempotent=True로 명시한 요청에만 적용됩니다.
+    """
     url = f"{base_url}{path}"
-    headers = {}
+    upstream = upstream_name(base_url)
     debug(f"proxy_url: {url}")
 
+    async def _attempt() -> httpx.Response:
+        return await _send(upstream, method, base_url, path, token, params, json)
+
+    async def _call() -> httpx.Response:
+        if retry is not None and retry.applies_to(method):
+            return await call_with_retry(retry, upstream_guards.get(upstream), _attempt)
+        return await _attempt()
+
+    if method.upper() != "GET":
+        return _finish(url, await _call(), passthrough, response_model)
+
+    # 공유 호출의 결과는 그 호출을 인증한 토큰으로 받은 것이므로, 전역 캐시 대상이라도 토큰별로만 묶습니다.
+    # (다른 토큰의 요청이 합류하면 검증되지 않은 토큰이 남의 인증으로 응답을 받게 됩니다.)
+    flight_key = request_key(method, url, params, token_digest(token))
+
+    async def _fetch_shared() -> httpx.Response:
+        return await upstream_flights.do(flight_key, _call)
+
+    if cache is None:
+        return _finish(url, await _fetch_shared(), passthrough, response_model)
+
+    async def _fetch():
+        response = await _fetch_shared()
+        return response.content, response.headers.get("content-type", "application/json")
+
+    key = response_cache.build_key(method, url, params, token, cache)
+    # 패스스루 응답만 사전 압축 본문을 사용하므로, 그때만 협상된 인코딩을 넘겨 해당 본문을 만들어 둡니다.
+    entry = await response_cache.get_or_fetch(key, cache, _fetch, negotiated_encoding.get() if passthrough else None)
+    if passthrough:
+        return _cached_passthrough(url, entry, response_model)
+    try:
+        return jsonlib.loads(entry.body)
+    except ValueError:
+        return {"raw": entry.body.decode(errors="replace")}
+
+
+async def _send(
+    upstream: str,
+    method: str,
+    base_url: str,
+    path: str,
+    token: Optional[str],
+    params,
+    json,
+) -> httpx.Response:
+    """
+    업스트림 요청을 보내고, 오류 응답은 HTTPException으로 변환합니다.
+    업스트림별 서킷 브레이커가 열려 있거나 동시성 한도를 넘으면 호출하지 않고 즉시 503을 반환합니다.
+    인스턴스가 여러 개인 업스트림은 부하 분산기가 고른 인스턴스로 보냅니다.
+    요청 마감 시간이 있으면 남은 예산을 헤더로 전달하고 타임아웃을 그 이하로 줄이며, 예산이 없으면 504를 반환합니다.
+    """
+    deadline = current_deadline.get()
+    if deadline is not None and deadline.expired:
+        upstream_requests_total.inc(upstream, "request", "deadline_exceeded")
+        raise DeadlineExceeded()
+
+    headers = deadline_headers()
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    client = http_holder.client
+    request_kwargs = {"json": json}
+
+    client = http_holder.get(upstream)
     if not client:
         raise HTTPException(status_code=503, detail="HTTP 클라이언트가 준비되지 않았습니다.")
+    if deadline is not None:
+        # 풀 기본 타임아웃을 남은 예산 이하로 줄여, 클라이언트가 포기한 요청을 업스트림에서 계속 기다리지 않습니다.
+        request_kwargs["timeout"] = bounded_timeout(client.timeout)
 
+    guard = upstream_guards.get(upstream)
+    try:
+        permit = guard.acquire()
+    except HTTPException:
+        upstream_requests_total.inc(upstream, "request", "rejected")
+        raise
+
+    balancer = upstream_balancers.get(upstream)
+    endpoint = balancer.pick(affinity_key.get()) if balancer else None
+    url = f"{endpoint.url if endpoint else base_url}{path}"
+    if endpoint is not None and endpoint.host:
+        # IP로 접속하는 인스턴스에도 원래 호스트 이름으로 요청합니다. (가상 호스트, TLS 인증서 검증)
+        headers["Host"] = endpoint.host
+        request_kwargs["extensions"] = {"sni_hostname": endpoint.sni_hostname}
+
+    ok = None
+    outcome = None
+    started = time.perf_counter()
     try:
         response = await client.request(
             method=method,
             url=url,
             headers=headers,
             params=params,
-            json=json,
-            timeout=60.0,
+            **request_kwargs,
         )
-
-        if response.status_code >= 400:
-            detail = "원격 서비스 오류"
-            try:
-                body = response.json()
-                if isinstance(body, dict):
-                    detail = (
-                        body.get("detail")
-                        or body.get("message")
-                        or (body.get("data", {}) or {}).get("detail")
-                        or detail
-                    )
-            except Exception:
-                if response.text:
-                    detail = response.text
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=detail,
-            )
-        try:
-            return response.json()
-        except Exception:
-            return {"raw": response.text}
-
+        ok = response.status_code < 500
+        outcome = status_class(response.status_code)
     except httpx.RequestError as exc:
+        if isinstance(exc, httpx.TimeoutException) and deadline is not None and deadline.expired:
+            # 요청 예산이 짧아 끊은 호출은 업스트림 장애로 집계하지 않습니다.
+            outcome = "deadline_exceeded"
+            raise DeadlineExceeded() from None
+        ok = False
+        outcome = "network_error"
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=f"마이크로서비스 연결 실패: {exc}"
         ) from None
+    finally:
+        guard.release(permit, ok)
+        if endpoint is not None:
+            balancer.release(endpoint, ok)
+        if outcome is not None:
+            observe_upstream(upstream, "request", outcome, time.perf_counter() - started)
+
+    if response.status_code >= 400:
+        detail = "원격 서비스 오류"
+        try:
+            body = response.json()
+            if isinstance(body, dict):
+                detail = (
+                    body.get("detail") or body.get("message") or (body.get("data", {}) or {}).get("detail") or detail
+                )
+        except Exception:
+            if response.text:
+                detail = response.text
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=detail,
+        )
+    return response
+
+
+def _finish(url: str, response: httpx.Response, passthrough: bool, response_model: Any):
+    if passthrough:
+        content_type = response.headers.get("content-type", "application/json")
+        # 업스트림이 검증자(ETag)를 제공하면 다시 계산하지 않고 그대로 사용합니다.
+        etag = response.headers.get("etag")
+        return _passthrough(url, response.content, response.status_code, content_type, response_model, etag)
+    return _decode(response)
+
+
+def _passthrough(
+    url: str, body: bytes, status_code: int, content_type: str, response_model: Any, etag: Optional[str] = None
+) -> Response:
+    """업스트림 바이트를 그대로 응답으로 만듭니다. 응답 모델 검증은 표본으로만 수행합니다."""
+    if response_model is not None and random.random() < PASSTHROUGH_VALIDATION_SAMPLE_RATE:
+        try:
+            _adapter(response_model).validate_json(body)
+        except ValidationError as e:
+            warning(f"⚠️ 패스스루 응답이 응답 모델과 일치하지 않습니다 ({url}): {e.error_count()}개 오류")
+    headers = {"ETag": etag} if etag else None
+    return Response(content=body, status_code=status_code, media_type=content_type, headers=headers)
+
+
+def _cached_passthrough(url: str, entry: CacheEntry, response_model: Any) -> Response:
+    """캐시 항목을 응답으로 만듭니다. 클라이언트가 받을 수 있는 사전 압축 본문이 있으면 그대로 사용합니다."""
+    response = _passthrough(url, entry.body, 200, entry.content_type, response_model, entry.etag)
+    encoding = negotiated_encoding.get()
+    encoded = entry.encoded.get(encoding) if encoding else None
+    if encoded is not None:
+        response.body = encoded
+        response.headers["content-encoding"] = encoding
+        response.headers["content-length"] = str(len(encoded))
+        response.headers["vary"] = "Accept-Encoding"
+        if entry.etag:
+            response.headers["etag"] = weaken(entry.etag)
+    return response
+
+
+@lru_cache(maxsize=64)
+def _adapter(response_model: Any) -> TypeAdapter:
+    return TypeAdapter(response_model)
+
+
+def _decode(response: httpx.Response):
+    try:
+        return response.json()
+    except Exception:
+        return {"raw": response.text}
@@ -1,30 +1,202 @@
+import asyncio
+import json
+import re
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
 import httpx
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
 
 from configs.http_client import http_holder
+from configs.setting import SSE_HEARTBEAT_SECONDS, SSE_IDLE_TIMEOUT_SECONDS, SSE_QUEUE_SIZE
+from configs.upstreams import upstream_name
+from utils.deadline import capped
+from utils.load_balancer import affinity_key, upstream_balancers
+from utils.metrics import GaugeCollector, observe_upstream, registry, status_class, upstream_requests_total
+from utils.upstream_guard import upstream_guards
+
+# SSE 이벤트는 빈 줄로 구분됩니다.
+_EVENT_DELIMITER = re.compile(rb"\r\n\r\n|\n\n|\r\r")
+# 구분자 없이 이 크기를 넘으면 SSE가 아닌 응답으로 보고 그대로 흘려보냅니다.
+_MAX_EVENT_BYTES = 1024 * 1024
+_HEARTBEAT_FRAME = b": heartbeat\n\n"
+_END = object()
+
+
+class StreamStats:
+    """중계 중인 스트림 수와 종료 사유를 집계합니다."""
+
+    def __init__(self):
+        self.active = 0
+        self.total = 0
+        self.client_disconnects = 0
+        self.idle_timeouts = 0
+        self.upstream_errors = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "total": self.total,
+            "client_disconnects": self.client_disconnects,
+            "idle_timeouts": self.idle_timeouts,
+            "upstream_errors": self.upstream_errors,
+        }
+
+
+stream_stats = StreamStats()
+registry.register(
+    GaugeCollector("sse_active_streams", "중계 중인 SSE 스트림 수", (), lambda: [((), stream_stats.active)])
+)
+
+
+def sse_error_frame(message: str, status_code: Optional[int] = None) -> bytes:
+    """클라이언트가 일반 이벤트와 구분할 수 있는 `event: error` 프레임을 만듭니다."""
+    data = json.dumps({"status_code": status_code, "message": message}, ensure_ascii=False)
+    return f"event: error\ndata: {data}\n\n".encode()
+
 
+def split_events(buffer: bytes) -> tuple[list[bytes], bytes]:
+    """버퍼에서 완성된 SSE 이벤트들을 잘라내고, 남은 미완성 조각을 함께 반환합니다."""
+    events = []
+    while True:
+        match = _EVENT_DELIMITER.search(buffer)
+        if not match:
+            break
+        events.append(buffer[: match.end()])
+        buffer = buffer[match.end() :]
 
-async def proxy_stream(base_url: str, path: str, token: str, params=None):
-    """마이크로서비스의 스트리밍 응답을 중계하는 메서드"""
-    url = f"{base_url}{path}"
-    headers = {"Authorization": f"Bearer {token}"}
+    if len(buffer) > _MAX_EVENT_BYTES:
+        events.append(buffer)
+        buffer = b""
+    return events, buffer
 
-    client = http_holder.client
+
+async def proxy_stream(base_url: str, path: str, token: str, params=None, request: Optional[Request] = None):
+    """
+    마이크로서비스의 SSE 스트리밍 응답을 이벤트 단위로 중계하는 메서드.
+    - 업스트림 오류는 `event: error` 프레임으로 전달합니다.
+    - 이벤트가 없는 동안 하트비트 주석을 보내고, 유휴 시간이 길어지면 스트림을 종료합니다.
+    - 클라이언트 연결이 끊기면 업스트림 스트림을 즉시 닫습니다.
+    - 큐 크기를 제한해 클라이언트가 느리면 업스트림 읽기도 늦춥니다(배압).
+    """
+    headers = {"Authorization": f"Bearer {token}", "Accept": "text/event-stream"}
+
+    upstream = upstream_name(base_url)
+    client = http_holder.get(upstream)
     if not client:
         raise HTTPException(status_code=503, detail="HTTP 클라이언트가 준비되지 않았습니다.")
 
-    # 스트림 전용 제너레이터 정의
-    async def stream_generator():
+    # 스트림은 수명이 길어 동시성 제한 대신 서킷 브레이커 상태만 확인합니다.
+    # 응답을 시작하기 전에 차단 여부만 확인해 503으로 거절하고, 실제 권한은 펌프 태스크 안에서 얻습니다.
+    # (응답 본문이 한 번도 소비되지 않으면 제너레이터의 finally가 실행되지 않아 권한이 반환되지 않기 때문입니다.)
+    guard = upstream_guards.get(upstream)
+    try:
+        guard.check()
+    except HTTPException:
+        upstream_requests_total.inc(upstream, "stream", "rejected")
+        raise
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+    permit = None
+    settled = False
+    outcome_ok = None
+
+    def settle(ok):
+        nonlocal settled, outcome_ok
+        if not settled and permit is not None:
+            settled = True
+            outcome_ok = ok
+            guard.release(permit, ok)
+
+    async def pump_upstream():
+        nonlocal permit
         try:
-            # 공용 클라이언트의 .stream()을 사용 (timeout=None은 스트리밍 유지용)
-            async with client.stream("GET", url, headers=headers, params=params, timeout=None) as response:
+            permit = guard.acquire(limit_concurrency=False)
+        except HTTPException as exc:
+            # 사전 확인 이후 다른 요청이 반개방 시험 호출 슬롯을 먼저 가져간 경우
+            upstream_requests_total.inc(upstream, "stream", "rejected")
+            await queue.put(sse_error_frame(exc.detail, exc.status_code))
+            await queue.put(_END)
+            return
+
+        # 스트림이 끝날 때까지 인스턴스의 진행 중 요청으로 집계되도록 펌프 수명 동안 인스턴스를 점유합니다.
+        balancer = upstream_balancers.get(upstream)
+        endpoint = balancer.pick(affinity_key.get()) if balancer else None
+        url = f"{endpoint.url if endpoint else base_url}{path}"
+        request_headers, extensions = headers, None
+        if endpoint is not None and endpoint.host:
+            # IP로 접속하는 인스턴스에도 원래 호스트 이름으로 요청합니다. (가상 호스트, TLS 인증서 검증)
+            request_headers = {**headers, "Host": endpoint.host}
+            extensions = {"sni_hostname": endpoint.sni_hostname}
+        started = time.perf_counter()
+        try:
+            # 스트림 유지 중에는 읽기 타임아웃 대신 유휴 타임아웃으로 관리합니다.
+            # 요청 마감 시간은 연결 수립에만 적용하고, 업스트림이 스트림을 끊지 않도록 헤더로 전달하지 않습니다.
+            timeout = httpx.Timeout(capped(10.0), read=None)
+            async with client.stream(
+                "GET", url, headers=request_headers, params=params, timeout=timeout, extensions=extensions
+            ) as response:
+                settle(response.status_code < 500)
+                # 스트림 호출 시간은 응답 헤더를 받을 때까지(첫 응답 지연)로 기록합니다.
+                observe_upstream(upstream, "stream", status_class(response.status_code), time.perf_counter() - started)
                 if response.status_code >= 400:
-                    yield f"연결 오류 {response.status_code}".encode()
+                    stream_stats.upstream_errors += 1
+                    await queue.put(sse_error_frame("업스트림 연결 오류", response.status_code))
                     return
 
+                buffer = b""
                 async for chunk in response.aiter_bytes():
-                    yield chunk
+                    events, buffer = split_events(buffer + chunk)
+                    for event in events:
+                        await queue.put(event)
+                if buffer:
+                    await queue.put(buffer)
         except httpx.RequestError as exc:
-            yield f"네트워크 오류: {str(exc)}".encode()
+            settle(False)
+            observe_upstream(upstream, "stream", "network_error", time.perf_counter() - started)
+            stream_stats.upstream_errors += 1
+            await queue.put(sse_error_frame(f"네트워크 오류: {exc}"))
+        finally:
+            settle(None)
+            if endpoint is not None:
+                balancer.release(endpoint, outcome_ok)
+            # 클라이언트 연결 종료로 취소된 경우에는 큐를 비울 소비자가 없으므로 종료 표시를 넣지 않습니다.
+            # (가득 찬 큐에 put을 기다리면 태스크가 영원히 끝나지 않습니다.)
+            if not asyncio.current_task().cancelling():
+                await queue.put(_END)
+
+    async def stream_generator() -> AsyncIterator[bytes]:
+        stream_stats.active += 1
+        stream_stats.total += 1
+        producer = asyncio.create_task(pump_upstream())
+        last_event_at = time.monotonic()
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if request is not None and await request.is_disconnected():
+                        stream_stats.client_disconnects += 1
+                        return
+                    if time.monotonic() - last_event_at >= SSE_IDLE_TIMEOUT_SECONDS:
+                        stream_stats.idle_timeouts += 1
+                        yield sse_error_frame("스트림 응답이 없어 연결을 종료합니다.", 504)
+                        return
+                    yield _HEARTBEAT_FRAME
+                    continue
+
+                if item is _END:
+                    return
+                last_event_at = time.monotonic()
+                yield item
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료로 응답 태스크가 취소된 경우
+            stream_stats.client_disconnects += 1
+            raise
+        finally:
+            stream_stats.active -= 1
+            # 업스트림 스트림을 닫아 더 이상 토큰/소켓을 소비하지 않게 합니다.
+            producer.cancel()
+            settle(None)
 
     return stream_generator()
@@ -0,0 +1,104 @@
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Tuple
+
+from configs.setting import REDIS_BATCH_MAX_COMMANDS
+from utils.metrics import redis_command_duration_seconds
+
+
+@dataclass
+class RedisBatchStats:
+    batches: int = 0
+    commands: int = 0
+    largest_batch: int = 0
+    errors: int = 0
+
+
+class RedisBatcher:
+    """
+    같은 이벤트 루프 차례에 요청된 Redis 명령을 모아 트랜잭션 없는 파이프라인 한 번으로 보냅니다.
+    동시에 로그인/로그아웃하는 여러 요청의 명령이 한 왕복으로 묶이며, 명령별 오류는 해당 호출자에게만 전달됩니다.
+    """
+
+    def __init__(self, max_batch: int = REDIS_BATCH_MAX_COMMANDS):
+        self.max_batch = max_batch
+        self.redis = None
+        self.stats = RedisBatchStats()
+        self._pending: List[Tuple[tuple, asyncio.Future]] = []
+        self._flush_scheduled = False
+        self._flushes = set()
+
+    def attach_redis(self, redis_client):
+        self.redis = redis_client
+
+    def _schedule_flush(self):
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self.max_batch):
+            self._start_flush(pending[start : start + self.max_batch])
+
+    def _start_flush(self, batch: List[Tuple[tuple, asyncio.Future]]):
+        task = asyncio.get_running_loop().create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[Tuple[tuple, asyncio.Future]]):
+        started = time.perf_counter()
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for args, _ in batch:
+                    pipe.execute_command(*args)
+                results = await pipe.execute(raise_on_error=False)
+        except BaseException as e:
+            self.stats.errors += 1
+            for _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                else:
+                    # 종료 중 취소되면 기다리던 호출자도 함께 취소합니다.
+                    future.cancel()
+            if not isinstance(e, Exception):
+                raise
+            return
+        finally:
+            redis_command_duration_seconds.observe(
+                time.perf_counter() - started, getattr(self.redis, "metrics_client", "async"), "PIPELINE"
+            )
+
+        self.stats.batches += 1
+        self.stats.commands += len(batch)
+        self.stats.largest_batch = max(self.stats.largest_batch, len(batch))
+        for (_, future), result in zip(batch, results, strict=True):
+            # 호출자가 취소된 명령은 이미 전송되었으므로 결과만 버립니다.
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def execute(self, *args) -> Any:
+        """명령 하나를 다음 파이프라인에 실어 보내고 결과를 기다립니다."""
+        if self.redis is None:
+            raise RuntimeError("Redis 클라이언트가 연결되지 않았습니다. attach_redis()를 먼저 호출해주세요.")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((args, future))
+        if not self._flush_scheduled:
+            # 지금 실행 가능한 다른 코루틴들이 명령을 더 넣을 수 있도록 다음 차례에 전송합니다.
+            self._flush_scheduled = True
+            loop.call_soon(self._schedule_flush)
+        return await future
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **asdict(self.stats),
+            "pending": len(self._pending),
+            "max_batch": self.max_batch,
+        }
+
+
+redis_batcher = RedisBatcher()
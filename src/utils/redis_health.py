@@ -0,0 +1,76 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from configs.setting import REDIS_HEALTH_CHECK_INTERVAL_SECONDS
+from utils.logger import info, warning
+
+
+class RedisHealthMonitor:
+    """
+    Redis 상태를 백그라운드에서 주기적으로 PING해 기록합니다.
+    요청 경로에서는 PING을 보내지 않고 마지막 확인 결과(healthy)만 참조합니다.
+    """
+
+    def __init__(self, interval: float = REDIS_HEALTH_CHECK_INTERVAL_SECONDS):
+        self.interval = interval
+        self.redis = None
+        self.healthy: Optional[bool] = None
+        self.checked_at: Optional[float] = None
+        self.latency: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.consecutive_failures = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def check(self) -> bool:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.redis.ping(), timeout=self.interval)
+        except Exception as e:
+            self.consecutive_failures += 1
+            self.last_error = str(e) or type(e).__name__
+            if self.healthy is not False:
+                warning(f"⚠️ Redis 상태 확인 실패: {self.last_error}")
+            self.healthy = False
+        else:
+            if self.healthy is False:
+                info("✅ Redis 연결이 복구되었습니다.")
+            self.latency = time.perf_counter() - started
+            self.consecutive_failures = 0
+            self.healthy = True
+        self.checked_at = time.time()
+        return self.healthy
+
+    def start(self, redis_client):
+        self.redis = redis_client
+        if self._task is not None:
+            return
+
+        async def _loop():
+            while True:
+                await self.check()
+                await asyncio.sleep(self.interval)
+
+        self._task = asyncio.create_task(_loop())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.healthy,
+            "checked_at": self.checked_at,
+            "latency_ms": None if self.latency is None else round(self.latency * 1000, 2),
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+        }
+
+
+redis_health = RedisHealthMonitor()
@@ -0,0 +1,24 @@
+import time
+
+import redis.asyncio
+
+from utils.metrics import redis_command_duration_seconds
+
+
+def _command_name(args) -> str:
+    return str(args[0]).split(" ")[0].upper() if args else "UNKNOWN"
+
+
+class InstrumentedAsyncRedis(redis.asyncio.StrictRedis):
+    """명령 실행 시간을 redis_command_duration_seconds에 기록하는 비동기 Redis 클라이언트."""
+
+    metrics_client = "async"
+
+    async def execute_command(self, *args, **options):
+        started = time.perf_counter()
+        try:
+            return await super().execute_command(*args, **options)
+        finally:
+            redis_command_duration_seconds.observe(
+                time.perf_counter() - started, self.metrics_client, _command_name(args)
+            )
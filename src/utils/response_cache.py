@@ -0,0 +1,291 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from configs.setting import PROXY_CACHE_MAX_BYTES, PROXY_CACHE_REDIS_ENABLED
+from utils.compression import compress, should_compress
+from utils.etag import compute_etag
+from utils.logger import warning
+from utils.token_digest import token_digest
+
+
+def request_key(method: str, url: str, params: Any, scope: str) -> str:
+    """메서드, URL, 쿼리 파라미터, 인증 범위로 요청을 식별하는 정규화된 키를 만듭니다."""
+    query = urlencode(sorted(params.items()) if isinstance(params, dict) else params or [], doseq=True)
+    return f"{scope}:{method.upper()}:{url}?{query}"
+
+
+class CacheScope(str, Enum):
+    """캐시 키 정책"""
+
+    GLOBAL = "global"  # 모든 사용자가 공유하는 참조 데이터
+    USER = "user"  # 토큰(사용자) 단위로 분리되는 데이터
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    라우트 단위로 선언하는 캐시 정책.
+    ttl 동안은 신선한 응답으로, 이후 stale_ttl 동안은 오래된 응답을 즉시 반환하면서 백그라운드에서 갱신합니다.
+    GLOBAL 범위는 사용자와 무관한 참조 데이터 라우트에만 사용해야 합니다.
+    GLOBAL 캐시 적중은 업스트림의 인증 없이 반환되므로, 해당 라우트는 get_claims 의존성으로 토큰을 먼저 검증해야 합니다.
+    """
+
+    ttl: float
+    stale_ttl: float = 0.0
+    scope: CacheScope = CacheScope.GLOBAL
+    shared: bool = True  # Redis 공유 계층 사용 여부
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    content_type: str
+    fresh_until: float
+    stale_until: float
+    # 인코딩별 압축 본문. 클라이언트가 요청한 인코딩만 처음 요청될 때 한 번 압축해 L1에만 보관합니다.
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+    etag: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(body) for body in self.encoded.values())
+
+    def prepare(self, encoding: Optional[str] = None):
+        """L1에 넣기 전에 ETag를 한 번만 계산하고, encoding이 주어지면 그 압축 본문도 함께 만듭니다."""
+        self.etag = compute_etag(self.body)
+        self.encode(encoding)
+
+    def encode(self, encoding: Optional[str]):
+        """encoding 압축 본문이 아직 없으면 만들어 둡니다. 압축 대상이 아닌 응답은 그대로 둡니다."""
+        if encoding is None or encoding in self.encoded or not should_compress(self.body, self.content_type):
+            return
+        # 동시에 같은 인코딩을 요청한 호출이 있어도 먼저 만든 본문 하나만 남깁니다.
+        self.encoded.setdefault(encoding, compress(self.body, encoding))
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.fresh_until
+
+    def is_usable(self, now: float) -> bool:
+        return now < self.stale_until
+
+    def to_bytes(self) -> bytes:
+        header = {
+            "content_type": self.content_type,
+            "fresh_until": self.fresh_until,
+            "stale_until": self.stale_until,
+        }
+        return json.dumps(header).encode() + b"\n" + self.body
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> "CacheEntry":
+        header, _, body = raw.partition(b"\n")
+        meta = json.loads(header)
+        return cls(
+            body=body,
+            content_type=meta["content_type"],
+            fresh_until=meta["fresh_until"],
+            stale_until=meta["stale_until"],
+        )
+
+
+class LruByteCache:
+    """바이트 크기 기준으로 용량을 관리하는 프로세스 내부 LRU 캐시"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        # 한 항목이 캐시 전체를 밀어내지 않도록 항목 크기를 제한합니다.
+        self.max_entry_bytes = max_bytes // 8
+        self.current_bytes = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        # 항목을 넣을 때 계산한 크기. 지연 압축으로 항목이 커져도 용량 계산이 어긋나지 않도록 따로 보관합니다.
+        self._sizes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> bool:
+        if entry.size > self.max_entry_bytes:
+            return False
+
+        self.delete(key)
+        self._entries[key] = entry
+        self._sizes[key] = entry.size
+        self.current_bytes += entry.size
+        self._evict()
+        return True
+
+    def resize(self, key: str, entry: CacheEntry):
+        """이미 저장된 항목에 압축 본문이 추가되었을 때 늘어난 크기를 반영합니다."""
+        if self._entries.get(key) is not entry:
+            return
+        self.current_bytes += entry.size - self._sizes[key]
+        self._sizes[key] = entry.size
+        self._evict()
+
+    def _evict(self):
+        while self.current_bytes > self.max_bytes and self._entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self.current_bytes -= self._sizes.pop(evicted)
+
+    def delete(self, key: str):
+        if self._entries.pop(key, None) is not None:
+            self.current_bytes -= self._sizes.pop(key)
+
+    def clear(self):
+        self._entries.clear()
+        self._sizes.clear()
+        self.current_bytes = 0
+
+
+@dataclass
+class CacheStats:
+    local_hits: int = 0
+    shared_hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    shared_errors: int = 0
+
+
+class ResponseCache:
+    """
+    프로세스 내부 LRU(L1) 앞단과 Redis 공유 계층(L2)으로 구성된 2단계 응답 캐시.
+    Redis 계층은 기동 시 attach_redis()로 연결되며, 연결되지 않았거나 오류가 나면 L1만 사용합니다.
+    """
+
+    key_prefix = "proxy_cache:"
+
+    def __init__(self, max_bytes: int):
+        self.local = LruByteCache(max_bytes)
+        self.redis = None
+        self.stats = CacheStats()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+    def attach_redis(self, redis_client):
+        self.redis = redis_client if PROXY_CACHE_REDIS_ENABLED else None
+
+    @staticmethod
+    def build_key(method: str, url: str, params: Any, token: Optional[str], policy: CachePolicy) -> str:
+        scope = token_digest(token) if policy.scope == CacheScope.USER else CacheScope.GLOBAL.value
+        return request_key(method, url, params, scope)
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        policy: CachePolicy,
+        fetch: Callable[[], Awaitable[Tuple[bytes, str]]],
+        encoding: Optional[str] = None,
+    ) -> CacheEntry:
+        """
+        캐시된 항목을 반환하고, 없으면 fetch()로 가져와 저장합니다.
+        encoding이 주어지면 해당 인코딩의 압축 본문만 (없을 때) 만들어 두고, 다른 인코딩은 요청될 때 채웁니다.
+        """
+        now = time.time()
+        entry = self.local.get(key)
+        if entry is not None and entry.is_usable(now):
+            self.stats.local_hits += 1
+            await self._encode_local(key, entry, encoding)
+        else:
+            entry = await self._get_shared(key, policy)
+            if entry is not None and entry.is_usable(now):
+                self.stats.shared_hits += 1
+                await self._store_local(key, entry, encoding)
+            else:
+                self.stats.misses += 1
+                return await self._fetch_and_store(key, policy, fetch, encoding)
+
+        if not entry.is_fresh(now):
+            # stale-while-revalidate: 오래된 응답을 즉시 반환하고 백그라운드에서 갱신
+            self.stats.stale_hits += 1
+            self._schedule_refresh(key, policy, fetch)
+        return entry
+
+    async def _fetch_and_store(
+        self, key: str, policy: CachePolicy, fetch, encoding: Optional[str] = None
+    ) -> CacheEntry:
+        body, content_type = await fetch()
+        now = time.time()
+        entry = CacheEntry(
+            body=body,
+            content_type=content_type,
+            fresh_until=now + policy.ttl,
+            stale_until=now + policy.ttl + policy.stale_ttl,
+        )
+        await self._store_local(key, entry, encoding)
+        await self._set_shared(key, entry, policy)
+        return entry
+
+    async def _store_local(self, key: str, entry: CacheEntry, encoding: Optional[str] = None):
+        # 큰 응답의 해시/압축이 이벤트 루프를 막지 않도록 스레드에서 수행합니다.
+        await asyncio.to_thread(entry.prepare, encoding)
+        self.local.set(key, entry)
+
+    async def _encode_local(self, key: str, entry: CacheEntry, encoding: Optional[str]):
+        if encoding is None or encoding in entry.encoded:
+            return
+        await asyncio.to_thread(entry.encode, encoding)
+        self.local.resize(key, entry)
+
+    def _schedule_refresh(self, key: str, policy: CachePolicy, fetch):
+        if key in self._refreshing:
+            return
+
+        async def _refresh():
+            try:
+                await self._fetch_and_store(key, policy, fetch)
+                self.stats.refreshes += 1
+            except Exception as e:
+                warning(f"캐시 백그라운드 갱신 실패 ({key}): {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(_refresh())
+
+    async def _get_shared(self, key: str, policy: CachePolicy) -> Optional[CacheEntry]:
+        if not (policy.shared and self.redis):
+            return None
+        try:
+            raw = await self.redis.get(self.key_prefix + key)
+            return CacheEntry.from_bytes(raw) if raw else None
+        except Exception as e:
+            self.stats.shared_errors += 1
+            warning(f"Redis 캐시 조회 실패: {e}")
+            return None
+
+    async def _set_shared(self, key: str, entry: CacheEntry, policy: CachePolicy):
+        if not (policy.shared and self.redis):
+            return
+        expire = max(1, int(entry.stale_until - time.time()))
+        try:
+            await self.redis.set(self.key_prefix + key, entry.to_bytes(), ex=expire)
+        except Exception as e:
+            self.stats.shared_errors += 1
+            warning(f"Redis 캐시 저장 실패: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self.local),
+            "bytes": self.local.current_bytes,
+            "max_bytes": self.local.max_bytes,
+            "local_hits": self.stats.local_hits,
+            "shared_hits": self.stats.shared_hits,
+            "stale_hits": self.stats.stale_hits,
+            "misses": self.stats.misses,
+            "refreshes": self.stats.refreshes,
+            "shared_errors": self.stats.shared_errors,
+        }
+
+
+response_cache = ResponseCache(PROXY_CACHE_MAX_BYTES)
@@ -0,0 +1,130 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, FrozenSet
+
+from fastapi import HTTPException
+
+from configs.setting import RETRY_BUDGET_MIN_PER_SECOND, RETRY_BUDGET_RATIO
+from utils.deadline import remaining_budget
+from utils.upstream_guard import UpstreamGuard, UpstreamRejected
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    라우트 단위로 선언하는 재시도/헤징 정책.
+    GET이 아닌 요청은 idempotent=True로 명시한 경우에만 재시도합니다.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 1.0
+    retry_statuses: FrozenSet[int] = frozenset({502, 503, 504})
+    idempotent: bool = False
+    # 헤징: 첫 요청이 업스트림 p95 지연을 넘기면 두 번째 요청을 보내고 먼저 도착한 응답을 사용합니다.
+    hedge: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_delay: float = 0.02
+    hedge_fallback_delay: float = 0.5  # 지연 표본이 부족할 때 사용할 기본 헤지 지연
+
+    def applies_to(self, method: str) -> bool:
+        return method.upper() == "GET" or self.idempotent
+
+
+class RetryBudget:
+    """
+    재시도가 장애를 증폭시키지 않도록 전체 재시도/헤지 요청량을 제한하는 토큰 버킷.
+    원 요청마다 ratio만큼, 시간이 지나면 초당 min_per_second만큼 토큰이 쌓입니다.
+    """
+
+    def __init__(self, ratio: float, min_per_second: float):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max(10.0, min_per_second * 10)
+        self.tokens = self.max_tokens
+        self._refilled_at = time.monotonic()
+        self.spent = 0
+        self.exhausted = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.max_tokens, self.tokens + (now - self._refilled_at) * self.min_per_second)
+        self._refilled_at = now
+
+    def record_request(self):
+        self._refill()
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            self.spent += 1
+            return True
+        self.exhausted += 1
+        return False
+
+    def snapshot(self) -> Dict[str, Any]:
+        self._refill()
+        return {"tokens": round(self.tokens, 2), "spent": self.spent, "exhausted": self.exhausted}
+
+
+retry_budget = RetryBudget(RETRY_BUDGET_RATIO, RETRY_BUDGET_MIN_PER_SECOND)
+
+
+def _retryable(exc: HTTPException, policy: RetryPolicy) -> bool:
+    # 보호 장치가 거절한 요청은 다시 보내도 즉시 거절되므로 재시도하지 않습니다.
+    return not isinstance(exc, UpstreamRejected) and exc.status_code in policy.retry_statuses
+
+
+def _backoff(policy: RetryPolicy, attempt: int) -> float:
+    # full jitter: 동시에 실패한 요청들이 같은 시점에 재시도하지 않도록 분산합니다.
+    return random.uniform(0, min(policy.max_delay, policy.base_delay * (2 ** (attempt - 1))))
+
+
+async def call_with_retry(policy: RetryPolicy, guard: UpstreamGuard, attempt: Callable[[], Awaitable[Any]]) -> Any:
+    """정책에 따라 재시도와 헤징을 적용해 attempt()를 실행합니다."""
+    retry_budget.record_request()
+    attempt_no = 0
+    while True:
+        attempt_no += 1
+        try:
+            if policy.hedge:
+                return await _hedged(policy, guard, attempt)
+            return await attempt()
+        except HTTPException as exc:
+            if attempt_no >= policy.max_attempts or not _retryable(exc, policy):
+                raise
+            delay = _backoff(policy, attempt_no)
+            # 대기 후 남은 예산이 없을 재시도는 보내지 않습니다.
+            remaining = remaining_budget()
+            if (remaining is not None and remaining <= delay) or not retry_budget.try_spend():
+                raise
+        await asyncio.sleep(delay)
+
+
+async def _hedged(policy: RetryPolicy, guard: UpstreamGuard, attempt: Callable[[], Awaitable[Any]]) -> Any:
+    observed = guard.latency.quantile(policy.hedge_quantile)
+    delay = max(policy.hedge_min_delay, observed if observed is not None else policy.hedge_fallback_delay)
+
+    primary = asyncio.ensure_future(attempt())
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done or not retry_budget.try_spend():
+        return await primary
+
+    pending = {primary, asyncio.ensure_future(attempt())}
+    failure = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                failure = task.exception()
+        raise failure
+    finally:
+        # 먼저 끝난 응답을 사용하고, 남은 요청은 취소해 업스트림 부하를 줄입니다.
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,17 @@
+from typing import Optional
+
+from starlette.routing import Match
+from starlette.types import Scope
+
+
+def route_template(scope: Scope) -> Optional[str]:
+    """
+    요청에 매칭되는 라우트의 경로 템플릿(예: /gm/history/{session_id})을 찾습니다.
+    라우터보다 먼저 실행되는 미들웨어에서 라우트별 정책을 고를 때 사용합니다.
+    """
+    router = getattr(scope.get("app"), "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return None
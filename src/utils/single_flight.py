@@ -0,0 +1,46 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 요청들이 하나의 진행 중인 호출을 공유하도록 묶는 유틸리티.
+    결과와 예외는 대기 중인 모든 호출자에게 그대로 전달됩니다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.leaders = 0  # 실제로 업스트림 호출을 수행한 횟수
+        self.followers = 0  # 진행 중인 호출에 합류한 횟수
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            self.followers += 1
+
+        # 한 호출자가 취소되어도 공유 중인 호출은 다른 대기자를 위해 계속 진행됩니다.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 모든 대기자가 취소된 경우에도 "exception was never retrieved" 경고가 남지 않도록 합니다.
+        if not task.cancelled():
+            task.exception()
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = self.leaders + self.followers
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "coalescing_ratio": round(self.followers / total, 4) if total else 0.0,
+        }
+
+
+upstream_flights = SingleFlight()
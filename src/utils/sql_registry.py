@@ -0,0 +1,87 @@
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
+
+from utils.logger import info
+
+SRC_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+_NAME_HEADER = re.compile(r"^--\s*name:\s*(\w+)\s*$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class SqlQuery:
+    """
+    queries 폴더의 SQL 파일 하나.
+    LazyCursor는 SqlQuery를 서버 측 prepared statement로 실행하므로,
+    커넥션마다 처음 실행할 때 한 번만 파싱/준비되고 이후에는 준비된 계획을 재사용합니다.
+    """
+
+    domain: str
+    name: str
+    text: str
+    path: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.domain}.{self.name}"
+
+
+def parse_sql_file(domain: str, path: str) -> SqlQuery:
+    """`-- name: <이름>` 헤더로 쿼리 이름을 정합니다. 헤더가 없으면 오류를 냅니다."""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    names = _NAME_HEADER.findall(text)
+    if len(names) != 1:
+        raise ValueError(f"SQL 파일에는 `-- name:` 헤더가 하나만 있어야 합니다: {path}")
+    return SqlQuery(domain=domain, name=names[0], text=text, path=path)
+
+
+class SqlRegistry:
+    """
+    src/{domain}/queries/*.sql 파일을 서버 시작 시 한 번만 읽어 (도메인, 이름)으로 보관합니다.
+    서비스는 요청마다 만들어지므로, 파일 대신 이 레지스트리에서 쿼리를 꺼내 씁니다.
+    """
+
+    def __init__(self, root: str = SRC_ROOT):
+        self.root = root
+        self._queries: Optional[Dict[Tuple[str, str], SqlQuery]] = None
+
+    def load(self) -> "SqlRegistry":
+        queries: Dict[Tuple[str, str], SqlQuery] = {}
+        for domain in sorted(os.listdir(self.root)):
+            query_dir = os.path.join(self.root, domain, "queries")
+            if not os.path.isdir(query_dir):
+                continue
+            for filename in sorted(os.listdir(query_dir)):
+                if not filename.endswith(".sql"):
+                    continue
+                query = parse_sql_file(domain, os.path.join(query_dir, filename))
+                if (domain, query.name) in queries:
+                    raise ValueError(f"같은 이름의 쿼리가 이미 등록되어 있습니다: {query.key} ({query.path})")
+                queries[(domain, query.name)] = query
+
+        self._queries = queries
+        info(f"SQL 쿼리 {len(queries)}개를 불러왔습니다.")
+        return self
+
+    def get(self, domain: str, name: str) -> SqlQuery:
+        if self._queries is None:
+            self.load()
+        try:
+            return self._queries[(domain, name)]
+        except KeyError:
+            raise KeyError(f"등록되지 않은 쿼리입니다: {domain}.{name}") from None
+
+    def __iter__(self) -> Iterator[SqlQuery]:
+        if self._queries is None:
+            self.load()
+        return iter(self._queries.values())
+
+    def __len__(self) -> int:
+        return len(self._queries or {})
+
+
+sql_registry = SqlRegistry()
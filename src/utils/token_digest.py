@@ -0,0 +1,12 @@
+import hashlib
+from typing import Optional
+
+
+def token_digest(token: Optional[str]) -> str:
+    """
+    토큰 원문 대신 캐시/키 구성에 사용할 짧은 다이제스트를 반환합니다.
+    토큰이 없으면 "anonymous"를 반환합니다.
+    """
+    if not token:
+        return "anonymous"
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
@@ -0,0 +1,247 @@
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException, status
+
+from configs.upstreams import UPSTREAM_URLS, UpstreamPolicy, upstream_policy
+from utils.logger import warning
+
+
+class UpstreamRejected(HTTPException):
+    """업스트림을 호출하지 않고 보호 장치가 즉시 거절한 경우의 예외 (재시도 대상이 아님)"""
+
+
+class LatencyWindow:
+    """최근 성공 호출의 지연 시간을 보관하고 분위수를 계산합니다."""
+
+    min_samples = 20
+
+    def __init__(self, size: int = 512):
+        self._samples: deque = deque(maxlen=size)
+
+    def observe(self, seconds: float):
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class BreakerState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    최근 호출의 실패율로 업스트림을 차단하는 서킷 브레이커.
+    차단(OPEN) 후 open_seconds가 지나면 반개방(HALF_OPEN) 상태에서 소수의 시험 호출만 허용합니다.
+    """
+
+    def __init__(self, policy: UpstreamPolicy):
+        self.policy = policy
+        self.state = BreakerState.CLOSED
+        self._results: deque = deque(maxlen=policy.window_size)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self.trips = 0
+
+    def allow(self) -> Optional[bool]:
+        """호출 허용 여부를 반환합니다. 허용된 경우 시험 호출이면 True, 일반 호출이면 False."""
+        if self.state == BreakerState.OPEN:
+            if self.retry_after() > 0:
+                return None
+            self.state = BreakerState.HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+
+        if self.state == BreakerState.HALF_OPEN:
+            if self._probes_in_flight >= self.policy.half_open_calls:
+                return None
+            self._probes_in_flight += 1
+            return True
+        return False
+
+    def would_allow(self) -> bool:
+        """상태나 시험 호출 슬롯을 바꾸지 않고 지금 호출이 허용될지만 확인합니다."""
+        if self.state == BreakerState.OPEN:
+            return self.retry_after() <= 0
+        if self.state == BreakerState.HALF_OPEN:
+            return self._probes_in_flight < self.policy.half_open_calls
+        return True
+
+    def record(self, ok: Optional[bool], probe: bool):
+        """호출 결과를 반영합니다. ok가 None이면(취소 등) 결과 없이 슬롯만 반환합니다."""
+        if probe:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if self.state != BreakerState.HALF_OPEN or ok is None:
+                return
+            if not ok:
+                self._trip()
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.policy.half_open_calls:
+                self.state = BreakerState.CLOSED
+                self._results.clear()
+            return
+
+        if ok is None or self.state != BreakerState.CLOSED:
+            return
+        self._results.append(ok)
+        if (
+            len(self._results) >= self.policy.minimum_calls
+            and self.failure_rate() >= self.policy.failure_rate_threshold
+        ):
+            self._trip()
+
+    def failure_rate(self) -> float:
+        if not self._results:
+            return 0.0
+        return self._results.count(False) / len(self._results)
+
+    def retry_after(self) -> float:
+        if self.state != BreakerState.OPEN:
+            return 0.0
+        return max(0.0, self.policy.open_seconds - (time.monotonic() - self._opened_at))
+
+    def _trip(self):
+        self.state = BreakerState.OPEN
+        self._opened_at = time.monotonic()
+        self._results.clear()
+        self.trips += 1
+
+
+class AimdLimiter:
+    """
+    AIMD(가산 증가/승산 감소) 방식의 적응형 동시성 제한기.
+    빠르고 성공적인 응답이 이어지면 한도를 조금씩 늘리고, 실패나 느린 응답이 오면 한도를 줄입니다.
+    한도를 초과한 호출은 대기시키지 않고 즉시 거절합니다.
+    """
+
+    backoff_ratio = 0.9
+
+    def __init__(self, policy: UpstreamPolicy):
+        self.policy = policy
+        self.limit = float(policy.initial_limit)
+        self.in_flight = 0
+        self.rejected = 0
+
+    def try_acquire(self) -> bool:
+        if self.in_flight >= math.floor(self.limit):
+            self.rejected += 1
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self, ok: Optional[bool], latency: float):
+        self.in_flight -= 1
+        if ok is None:
+            return
+        if not ok or latency > self.policy.slow_call_seconds:
+            self.limit = max(float(self.policy.min_limit), self.limit * self.backoff_ratio)
+        elif self.in_flight * 2 >= self.limit:
+            # 한도의 절반 이상을 실제로 사용 중일 때만 늘려 유휴 상태에서 한도가 부풀지 않게 합니다.
+            self.limit = min(float(self.policy.max_limit), self.limit + 1.0 / self.limit)
+
+
+@dataclass
+class Permit:
+    probe: bool  # 반개방 상태의 시험 호출 여부
+    limited: bool  # 동시성 제한기 슬롯을 점유했는지 여부
+    started: float
+
+
+class UpstreamGuard:
+    """업스트림 하나에 대한 서킷 브레이커와 동시성 제한기를 묶어 관리합니다."""
+
+    def __init__(self, name: str, policy: UpstreamPolicy):
+        self.name = name
+        self.breaker = CircuitBreaker(policy)
+        self.limiter = AimdLimiter(policy)
+        self.latency = LatencyWindow()
+
+    def _blocked(self) -> UpstreamRejected:
+        retry_after = max(1, math.ceil(self.breaker.retry_after()))
+        return UpstreamRejected(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{self.name} 서비스가 일시적으로 차단되었습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    def check(self):
+        """
+        권한을 점유하지 않고 서킷 브레이커가 호출을 허용하는지만 확인합니다. 차단 상태면 503을 반환합니다.
+        응답을 시작하기 전에 거절하되 실제 권한은 나중에(스트림 펌프 안에서) 얻어야 할 때 사용합니다.
+        """
+        if not self.breaker.would_allow():
+            raise self._blocked()
+
+    def acquire(self, limit_concurrency: bool = True) -> Permit:
+        """호출 권한을 얻습니다. 차단되었거나 동시성 한도를 넘으면 503을 즉시 반환합니다."""
+        probe = self.breaker.allow()
+        if probe is None:
+            raise self._blocked()
+
+        if limit_concurrency and not self.limiter.try_acquire():
+            self.breaker.record(None, probe)
+            raise UpstreamRejected(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"{self.name} 서비스의 동시 요청 한도를 초과했습니다.",
+                headers={"Retry-After": "1"},
+            )
+        return Permit(probe=probe, limited=limit_concurrency, started=time.perf_counter())
+
+    def release(self, permit: Permit, ok: Optional[bool]):
+        previous = self.breaker.state
+        elapsed = time.perf_counter() - permit.started
+        self.breaker.record(ok, permit.probe)
+        if permit.limited:
+            self.limiter.release(ok, elapsed)
+        if ok:
+            self.latency.observe(elapsed)
+
+        if previous != self.breaker.state and self.breaker.state == BreakerState.OPEN:
+            warning(f"⚠️ 업스트림 '{self.name}' 서킷 브레이커가 열렸습니다.")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.breaker.state.value,
+            "failure_rate": round(self.breaker.failure_rate(), 4),
+            "retry_after": round(self.breaker.retry_after(), 2),
+            "trips": self.breaker.trips,
+            "concurrency_limit": round(self.limiter.limit, 2),
+            "in_flight": self.limiter.in_flight,
+            "rejected": self.limiter.rejected,
+            "latency_p95_ms": _ms(self.latency.quantile(0.95)),
+        }
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000, 2) if seconds is not None else None
+
+
+class UpstreamGuardRegistry:
+    def __init__(self):
+        self._guards: Dict[str, UpstreamGuard] = {
+            name: UpstreamGuard(name, upstream_policy(name)) for name in UPSTREAM_URLS
+        }
+
+    def get(self, name: str) -> UpstreamGuard:
+        guard = self._guards.get(name)
+        if guard is None:
+            guard = self._guards[name] = UpstreamGuard(name, upstream_policy(name))
+        return guard
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: guard.snapshot() for name, guard in self._guards.items()}
+
+
+upstream_guards = UpstreamGuardRegistry()
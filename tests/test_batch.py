@@ -0,0 +1,148 @@
+import asyncio
+import os
+
+import httpx
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from batch.batch_service import BatchExecutor, PreAuthenticatedRouter, plan_dependencies
+from batch.dtos.batch_dtos import BatchItem
+from utils.claims import TokenClaims, get_claims
+
+router = APIRouter(prefix="/state")
+active = {"now": 0, "peak": 0}
+
+
+@router.post("/session/start")
+async def _start(body: dict, authorization: str = Header(None)):
+    return {"data": {"session_id": f"s-{body['scenario_id']}", "auth": authorization}}
+
+
+@router.get("/session/{session_id}")
+async def _session(session_id: str):
+    active["now"] += 1
+    active["peak"] = max(active["peak"], active["now"])
+    await asyncio.sleep(0.01)
+    active["now"] -= 1
+    if session_id == "missing":
+        raise HTTPException(status_code=404, detail="없음")
+    return {"data": {"session_id": session_id}}
+
+
+app = FastAPI()
+app.include_router(router)
+
+
+def _run(items, max_concurrency=4):
+    executor = BatchExecutor(app, router.routes, "Bearer t", max_concurrency)
+    return asyncio.run(executor.run([BatchItem(**item) for item in items]))
+
+
+def test_later_items_can_use_values_from_earlier_responses():
+    results = _run(
+        [
+            {"id": "detail", "path": "/state/session/{{start.data.session_id}}"},
+            {"id": "start", "method": "POST", "path": "/state/session/start", "body": {"scenario_id": "x"}},
+        ]
+    )
+
+    assert [r.id for r in results] == ["detail", "start"]
+    assert results[1].body["data"]["auth"] == "Bearer t"
+    assert results[0].status_code == 200
+    assert results[0].body == {"data": {"session_id": "s-x"}}
+
+
+def test_failed_dependency_and_unknown_routes_are_reported_per_item():
+    results = _run(
+        [
+            {"id": "missing", "path": "/state/session/missing"},
+            {"id": "after", "path": "/state/session/ok", "depends_on": ["missing"]},
+            {"id": "other", "path": "/batch"},
+            {"id": "fine", "path": "/state/session/ok"},
+        ]
+    )
+
+    assert [r.status_code for r in results] == [404, 424, 404, 200]
+
+
+def test_concurrency_is_bounded():
+    active["peak"] = 0
+    _run([{"id": str(i), "path": f"/state/session/{i}"} for i in range(6)], max_concurrency=2)
+
+    assert active["peak"] == 2
+
+
+def test_cyclic_dependencies_are_rejected():
+    items = [
+        BatchItem(id="a", path="/state/session/{{b.data.session_id}}"),
+        BatchItem(id="b", path="/state/session/x", depends_on=["a"]),
+    ]
+    with pytest.raises(HTTPException) as exc:
+        plan_dependencies(items)
+    assert exc.value.status_code == 422
+
+
+def test_reference_values_are_encoded_as_a_single_path_segment():
+    results = _run(
+        [
+            {"id": "start", "method": "POST", "path": "/state/session/start", "body": {"scenario_id": "a?b c"}},
+            {"id": "detail", "path": "/state/session/{{start.data.session_id}}"},
+        ]
+    )
+
+    assert results[1].body == {"data": {"session_id": "s-a?b c"}}
+
+    results = _run(
+        [
+            {"id": "start", "method": "POST", "path": "/state/session/start", "body": {"scenario_id": "x/../y"}},
+            {"id": "detail", "path": "/state/session/{{start.data.session_id}}"},
+        ]
+    )
+
+    assert results[1].status_code == 422
+
+
+def test_pre_authenticated_items_skip_middleware_and_token_verification():
+    passes = {"middleware": 0}
+    verified = TokenClaims(sub="u-1")
+    inner = FastAPI()
+
+    @inner.middleware("http")
+    async def _count(request, call_next):
+        passes["middleware"] += 1
+        return await call_next(request)
+
+    @inner.exception_handler(HTTPException)
+    async def _wrapped(request, exc):
+        return JSONResponse(status_code=exc.status_code, content={"wrapped": exc.detail})
+
+    @inner.get("/me")
+    async def _me(claims: TokenClaims = Depends(get_claims)):
+        return {"sub": claims.sub}
+
+    @inner.get("/missing")
+    async def _missing():
+        raise HTTPException(status_code=404, detail="없음")
+
+    @inner.post("/batch")
+    async def _batch(request: Request):
+        # 위조 토큰이지만 배치 요청에서 검증한 클레임을 넘겼으므로 하위 요청은 다시 검증하지 않습니다.
+        dispatch = PreAuthenticatedRouter(request, "not-a-jwt", verified)
+        executor = BatchExecutor(dispatch, inner.routes, "Bearer not-a-jwt", 2)
+        results = await executor.run([BatchItem(id="me", path="/me"), BatchItem(id="gone", path="/missing")])
+        return [r.model_dump() for r in results]
+
+    async def _call():
+        transport = httpx.ASGITransport(app=inner)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return (await client.post("/batch")).json()
+
+    results = asyncio.run(_call())
+
+    assert passes["middleware"] == 1
+    assert results[0]["status_code"] == 200 and results[0]["body"] == {"sub": "u-1"}
+    assert results[1]["status_code"] == 404 and results[1]["body"] == {"wrapped": "없음"}
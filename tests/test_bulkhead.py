@@ -0,0 +1,109 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from configs.bulkheads import BulkheadConfig, Priority
+from utils import bulkhead_middleware
+from utils.bulkhead import Bulkhead, BulkheadRegistry, BulkheadRejected
+from utils.bulkhead_middleware import QUEUE_POSITION_HEADER, BulkheadMiddleware
+
+
+def test_waiters_are_admitted_by_priority_then_arrival():
+    async def _run():
+        bulkhead = Bulkhead("llm", BulkheadConfig(max_concurrent=1, max_queue=10))
+        await bulkhead.acquire(Priority.BACKGROUND)
+        order = []
+
+        async def _request(label, priority):
+            position = await bulkhead.acquire(priority)
+            order.append((label, position))
+            bulkhead.release(0.01)
+
+        tasks = [
+            asyncio.create_task(_request("summary", Priority.BACKGROUND)),
+            asyncio.create_task(_request("turn-1", Priority.INTERACTIVE)),
+            asyncio.create_task(_request("turn-2", Priority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        bulkhead.release(0.01)
+        await asyncio.gather(*tasks)
+        return order, bulkhead
+
+    order, bulkhead = asyncio.run(_run())
+    assert [label for label, _ in order] == ["turn-1", "turn-2", "summary"]
+    assert dict(order) == {"summary": 1, "turn-1": 1, "turn-2": 2}
+    assert bulkhead.active == 0
+
+
+def test_full_queue_sheds_lower_priority_waiter_for_interactive_request():
+    async def _run():
+        bulkhead = Bulkhead("llm", BulkheadConfig(max_concurrent=1, max_queue=1))
+        await bulkhead.acquire(Priority.INTERACTIVE)
+        background = asyncio.create_task(bulkhead.acquire(Priority.BACKGROUND))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(bulkhead.acquire(Priority.INTERACTIVE))
+        await asyncio.sleep(0)
+
+        with pytest.raises(BulkheadRejected) as shed:
+            await background
+        with pytest.raises(BulkheadRejected) as full:
+            await bulkhead.acquire(Priority.BACKGROUND)
+
+        bulkhead.release(2.0)
+        assert await interactive == 1
+        return shed.value, full.value
+
+    shed, full = asyncio.run(_run())
+    assert shed.reason == "shed"
+    assert full.reason == "full"
+    assert full.retry_after >= 1
+
+
+def test_cancelled_waiter_leaves_queue():
+    async def _run():
+        bulkhead = Bulkhead("llm", BulkheadConfig(max_concurrent=1, max_queue=5))
+        await bulkhead.acquire(Priority.INTERACTIVE)
+        waiter = asyncio.create_task(bulkhead.acquire(Priority.INTERACTIVE))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        bulkhead.release(0.1)
+        return bulkhead
+
+    bulkhead = asyncio.run(_run())
+    assert bulkhead.waiting == 0
+    assert bulkhead.active == 0
+
+
+def test_middleware_rejects_with_hints_and_leaves_fast_routes_alone(monkeypatch):
+    registry = BulkheadRegistry({"llm": BulkheadConfig(max_concurrent=1, max_queue=0)})
+    monkeypatch.setattr(bulkhead_middleware, "bulkheads", registry)
+    monkeypatch.setattr(bulkhead_middleware, "ROUTE_BULKHEADS", {"/gm/turn": ("llm", Priority.INTERACTIVE)})
+
+    app = FastAPI()
+    app.add_middleware(BulkheadMiddleware)
+
+    @app.post("/gm/turn")
+    async def _turn():
+        return {"ok": True}
+
+    @app.get("/auth/me")
+    async def _me():
+        return {"ok": True}
+
+    client = TestClient(app)
+    assert client.post("/gm/turn").status_code == 200
+
+    # 슬롯을 점유한 상태에서는 LLM 라우트만 거절되고 빠른 라우트는 그대로 처리됩니다.
+    registry.get("llm").active = 1
+    rejected = client.post("/gm/turn")
+    assert rejected.status_code == 503
+    assert rejected.headers["retry-after"] == "1"
+    assert rejected.headers[QUEUE_POSITION_HEADER] == "1"
+    assert client.get("/auth/me").status_code == 200
@@ -0,0 +1,142 @@
+import os
+import time
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from jose import jwt
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils import claims as claims_module
+from utils.claims import ClaimsCache, TokenClaims, UnauthorizedMessages, claims_dependency, get_claims, verify_token
+
+SECRET = "test-secret"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(monkeypatch):
+    monkeypatch.setattr(claims_module, "SECRET_KEY", SECRET)
+    monkeypatch.setattr(claims_module, "ALGORITHM", "HS256")
+    monkeypatch.setattr(claims_module, "claims_cache", ClaimsCache(max_entries=2))
+    return claims_module.claims_cache
+
+
+def _token(sub="7", exp_in=60, **extra):
+    payload = {"sub": sub, **extra}
+    if exp_in is not None:
+        payload["exp"] = int(time.time()) + exp_in
+    return jwt.encode(payload, SECRET, algorithm="HS256")
+
+
+def test_cached_claims_skip_signature_verification(monkeypatch, _isolated_cache):
+    token = _token(username="explorer_1")
+    first = verify_token(token)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("캐시된 토큰을 다시 검증했습니다.")
+
+    monkeypatch.setattr(claims_module.jwt, "decode", _fail)
+    second = verify_token(token)
+
+    assert second is first
+    assert first.user_id == "7" and first.username == "explorer_1"
+    assert _isolated_cache.snapshot()["hits"] == 1
+
+
+def test_expired_entry_is_dropped_and_reverified(_isolated_cache):
+    token = _token(exp_in=60)
+    verify_token(token)
+
+    # 캐시 항목의 만료 시각을 지난 것으로 만들어 토큰의 exp를 따르는지 확인합니다.
+    key = next(iter(_isolated_cache._entries))
+    claims, _ = _isolated_cache._entries[key]
+    _isolated_cache._entries[key] = (claims, time.time() - 1)
+
+    assert _isolated_cache.get(token) is None
+    assert len(_isolated_cache) == 0
+    assert _isolated_cache.snapshot()["expired"] == 1
+
+
+def test_cache_is_bounded_lru_and_skips_tokens_without_exp(_isolated_cache):
+    a, b, c = _token("1"), _token("2"), _token("3")
+    verify_token(a)
+    verify_token(b)
+    verify_token(a)  # a를 최근 사용으로 갱신
+    verify_token(c)  # 가장 오래된 b가 밀려납니다.
+
+    assert _isolated_cache.get(a) is not None
+    assert _isolated_cache.get(b) is None
+    assert _isolated_cache.snapshot()["evictions"] == 1
+
+    verify_token(_token("4", exp_in=None))
+    assert len(_isolated_cache) == 2
+
+
+@pytest.mark.parametrize(
+    "make_token, detail",
+    [
+        (lambda: "not-a-jwt", "인증에 실패하였습니다."),
+        (lambda: _token(exp_in=-10), "로그인 세션이 만료되었습니다. 다시 로그인해주세요."),
+        (
+            lambda: jwt.encode({"exp": int(time.time()) + 60}, SECRET, algorithm="HS256"),
+            "유효하지 않은 인증 정보입니다.",
+        ),
+    ],
+)
+def test_invalid_tokens_are_rejected(make_token, detail, _isolated_cache):
+    with pytest.raises(HTTPException) as exc:
+        verify_token(make_token())
+
+    assert exc.value.status_code == 401
+    assert exc.value.detail == detail
+    assert len(_isolated_cache) == 0
+
+
+def test_dependency_verifies_once_per_request(monkeypatch):
+    calls = []
+    decode = claims_module.jwt.decode
+
+    def _counting_decode(*args, **kwargs):
+        calls.append(True)
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(claims_module.jwt, "decode", _counting_decode)
+
+    async def _user_id(claims: TokenClaims = Depends(get_claims)) -> str:
+        return claims.user_id
+
+    app = FastAPI()
+
+    @app.get("/me")
+    async def _me(claims: TokenClaims = Depends(get_claims), user_id: str = Depends(_user_id)):
+        return {"sub": claims.sub, "user_id": user_id}
+
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {_token('42')}"}
+
+    assert client.get("/me", headers=headers).json() == {"sub": "42", "user_id": "42"}
+    assert client.get("/me", headers=headers).status_code == 200
+    assert len(calls) == 1
+    assert client.get("/me").status_code in (401, 403)
+
+
+def test_route_specific_dependency_keeps_its_own_messages():
+    me_claims = claims_dependency(
+        UnauthorizedMessages(expired="토큰이 만료되었습니다.", invalid="인증에 실패했습니다.")
+    )
+    app = FastAPI()
+
+    @app.get("/me")
+    async def _me(claims: TokenClaims = Depends(me_claims)):
+        return {"sub": claims.sub}
+
+    client = TestClient(app)
+
+    def _get(token):
+        return client.get("/me", headers={"Authorization": f"Bearer {token}"})
+
+    assert _get(_token("42")).json() == {"sub": "42"}
+    assert _get(_token(exp_in=-10)).json()["detail"] == "토큰이 만료되었습니다."
+    assert _get("not-a-jwt").json()["detail"] == "인증에 실패했습니다."
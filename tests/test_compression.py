@@ -0,0 +1,155 @@
+import asyncio
+import gzip
+import os
+import zlib
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils import compression
+from utils import proxy_request as proxy_module
+from utils.compression import negotiate, negotiated_encoding
+from utils.compression_middleware import CompressionMiddleware
+from utils.response_cache import CachePolicy, response_cache
+
+LARGE = {"npcs": [{"name": "상인", "description": "마을 광장의 상인"} for _ in range(200)]}
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware)
+
+
+@app.get("/large")
+def _large():
+    return LARGE
+
+
+@app.get("/small")
+def _small():
+    return {"ok": True}
+
+
+@app.get("/stream")
+def _stream():
+    async def _events():
+        for i in range(3):
+            yield f"data: {i}\n\n".encode()
+
+    return StreamingResponse(_events(), media_type="text/event-stream")
+
+
+client = TestClient(app)
+
+
+def test_negotiation_honours_q_values_and_available_codecs():
+    assert negotiate("gzip") == "gzip"
+    assert negotiate("gzip;q=0.5, br;q=0.8") == ("br" if "br" in compression.CODECS else "gzip")
+    assert negotiate("identity") is None
+    assert negotiate("gzip;q=0") is None
+    assert negotiate(None) is None
+
+
+def test_large_responses_are_compressed_and_small_ones_are_not():
+    large = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert large.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in large.headers["vary"]
+    assert large.json() == LARGE
+
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+def test_streaming_responses_are_compressed_chunk_by_chunk():
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        raw_chunks = list(response.iter_raw())
+
+    # 각 청크가 flush되어 있으므로 첫 청크만으로도 첫 이벤트를 복원할 수 있습니다.
+    decoder = zlib.decompressobj(31)
+    assert decoder.decompress(raw_chunks[0]).startswith(b"data: 0\n\n")
+    assert gzip.decompress(b"".join(raw_chunks)) == b"data: 0\n\ndata: 1\n\ndata: 2\n\n"
+
+
+def test_cached_passthrough_reuses_precompressed_body(monkeypatch):
+    body = b'{"status":"success","data":"' + b"x" * 4096 + b'"}'
+    calls = {"compress": 0}
+    original = compression.CODECS["gzip"]
+
+    def _counting_gzip(data):
+        calls["compress"] += 1
+        return original(data)
+
+    monkeypatch.setitem(compression.CODECS, "gzip", _counting_gzip)
+
+    class _Response:
+        status_code = 200
+        content = body
+        headers = {"content-type": "application/json"}
+
+    class _Client:
+        async def request(self, **kwargs):
+            return _Response()
+
+    response_cache.local.clear()
+    proxy_module.http_holder.client = _Client()
+    policy = CachePolicy(ttl=60)
+
+    async def _run():
+        negotiated_encoding.set("gzip")
+        results = []
+        for _ in range(3):
+            results.append(
+                await proxy_module.proxy_request(
+                    "GET", "http://rule:8030", "/info/world", "t", cache=policy, passthrough=True
+                )
+            )
+        return results
+
+    results = asyncio.run(_run())
+    assert calls["compress"] == 1
+    assert all(r.headers["content-encoding"] == "gzip" for r in results)
+    assert gzip.decompress(results[-1].body) == body
+
+
+def test_cache_miss_compresses_only_the_negotiated_encoding(monkeypatch):
+    body = b'{"status":"success","data":"' + b"y" * 4096 + b'"}'
+    calls = []
+    monkeypatch.setattr(compression, "CODECS", {})
+    monkeypatch.setitem(compression.CODECS, "gzip", lambda data: calls.append("gzip") or gzip.compress(data))
+    monkeypatch.setitem(compression.CODECS, "identity-test", lambda data: calls.append("identity-test") or data)
+
+    class _Response:
+        status_code = 200
+        content = body
+        headers = {"content-type": "application/json"}
+
+    class _Client:
+        async def request(self, **kwargs):
+            return _Response()
+
+    response_cache.local.clear()
+    proxy_module.http_holder.client = _Client()
+    policy = CachePolicy(ttl=60)
+
+    async def _get(encoding):
+        negotiated_encoding.set(encoding)
+        return await proxy_module.proxy_request(
+            "GET", "http://rule:8030", "/info/items", "t", cache=policy, passthrough=True
+        )
+
+    async def _run():
+        first = await _get("gzip")
+        assert calls == ["gzip"]
+        # 다른 인코딩은 처음 요청될 때 한 번만 만들어집니다.
+        await _get("identity-test")
+        await _get("identity-test")
+        return first
+
+    first = asyncio.run(_run())
+    assert calls == ["gzip", "identity-test"]
+    assert gzip.decompress(first.body) == body
+    assert response_cache.local.current_bytes == sum(entry.size for entry in response_cache.local._entries.values())
@@ -0,0 +1,132 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import HTTPException
+from psycopg_pool import PoolTimeout
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils.db_session import RELEASED_AFTER_UNIT, LazyCursor
+from utils.metrics import db_connection_hold_seconds
+from utils.sql_registry import SqlQuery
+
+
+class _Cursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def execute(self, query, params=None, prepare=None):
+        self.conn.log.append(("execute", query))
+        self.conn.prepared.append(prepare)
+
+    async def fetchone(self):
+        return {"user_id": 1}
+
+    async def fetchall(self):
+        return [{"user_id": 1}]
+
+    async def close(self):
+        pass
+
+
+class _Conn:
+    def __init__(self):
+        self.log = []
+        self.prepared = []
+
+    def cursor(self):
+        return _Cursor(self)
+
+    async def commit(self):
+        self.log.append(("commit",))
+
+    async def rollback(self):
+        self.log.append(("rollback",))
+
+
+class _Pool:
+    def __init__(self, size=1):
+        self.available = [_Conn() for _ in range(size)]
+        self.checkouts = 0
+
+    async def getconn(self, timeout=None):
+        if not self.available:
+            raise PoolTimeout("pool exhausted")
+        self.checkouts += 1
+        return self.available.pop()
+
+    async def putconn(self, conn):
+        self.available.append(conn)
+
+
+def test_connection_is_not_checked_out_until_first_query():
+    pool = _Pool()
+    cursor = LazyCursor(pool, acquire_timeout=1.0)
+
+    async def _run():
+        async with cursor:
+            pass
+        await cursor.release()
+
+    asyncio.run(_run())
+    assert pool.checkouts == 0
+
+
+def test_unit_of_work_commits_and_returns_connection_before_slow_step():
+    pool = _Pool(size=1)
+    cursor = LazyCursor(pool, acquire_timeout=1.0)
+    released_before = db_connection_hold_seconds.count(RELEASED_AFTER_UNIT)
+
+    async def _run():
+        async with cursor:
+            await cursor.execute("SELECT 1")
+            row = await cursor.fetchone()
+        # 블록을 벗어나면 bcrypt/업스트림 호출 같은 느린 단계 전에 커넥션이 반납되어 있어야 합니다.
+        return row, len(pool.available)
+
+    row, available = asyncio.run(_run())
+    assert row == {"user_id": 1}
+    assert available == 1
+    assert pool.available[0].log == [("execute", "SELECT 1"), ("commit",)]
+    assert db_connection_hold_seconds.count(RELEASED_AFTER_UNIT) == released_before + 1
+
+
+def test_failed_unit_of_work_rolls_back():
+    pool = _Pool(size=1)
+    cursor = LazyCursor(pool, acquire_timeout=1.0)
+
+    async def _run():
+        with pytest.raises(ValueError):
+            async with cursor:
+                await cursor.execute("INSERT ...")
+                raise ValueError("중복 사용자")
+
+    asyncio.run(_run())
+    assert not cursor.connected
+    assert pool.available[0].log[-1] == ("rollback",)
+
+
+def test_pool_exhaustion_is_reported_as_503():
+    pool = _Pool(size=0)
+    cursor = LazyCursor(pool, acquire_timeout=0.01)
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(cursor.execute("SELECT 1"))
+    assert exc.value.status_code == 503
+    assert exc.value.headers["Retry-After"] == "1"
+
+
+def test_registry_queries_are_executed_as_prepared_statements():
+    pool = _Pool(size=1)
+    cursor = LazyCursor(pool, acquire_timeout=1.0)
+    query = SqlQuery(domain="auth", name="get_user_by_id", text="SELECT 1", path="get_user_by_id.sql")
+
+    async def _run():
+        async with cursor:
+            await cursor.execute(query, {"user_id": 1})
+            await cursor.execute("SELECT 2")
+
+    asyncio.run(_run())
+    assert pool.available[0].prepared == [True, None]
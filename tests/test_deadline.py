@@ -0,0 +1,161 @@
+import asyncio
+import os
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from starlette.responses import StreamingResponse
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from configs.deadlines import RouteDeadline
+from utils import proxy_request as proxy_module
+from utils.deadline import DEADLINE_HEADER, Deadline, RouteBudgets, current_deadline, route_budgets
+from utils.deadline_middleware import DeadlineMiddleware
+
+app = FastAPI()
+app.add_middleware(DeadlineMiddleware)
+cancelled = []
+
+
+@app.get("/slow")
+async def _slow():
+    try:
+        await asyncio.sleep(5)
+    except asyncio.CancelledError:
+        cancelled.append(True)
+        raise
+    return {"ok": True}
+
+
+@app.get("/remaining")
+async def _remaining():
+    return {"remaining": current_deadline.get().remaining()}
+
+
+@app.get("/stream")
+async def _stream():
+    async def _events():
+        for i in range(3):
+            await asyncio.sleep(0.05)
+            yield f"data: {i}\n\n".encode()
+
+    return StreamingResponse(_events(), media_type="text/event-stream")
+
+
+client = TestClient(app)
+
+
+def test_client_budget_cancels_handler_and_returns_504():
+    response = client.get("/slow", headers={DEADLINE_HEADER: "50"})
+
+    assert response.status_code == 504
+    assert response.json()["status"] == "error"
+    assert cancelled == [True]
+
+
+def test_client_budget_cannot_extend_route_budget():
+    short = client.get("/remaining", headers={DEADLINE_HEADER: "200"}).json()["remaining"]
+    capped = client.get("/remaining", headers={DEADLINE_HEADER: str(10**9)}).json()["remaining"]
+
+    assert short <= 0.2
+    assert 15 < capped <= 60
+
+
+def test_deadline_is_lifted_once_streaming_response_starts():
+    response = client.get("/stream", headers={DEADLINE_HEADER: "60"})
+
+    assert response.status_code == 200
+    assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+
+
+def test_adaptive_budget_follows_p99_between_floor_and_ceiling():
+    routes = {
+        "/gm/history/{session_id}": RouteDeadline(budget=60.0, adaptive=True),
+        "/minigame/tip-sentence": RouteDeadline(budget=30.0, adaptive=True),
+    }
+    budgets = RouteBudgets(routes, default=60.0, multiplier=2.0, floor=1.0)
+    assert budgets.budget_for("/gm/history/{session_id}") == 60.0
+
+    for _ in range(200):
+        budgets.observe("/gm/history/{session_id}", 4.0)
+        budgets.observe("/minigame/tip-sentence", 0.01)
+    assert budgets.budget_for("/gm/history/{session_id}") == 8.0
+    assert budgets.budget_for("/minigame/tip-sentence") == 1.0
+
+
+def test_unlisted_and_idempotent_routes_keep_their_full_budget():
+    # 재시도 중복을 막는 상태 변경 라우트는 adaptive로 등록해도 줄이지 않습니다.
+    budgets = RouteBudgets(
+        {"/gm/turn": RouteDeadline(budget=120.0, adaptive=True)}, default=60.0, multiplier=2.0, floor=1.0
+    )
+    for _ in range(200):
+        budgets.observe("/gm/turn", 4.0)
+        budgets.observe("/state/scenarios", 0.01)
+
+    assert budgets.budget_for("/gm/turn") == 120.0
+    assert budgets.budget_for("/state/scenarios") == 60.0
+
+
+def test_only_successful_responses_feed_the_latency_window(monkeypatch):
+    observed = []
+    monkeypatch.setattr(route_budgets, "observe", lambda route, seconds: observed.append(route))
+
+    @app.get("/missing")
+    async def _missing():
+        raise HTTPException(status_code=404, detail="없음")
+
+    client.get("/missing")
+    client.get("/slow", headers={DEADLINE_HEADER: "50"})
+    client.get("/remaining")
+
+    assert observed == ["/remaining"]
+
+
+def test_proxy_request_forwards_remaining_budget_and_bounds_timeout():
+    seen = {}
+
+    class _Response:
+        status_code = 200
+        text = ""
+
+        def json(self):
+            return {}
+
+    class _Client:
+        timeout = httpx.Timeout(120.0)
+
+        async def request(self, **kwargs):
+            seen.update(kwargs)
+            return _Response()
+
+    proxy_module.http_holder.client = _Client()
+
+    async def _run():
+        current_deadline.set(Deadline.after(2.0))
+        await proxy_module.proxy_request("POST", "http://gm:8020", "/api/v1/game/turn", "t", json={})
+
+    asyncio.run(_run())
+    assert 1000 < int(seen["headers"][DEADLINE_HEADER]) <= 2000
+    assert seen["timeout"].read <= 2.0
+
+
+def test_spent_budget_skips_upstream_call():
+    calls = []
+
+    class _Client:
+        async def request(self, **kwargs):
+            calls.append(kwargs)
+
+    proxy_module.http_holder.client = _Client()
+
+    async def _run():
+        current_deadline.set(Deadline.after(0))
+        await proxy_module.proxy_request("POST", "http://gm:8020", "/api/v1/game/turn", "t", json={})
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(_run())
+    assert exc.value.status_code == 504
+    assert calls == []
@@ -0,0 +1,127 @@
+import asyncio
+import os
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils import proxy_request as proxy_module
+from utils.compression_middleware import CompressionMiddleware
+from utils.etag import compute_etag, etag_matches
+from utils.etag_middleware import ConditionalGetMiddleware
+from utils.response_cache import CachePolicy, response_cache
+
+WORLD = {"regions": [{"name": f"region-{i}", "description": "안개 낀 숲"} for i in range(100)]}
+
+app = FastAPI()
+app.add_middleware(ConditionalGetMiddleware)
+app.add_middleware(CompressionMiddleware)
+
+
+@app.api_route("/info/world", methods=["GET", "HEAD"])
+def _world():
+    return WORLD
+
+
+@app.api_route("/upstream-validator", methods=["GET", "HEAD"])
+def _upstream_validator():
+    return Response(b"{}", media_type="application/json", headers={"ETag": '"upstream-v1"'})
+
+
+client = TestClient(app)
+
+
+def test_weak_comparison_handles_lists_and_wildcards():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"x"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
+
+
+def test_matching_if_none_match_returns_304_without_body():
+    first = client.get("/info/world", headers={"Accept-Encoding": "identity"})
+    etag = first.headers["etag"]
+    assert etag == compute_etag(first.content)
+
+    second = client.get("/info/world", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+def test_not_modified_keeps_cors_headers_added_inside():
+    cors_app = FastAPI()
+    cors_app.add_middleware(CORSMiddleware, allow_origins=["https://game.example"])
+    cors_app.add_middleware(ConditionalGetMiddleware)
+    cors_app.get("/info/world")(_world)
+    cors_client = TestClient(cors_app)
+    origin = {"Origin": "https://game.example"}
+
+    etag = cors_client.get("/info/world", headers=origin).headers["etag"]
+    revalidated = cors_client.get("/info/world", headers={**origin, "If-None-Match": etag})
+
+    assert revalidated.status_code == 304
+    assert revalidated.headers["access-control-allow-origin"] == "https://game.example"
+    assert "origin" in revalidated.headers["vary"].lower()
+
+
+def test_compressed_responses_carry_weak_etag_that_still_revalidates():
+    compressed = client.get("/info/world", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"].startswith("W/")
+
+    revalidated = client.get(
+        "/info/world", headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+
+
+def test_existing_upstream_validator_is_reused():
+    response = client.get("/upstream-validator", headers={"If-None-Match": '"upstream-v1"'})
+    assert response.status_code == 304
+
+
+def test_head_does_not_get_an_etag_computed_from_its_empty_body():
+    etag = client.get("/info/world", headers={"Accept-Encoding": "identity"}).headers["etag"]
+
+    head = client.head("/info/world", headers={"If-None-Match": compute_etag(b"")})
+    assert head.status_code == 200
+    assert "etag" not in head.headers
+    assert client.head("/info/world", headers={"If-None-Match": etag}).status_code == 200
+
+    # 업스트림 검증자처럼 이미 있는 ETag는 HEAD에서도 그대로 비교합니다.
+    assert client.head("/upstream-validator", headers={"If-None-Match": '"upstream-v1"'}).status_code == 304
+
+
+def test_cached_passthrough_exposes_entry_etag_without_contacting_upstream():
+    calls = {"n": 0}
+
+    class _Response:
+        status_code = 200
+        content = b'{"status":"success","data":{}}'
+        headers = {"content-type": "application/json"}
+
+    class _Client:
+        async def request(self, **kwargs):
+            calls["n"] += 1
+            return _Response()
+
+    response_cache.local.clear()
+    proxy_module.http_holder.client = _Client()
+    policy = CachePolicy(ttl=60)
+
+    async def _run():
+        return [
+            await proxy_module.proxy_request(
+                "GET", "http://rule:8030", "/info/world", "t", cache=policy, passthrough=True
+            )
+            for _ in range(2)
+        ]
+
+    first, second = asyncio.run(_run())
+    assert calls["n"] == 1
+    assert first.headers["etag"] == second.headers["etag"] == compute_etag(_Response.content)
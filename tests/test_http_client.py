@@ -0,0 +1,53 @@
+import asyncio
+
+import httpx
+
+from configs.http_client import HttpClientHolder, InstrumentedTransport, PoolStats
+
+
+def test_holder_falls_back_to_shared_client():
+    holder = HttpClientHolder()
+    shared, dedicated = object(), object()
+    holder.client = shared
+    holder.clients["gm"] = dedicated
+
+    assert holder.get("gm") is dedicated
+    assert holder.get("rule_engine") is shared
+
+
+def test_instrumented_transport_tracks_pool_usage_and_chains_trace():
+    stats = PoolStats(max_connections=4)
+    seen = {}
+
+    async def _handler(request: httpx.Request):
+        seen["in_flight"] = stats.in_flight
+        await request.extensions["trace"]("http11.send_request_headers.started", {})
+        return httpx.Response(200, json={"ok": True})
+
+    traced = []
+
+    async def _caller_trace(event_name, info):
+        traced.append(event_name)
+
+    async def _run():
+        transport = InstrumentedTransport(httpx.MockTransport(_handler), stats)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.get("http://state:8040/state/scenarios", extensions={"trace": _caller_trace})
+
+    response = asyncio.run(_run())
+    assert response.status_code == 200
+    assert seen["in_flight"] == 1
+    assert stats.in_flight == 0
+    assert stats.snapshot()["requests"] == 1
+    assert traced == ["http11.send_request_headers.started"]
+
+
+def test_fast_pool_keeps_previous_read_timeout_and_is_overridable(monkeypatch):
+    from configs.upstreams import _FAST_POOL, _pool_config
+
+    assert _pool_config("rule_engine", _FAST_POOL).read_timeout == 60.0
+
+    monkeypatch.setenv("RULE_ENGINE_POOL_READ_TIMEOUT", "10")
+    assert _pool_config("rule_engine", _FAST_POOL).read_timeout == 10.0
+    monkeypatch.setenv("RULE_ENGINE_POOL_READ_TIMEOUT", "none")
+    assert _pool_config("rule_engine", _FAST_POOL).read_timeout is None
@@ -0,0 +1,113 @@
+import asyncio
+import os
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils import idempotency_middleware
+from utils.idempotency import IDEMPOTENCY_HEADER, REPLAYED_HEADER, ClaimResult, IdempotencyStore, StoredResponse
+from utils.idempotency_middleware import IdempotencyMiddleware
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+def _build(monkeypatch):
+    store = IdempotencyStore(ttl=60, lock_seconds=10)
+    store.attach_redis(_FakeRedis())
+    monkeypatch.setattr(idempotency_middleware, "idempotency_store", store)
+    calls = []
+    app = FastAPI()
+    app.add_middleware(IdempotencyMiddleware)
+
+    @app.post("/gm/turn")
+    async def _turn(request: Request):
+        payload = await request.json()
+        calls.append(payload)
+        await asyncio.sleep(0.05)
+        if payload.get("fail"):
+            return JSONResponse({"status": "error"}, status_code=502)
+        return {"turn": len(calls)}
+
+    return app, calls
+
+
+def _post(app, requests):
+    async def _run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(
+                *(client.post("/gm/turn", json=body, headers=headers) for body, headers in requests)
+            )
+
+    return asyncio.run(_run())
+
+
+def test_concurrent_and_later_duplicates_share_one_execution(monkeypatch):
+    app, calls = _build(monkeypatch)
+    key = {IDEMPOTENCY_HEADER: "turn-1", "Authorization": "Bearer jwt"}
+    first, second = _post(app, [({"content": "look"}, key)] * 2)
+    (third,) = _post(app, [({"content": "look"}, key)])
+
+    assert len(calls) == 1
+    assert first.json() == second.json() == third.json() == {"turn": 1}
+    assert third.headers[REPLAYED_HEADER] == "true"
+
+
+def test_reusing_key_with_different_body_is_rejected(monkeypatch):
+    app, calls = _build(monkeypatch)
+    key = {IDEMPOTENCY_HEADER: "turn-2"}
+    _post(app, [({"content": "look"}, key)])
+    (conflict,) = _post(app, [({"content": "attack"}, key)])
+
+    assert conflict.status_code == 422
+    assert len(calls) == 1
+
+
+def test_server_errors_are_not_stored_and_requests_without_key_pass_through(monkeypatch):
+    app, calls = _build(monkeypatch)
+    key = {IDEMPOTENCY_HEADER: "turn-3"}
+    _post(app, [({"fail": True}, key)])
+    _post(app, [({"fail": True}, key)])
+    _post(app, [({"content": "look"}, {})] * 2)
+
+    assert len(calls) == 4
+
+
+def test_duplicate_on_another_instance_waits_for_shared_result():
+    redis = _FakeRedis()
+    owner, other = IdempotencyStore(ttl=60, lock_seconds=10), IdempotencyStore(ttl=60, lock_seconds=10)
+    owner.attach_redis(redis)
+    other.attach_redis(redis)
+    other.poll_interval = 0.01
+    stored = StoredResponse(status=200, headers=[("content-type", "application/json")], body=b'{"turn":1}')
+
+    async def _run():
+        assert await owner.claim("k", "fp") is ClaimResult.OWNER
+        waiter = asyncio.create_task(other.claim("k", "fp"))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        await owner.complete("k", stored)
+        return await waiter, await other.claim("k", "other-body")
+
+    replayed, conflict = asyncio.run(_run())
+    assert replayed == stored
+    assert conflict is ClaimResult.CONFLICT
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import os
+from contextlib import asynccontextmanager
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from info.item_catalog import ITEM_CATALOG_CHANNEL, ItemCatalog, publish_item_changes
+from info.item_service import ItemService
+
+
+class _Table:
+    """items 테이블과 카탈로그가 실행한 쿼리 이름을 기록하는 가짜 DB"""
+
+    def __init__(self, item_ids):
+        self.items = {item_id: {"item_id": item_id, "name": f"item-{item_id}"} for item_id in item_ids}
+        self.executions = []
+
+    @asynccontextmanager
+    async def cursor_factory(self):
+        yield _Cursor(self)
+
+
+class _Cursor:
+    def __init__(self, table):
+        self.table = table
+        self.rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=None):
+        self.table.executions.append(query.name)
+        wanted = params["item_ids"] if params else sorted(self.table.items)
+        self.rows = [dict(self.table.items[i]) for i in sorted(wanted) if i in self.table.items]
+        if query.name == "get_item_checksums":
+            self.rows = [{"item_id": row["item_id"], "checksum": json.dumps(row, sort_keys=True)} for row in self.rows]
+
+    async def fetchall(self):
+        return self.rows
+
+
+class _Redis:
+    def __init__(self, version=0):
+        self.version = version
+        self.published = []
+
+    async def get(self, key):
+        return str(self.version).encode()
+
+    async def incr(self, key):
+        self.version += 1
+        return self.version
+
+    async def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+
+
+def _loaded_catalog(table, redis=None, checksum_seconds=None):
+    catalog = ItemCatalog(resync_seconds=60, checksum_seconds=checksum_seconds)
+    catalog._cursor_factory = table.cursor_factory
+    catalog._redis = redis
+    asyncio.run(catalog.reload())
+    return catalog
+
+
+def test_pages_match_sql_semantics():
+    catalog = _loaded_catalog(_Table(range(1, 26)))
+
+    items, total = catalog.page(None, skip=20, limit=10)
+    assert [i["item_id"] for i in items] == [21, 22, 23, 24, 25]
+    assert total == 25
+
+    # 중복/존재하지 않는 id는 SQL의 item_id = ANY(...)처럼 걸러집니다.
+    items, total = catalog.page([7, 3, 3, 99], skip=0, limit=10)
+    assert [i["item_id"] for i in items] == [3, 7]
+    assert total == 2
+
+    items, total = catalog.after([3, 7, 9], after_id=3, limit=1)
+    assert [i["item_id"] for i in items] == [7]
+    assert total == 3
+
+
+def test_service_pages_from_memory_without_touching_the_cursor():
+    catalog = _loaded_catalog(_Table(range(1, 26)))
+
+    class _UnusedCursor:
+        async def __aenter__(self):
+            raise AssertionError("카탈로그가 적재되어 있으면 DB를 조회하지 않아야 합니다.")
+
+    service = ItemService(_UnusedCursor(), catalog=catalog)
+
+    items, meta = asyncio.run(service.get_items(None, skip=0, limit=10))
+    assert len(items) == 10 and meta.total_count == 25 and meta.total_pages == 3
+
+    items[0]["name"] = "changed"
+    assert catalog.page([1], 0, 1)[0][0]["name"] == "item-1"
+
+    items, meta = asyncio.run(service.get_items_after(None, None, limit=10))
+    next_items, _ = asyncio.run(service.get_items_after(None, meta.next_cursor, limit=10))
+    assert next_items[0]["item_id"] == 11
+
+
+def test_next_version_reloads_only_changed_items():
+    table = _Table([1, 2, 3])
+    catalog = _loaded_catalog(table)
+    table.items[2]["name"] = "renamed"
+    del table.items[3]
+    table.items[4] = {"item_id": 4, "name": "item-4"}
+
+    asyncio.run(catalog.apply_change({"version": 1, "item_ids": [2, 3, 4]}))
+
+    assert table.executions == ["get_all_items", "get_items_by_ids"]
+    assert [i["name"] for i in catalog.page(None, 0, 10)[0]] == ["item-1", "renamed", "item-4"]
+    assert catalog.version == 1 and catalog.partial_reloads == 1
+
+    # 이미 반영한 버전은 무시합니다.
+    asyncio.run(catalog.apply_change({"version": 1, "item_ids": [1]}))
+    assert table.executions == ["get_all_items", "get_items_by_ids"]
+
+
+def test_version_gap_or_missed_notification_triggers_full_reload():
+    table = _Table([1, 2])
+    redis = _Redis(version=0)
+    catalog = _loaded_catalog(table, redis)
+
+    asyncio.run(catalog.apply_change({"version": 3, "item_ids": [1]}))
+    assert table.executions[-1] == "get_all_items" and catalog.version == 3
+
+    redis.version = 5
+    asyncio.run(catalog.resync())
+    assert catalog.version == 5 and catalog.full_reloads == 3
+
+    asyncio.run(catalog.resync())
+    assert catalog.full_reloads == 3
+
+
+def test_checksum_sweep_is_opt_in():
+    table = _Table([1, 2])
+    catalog = _loaded_catalog(table, _Redis(version=0))
+    table.items[1]["name"] = "edited-in-db"
+
+    asyncio.run(catalog.resync())
+
+    assert table.executions == ["get_all_items"]
+    assert catalog.page([1], 0, 1)[0][0]["name"] == "item-1"
+
+
+def test_resync_picks_up_writes_that_were_never_published():
+    table = _Table([1, 2, 3])
+    redis = _Redis(version=4)
+    catalog = _loaded_catalog(table, redis, checksum_seconds=0)
+    table.items[1]["name"] = "edited-in-db"
+    del table.items[2]
+    table.items[5] = {"item_id": 5, "name": "item-5"}
+
+    asyncio.run(catalog.resync())
+
+    assert [(i["item_id"], i["name"]) for i in catalog.page(None, 0, 10)[0]] == [
+        (1, "edited-in-db"),
+        (3, "item-3"),
+        (5, "item-5"),
+    ]
+    assert catalog.full_reloads == 1 and catalog.partial_reloads == 1 and catalog.version == 4
+
+    # 반영한 뒤에는 체크섬이 같아 다시 읽지 않습니다.
+    table.executions.clear()
+    asyncio.run(catalog.resync())
+    assert table.executions == ["get_item_checksums"]
+
+
+def test_publish_bumps_shared_version():
+    redis = _Redis(version=7)
+
+    version = asyncio.run(publish_item_changes(redis, [3, 1, 3]))
+
+    assert version == 8
+    assert redis.published == [(ITEM_CATALOG_CHANNEL, {"version": 8, "item_ids": [1, 3]})]
@@ -0,0 +1,79 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import HTTPException
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from info.item_service import ItemService
+
+
+class _KeysetCursor:
+    """get_items_keyset.sql의 결과 형태(개수 행 LEFT JOIN 목록)를 흉내 내는 커서"""
+
+    def __init__(self, item_ids):
+        self.items = [{"item_id": item_id, "name": f"item-{item_id}"} for item_id in item_ids]
+        self.executions = []
+        self.rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, query, params=None):
+        self.executions.append(query.name)
+        matching = [i for i in self.items if params["item_ids"] is None or i["item_id"] in params["item_ids"]]
+        page = [i for i in matching if i["item_id"] > params["after_id"]][: params["limit"]]
+        total = len(matching)
+        self.rows = [{**item, "total_count": total} for item in page] or [
+            {"item_id": None, "name": None, "total_count": total}
+        ]
+
+    async def fetchall(self):
+        return self.rows
+
+
+def test_keyset_pages_walk_all_items_in_one_round_trip_each():
+    cursor = _KeysetCursor(range(1, 26))
+    service = ItemService(cursor)
+
+    async def _walk():
+        pages, token = [], None
+        while True:
+            items, meta = await service.get_items_after(None, token, limit=10)
+            assert all("total_count" not in item for item in items)
+            pages.append(([i["item_id"] for i in items], meta))
+            token = meta.next_cursor
+            if token is None:
+                return pages
+
+    pages = asyncio.run(_walk())
+
+    assert [ids[0] for ids, _ in pages] == [1, 11, 21]
+    assert [meta.skip for _, meta in pages] == [0, 10, 20]
+    assert all(meta.total_count == 25 and meta.total_pages == 3 for _, meta in pages)
+    assert [meta.is_last_page for _, meta in pages] == [False, False, True]
+    assert pages[-1][0] == [21, 22, 23, 24, 25]
+    assert cursor.executions == ["get_items_keyset"] * 3
+
+
+def test_empty_page_still_reports_total():
+    service = ItemService(_KeysetCursor([1, 2, 3]))
+
+    items, meta = asyncio.run(service.get_items_after([99], None, limit=10))
+
+    assert items == []
+    assert meta.total_count == 0
+    assert meta.is_last_page and meta.next_cursor is None
+
+
+def test_tampered_cursor_is_rejected():
+    service = ItemService(_KeysetCursor([1]))
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(service.get_items_after(None, "not-a-cursor", limit=10))
+    assert exc.value.status_code == 400
@@ -0,0 +1,181 @@
+import asyncio
+import os
+import socket
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from configs.upstreams import DiscoveryConfig
+from gm.dtos.gm_dtos import UserInput
+from gm.gm_routers import GmRouter
+from utils import load_balancer as balancer_module
+from utils import proxy_request as proxy_module
+from utils.load_balancer import LoadBalancer, UpstreamBalancerRegistry, affinity_key
+
+ENDPOINTS = ("http://gm-1:8020", "http://gm-2:8020", "http://gm-3:8020", "http://gm-4:8020")
+
+
+def _balancer(strategy="p2c", **kwargs) -> LoadBalancer:
+    return LoadBalancer("gm", DiscoveryConfig(endpoints=ENDPOINTS, strategy=strategy, **kwargs))
+
+
+def test_least_outstanding_prefers_idle_instances():
+    balancer = _balancer("least_outstanding")
+    picked = [balancer.pick() for _ in range(4)]
+
+    assert sorted(e.url for e in picked) == sorted(ENDPOINTS)
+    balancer.release(picked[0], True)
+    assert balancer.pick() is picked[0]
+
+
+def test_power_of_two_choices_never_picks_the_busiest_instance():
+    balancer = _balancer("p2c")
+    busiest = balancer.endpoints[0]
+    busiest.outstanding = 100
+    for e in balancer.endpoints[1:]:
+        e.outstanding = 1
+
+    for _ in range(50):
+        chosen = balancer.pick()
+        assert chosen is not busiest
+        balancer.release(chosen, True)
+
+
+def test_consecutive_failures_eject_instance_up_to_max_percent():
+    balancer = _balancer("least_outstanding", consecutive_failures=2, max_ejection_percent=50)
+    for endpoint in balancer.endpoints:
+        for _ in range(2):
+            endpoint.outstanding += 1
+            balancer.release(endpoint, False)
+
+    ejected = [e for e in balancer.endpoints if e.ejections]
+    assert len(ejected) == 2
+    for _ in range(20):
+        chosen = balancer.pick()
+        assert chosen not in ejected
+        balancer.release(chosen, None)
+
+
+def test_dns_update_keeps_state_of_known_instances():
+    balancer = _balancer()
+    survivor = balancer.endpoints[1]
+    survivor.requests = 7
+    balancer.update(["http://gm-2:8020", "http://gm-9:8020"])
+
+    assert [e.url for e in balancer.endpoints] == ["http://gm-2:8020", "http://gm-9:8020"]
+    assert balancer.endpoints[0] is survivor
+
+
+def test_proxy_request_spreads_calls_across_instances(monkeypatch):
+    seen = []
+
+    class _Response:
+        status_code = 200
+        text = ""
+
+        def json(self):
+            return {}
+
+    class _Client:
+        async def request(self, **kwargs):
+            seen.append(kwargs["url"])
+            await asyncio.sleep(0)
+            return _Response()
+
+    registry = UpstreamBalancerRegistry({"gm:8020": DiscoveryConfig(endpoints=ENDPOINTS, strategy="least_outstanding")})
+    monkeypatch.setattr(proxy_module, "upstream_balancers", registry)
+    proxy_module.http_holder.client = _Client()
+
+    async def _run():
+        await asyncio.gather(
+            *(proxy_module.proxy_request("POST", "http://gm:8020", "/api/v1/game/turn", "t") for _ in range(8))
+        )
+
+    asyncio.run(_run())
+    assert {url.rsplit("/api", 1)[0] for url in seen} == set(ENDPOINTS)
+    assert all(url.endswith("/api/v1/game/turn") for url in seen)
+
+
+def test_dns_discovered_instances_keep_base_path_and_original_host(monkeypatch):
+    seen = []
+
+    class _Response:
+        status_code = 200
+        text = ""
+
+        def json(self):
+            return {}
+
+    class _Client:
+        async def request(self, **kwargs):
+            seen.append(kwargs)
+            return _Response()
+
+    async def _getaddrinfo(self, host, port, **kwargs):
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.7", port))]
+
+    base_url = "https://gm.internal:8443/gm"
+    registry = UpstreamBalancerRegistry({"gm": DiscoveryConfig(endpoints=(base_url,), dns_host="gm-headless")})
+    monkeypatch.setattr(balancer_module, "UPSTREAM_URLS", {"gm": base_url})
+    monkeypatch.setattr(asyncio.BaseEventLoop, "getaddrinfo", _getaddrinfo)
+    monkeypatch.setattr(proxy_module, "upstream_balancers", registry)
+    monkeypatch.setattr(proxy_module, "upstream_name", lambda url: "gm")
+    proxy_module.http_holder.client = _Client()
+
+    async def _run():
+        await registry.refresh()
+        await proxy_module.proxy_request("POST", base_url, "/api/v1/game/turn", "t")
+
+    asyncio.run(_run())
+
+    assert seen[0]["url"] == "https://10.0.0.7:8443/gm/api/v1/game/turn"
+    assert seen[0]["headers"]["Host"] == "gm.internal:8443"
+    assert seen[0]["extensions"] == {"sni_hostname": "gm.internal"}
+
+
+def _owners(balancer, keys):
+    owners = {}
+    for key in keys:
+        endpoint = balancer.pick(key)
+        balancer.release(endpoint, True)
+        owners[key] = endpoint.url
+    return owners
+
+
+def test_consistent_hash_keeps_sessions_on_one_instance_and_remaps_minimally():
+    balancer = _balancer()
+    keys = [f"session-{i}" for i in range(400)]
+    before = _owners(balancer, keys)
+
+    assert before == _owners(balancer, keys)
+    assert set(before.values()) == set(ENDPOINTS)
+
+    balancer.update(ENDPOINTS[:3])
+    after = _owners(balancer, keys)
+    moved = [k for k in keys if before[k] != after[k]]
+    assert all(before[k] == ENDPOINTS[3] for k in moved)
+
+
+def test_bounded_load_spills_hot_session_to_other_instances():
+    balancer = _balancer(hash_load_factor=1.25)
+    held = [balancer.pick("hot-session") for _ in range(40)]
+
+    assert max(e.outstanding for e in balancer.endpoints) <= 13
+    assert len({e.url for e in held}) > 1
+
+
+def test_gm_routes_pin_upstream_calls_to_session(monkeypatch):
+    seen = {}
+
+    async def _fake_proxy(method, base_url, path, token=None, params=None, json=None):
+        seen["key"] = affinity_key.get()
+        return {"ok": True}
+
+    monkeypatch.setattr("gm.gm_routers.proxy_request", _fake_proxy)
+    auth = HTTPAuthorizationCredentials(scheme="Bearer", credentials="jwt")
+    asyncio.run(GmRouter().play_turn(UserInput(session_id="s-42", content="look"), auth))
+
+    assert seen["key"] == "s-42"
+    assert affinity_key.get() is None
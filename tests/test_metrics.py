@@ -0,0 +1,97 @@
+import asyncio
+import os
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils import metrics
+from utils import proxy_request as proxy_module
+from utils.metrics import Counter, GaugeCollector, Histogram, MetricsRegistry
+from utils.metrics_middleware import UNMATCHED_ROUTE, MetricsMiddleware
+
+
+def test_registry_renders_prometheus_text_format():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("jobs_total", "jobs", ("kind",)))
+    histogram = registry.register(Histogram("job_seconds", "job time", ("kind",), buckets=(0.1, 1.0)))
+    registry.register(GaugeCollector("queue_depth", "depth", (), lambda: [((), 3)]))
+
+    counter.inc("a")
+    histogram.observe(0.05, "a")
+    histogram.observe(0.5, "a")
+    text = registry.render()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{kind="a"} 1' in text
+    assert 'job_seconds_bucket{kind="a",le="0.1"} 1' in text
+    assert 'job_seconds_bucket{kind="a",le="1"} 2' in text
+    assert 'job_seconds_bucket{kind="a",le="+Inf"} 2' in text
+    assert 'job_seconds_count{kind="a"} 2' in text
+    assert "queue_depth 3" in text
+
+
+def test_middleware_labels_requests_with_route_template():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/state/session/{session_id}")
+    def _session(session_id: str):
+        return {"session_id": session_id}
+
+    client = TestClient(app)
+    client.get("/state/session/abc")
+    client.get("/state/session/def")
+    client.get("/no/such/path")
+
+    assert metrics.http_requests_total.value("GET", "/state/session/{session_id}", "2xx") == 2
+    assert metrics.http_request_duration_seconds.count("GET", "/state/session/{session_id}") == 2
+    assert metrics.http_requests_total.value("GET", UNMATCHED_ROUTE, "4xx") >= 1
+
+
+def test_upstream_calls_are_recorded_per_service():
+    class _MockResponse:
+        status_code = 200
+        text = ""
+
+        def json(self):
+            return {"ok": True}
+
+    class _Client:
+        async def request(self, **kwargs):
+            return _MockResponse()
+
+    before = metrics.upstream_requests_total.value("metrics-test:8040", "request", "2xx")
+    proxy_module.http_holder.client = _Client()
+    asyncio.run(proxy_module.proxy_request("POST", "http://metrics-test:8040", "/state/x", "t", json={}))
+
+    assert metrics.upstream_requests_total.value("metrics-test:8040", "request", "2xx") == before + 1
+    assert metrics.upstream_request_duration_seconds.count("metrics-test:8040", "request") >= 1
+
+
+def test_db_pool_usage_reads_async_pool_stats():
+    class _Pool:
+        def get_stats(self):
+            return {"pool_min": 1, "pool_max": 20, "pool_size": 5, "pool_available": 2, "requests_waiting": 3}
+
+    assert dict(metrics.db_pool_usage(_Pool())) == {("in_use",): 3, ("idle",): 2, ("max",): 20, ("waiting",): 3}
+
+
+def test_ops_endpoints_require_the_ops_token(monkeypatch):
+    from ops import ops_router as ops_module
+
+    app = FastAPI()
+    app.include_router(ops_module.ops_router)
+    app.include_router(ops_module.metrics_router)
+    client = TestClient(app)
+
+    # 토큰이 설정되지 않은 환경에서는 운영 엔드포인트를 열지 않습니다.
+    monkeypatch.setattr(ops_module, "OPS_TOKEN", None)
+    assert client.get("/metrics", headers={"Authorization": "Bearer anything"}).status_code == 401
+
+    monkeypatch.setattr(ops_module, "OPS_TOKEN", "ops-secret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/ops/upstreams", headers={"Authorization": "Bearer user-jwt"}).status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer ops-secret"}).status_code == 200
@@ -0,0 +1,97 @@
+import asyncio
+import os
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from typing import List
+
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from common.dtos.wrapped_response import WrappedResponse
+from utils import proxy_request as proxy_module
+
+BODY = b'{"status":"success","data":[{"scenario_id":"s1","title":"t"}]}'
+
+
+class _Scenario(BaseModel):
+    scenario_id: str
+    title: str
+    difficulty: str
+
+
+class _MockResponse:
+    def __init__(self, status_code: int, body: bytes):
+        self.status_code = status_code
+        self.content = body
+        self.headers = {"content-type": "application/json; charset=utf-8"}
+
+
+def test_passthrough_returns_upstream_bytes_untouched():
+    class _Client:
+        async def request(self, **kwargs):
+            return _MockResponse(200, BODY)
+
+    proxy_module.http_holder.client = _Client()
+    result = asyncio.run(
+        proxy_module.proxy_request("GET", "http://state:8040", "/state/scenarios", "t", passthrough=True)
+    )
+
+    assert isinstance(result, Response)
+    assert result.body == BODY
+    assert result.status_code == 200
+    assert result.media_type == "application/json; charset=utf-8"
+
+
+def test_sampled_validation_reports_model_mismatch(monkeypatch):
+    warnings = []
+
+    class _Client:
+        async def request(self, **kwargs):
+            return _MockResponse(200, BODY)
+
+    monkeypatch.setattr(proxy_module, "PASSTHROUGH_VALIDATION_SAMPLE_RATE", 1.0)
+    monkeypatch.setattr(proxy_module, "warning", warnings.append)
+    proxy_module.http_holder.client = _Client()
+    asyncio.run(
+        proxy_module.proxy_request(
+            "GET",
+            "http://state:8040",
+            "/state/scenarios?v=2",
+            "t",
+            passthrough=True,
+            response_model=WrappedResponse[List[_Scenario]],
+        )
+    )
+
+    assert len(warnings) == 1
+
+
+def test_mutation_routes_forward_the_validated_model():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from state.state_router import state_router
+
+    captured = {}
+
+    class _Client:
+        async def request(self, **kwargs):
+            captured.update(kwargs)
+            return _MockResponse(200, b'{"status":"success","data":{}}')
+
+    proxy_module.http_holder.client = _Client()
+    app = FastAPI()
+    app.include_router(state_router)
+
+    response = TestClient(app).post(
+        "/state/player/item/earn",
+        headers={"Authorization": "Bearer t"},
+        json={"session_id": "s1", "player_id": "p1", "item_id": "i1", "quantity": "2", "unknown": True},
+    )
+
+    assert response.status_code == 200
+    assert "content" not in captured
+    # 알 수 없는 필드는 제거되고, 문자열 수량은 정수로 변환되며, 기본값이 채워집니다.
+    assert captured["json"] == {"session_id": "s1", "player_id": "p1", "item_id": "i1", "rule_id": None, "quantity": 2}
@@ -0,0 +1,90 @@
+import asyncio
+import os
+import sys
+import time
+import types
+
+import pytest
+from fastapi import HTTPException
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from configs.bulkheads import BulkheadConfig
+from utils.bulkhead import Bulkhead
+from utils.password_pool import PasswordPool
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordPool(Bulkhead("password", BulkheadConfig(max_concurrent=1, max_queue=1)))
+    yield pool
+    pool.shutdown()
+
+
+def test_work_runs_off_the_event_loop(pool):
+    async def _run():
+        ticks = 0
+
+        async def _ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(_ticker())
+        await pool.run("verify", time.sleep, 0.3)
+        ticker.cancel()
+        return ticks
+
+    # 워커가 0.3초 동안 일하는 사이에도 이벤트 루프는 계속 다른 작업을 처리합니다.
+    assert asyncio.run(_run()) >= 10
+
+
+def test_full_queue_is_rejected_with_retry_after(pool):
+    async def _run():
+        running = asyncio.create_task(pool.run("hash", time.sleep, 0.3))
+        await asyncio.sleep(0.05)
+        queued = asyncio.create_task(pool.run("hash", time.sleep, 0.01))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as rejected:
+            await pool.run("hash", time.sleep, 0.01)
+        await asyncio.gather(running, queued)
+        return rejected.value
+
+    rejected = asyncio.run(_run())
+    assert rejected.status_code == 503
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert pool.bulkhead.active == 0
+    assert pool.bulkhead.queued == 1
+
+
+def test_cancelled_caller_holds_slot_until_worker_finishes(pool):
+    async def _run():
+        task = asyncio.create_task(pool.run("verify", time.sleep, 0.2))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        # 워커는 아직 실행 중이므로 슬롯을 반환하지 않습니다.
+        held = pool.bulkhead.active
+        await asyncio.sleep(0.3)
+        return held, pool.bulkhead.active
+
+    assert asyncio.run(_run()) == (1, 0)
+
+
+def test_workers_do_not_rerun_the_parent_main_script(pool, tmp_path, monkeypatch):
+    # main.py를 직접 실행한 서버처럼, 다시 실행되면 표시 파일을 남기는 스크립트를 __main__으로 둡니다.
+    marker = tmp_path / "imported"
+    script = tmp_path / "server_main.py"
+    script.write_text(f"open({str(marker)!r}, 'w').close()\n")
+    fake_main = types.ModuleType("__main__")
+    fake_main.__file__ = str(script)
+    fake_main.__spec__ = None
+    monkeypatch.setitem(sys.modules, "__main__", fake_main)
+
+    hashed = asyncio.run(pool.hash("secret"))
+
+    assert asyncio.run(pool.verify("secret", hashed))
+    assert sys.modules["__main__"] is fake_main
+    assert not marker.exists()
@@ -0,0 +1,127 @@
+import asyncio
+import os
+
+import httpx
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils import proxy_stream as stream_module
+
+
+class _UpstreamBody(httpx.AsyncByteStream):
+    def __init__(self, chunks, delay: float = 0.0):
+        self.chunks = chunks
+        self.delay = delay
+        self.closed = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            yield chunk
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _install(body: _UpstreamBody, status_code: int = 200):
+    def _handler(request: httpx.Request):
+        return httpx.Response(status_code, stream=body, headers={"content-type": "text/event-stream"})
+
+    stream_module.http_holder.client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+
+
+async def _collect(generator, limit: int = 100):
+    frames = []
+    async for frame in generator:
+        frames.append(frame)
+        if len(frames) >= limit:
+            break
+    await generator.aclose()
+    return frames
+
+
+def test_events_are_relayed_on_sse_boundaries():
+    _install(_UpstreamBody([b"data: hel", b"lo\n\ndata: wor", b"ld\n\n"]))
+
+    async def _run():
+        return await _collect(await stream_module.proxy_stream("http://rule:8030", "/play/riddle/1", "t"))
+
+    assert asyncio.run(_run()) == [b"data: hello\n\n", b"data: world\n\n"]
+    assert stream_module.stream_stats.active == 0
+
+
+def test_upstream_error_becomes_error_event():
+    _install(_UpstreamBody([b"boom"]), status_code=502)
+
+    async def _run():
+        return await _collect(await stream_module.proxy_stream("http://rule:8030", "/play/quiz/1", "t"))
+
+    frames = asyncio.run(_run())
+    assert len(frames) == 1
+    assert frames[0].startswith(b"event: error\ndata: ")
+    assert b'"status_code": 502' in frames[0]
+
+
+def test_heartbeat_is_sent_while_upstream_is_idle(monkeypatch):
+    monkeypatch.setattr(stream_module, "SSE_HEARTBEAT_SECONDS", 0.01)
+    _install(_UpstreamBody([b"data: late\n\n"], delay=0.05))
+
+    async def _run():
+        return await _collect(await stream_module.proxy_stream("http://rule:8030", "/play/riddle/1", "t"))
+
+    frames = asyncio.run(_run())
+    assert b": heartbeat\n\n" in frames
+    assert frames[-1] == b"data: late\n\n"
+
+
+def test_client_going_away_closes_upstream_stream():
+    body = _UpstreamBody([b"data: %d\n\n" % i for i in range(1000)], delay=0.001)
+    _install(body)
+
+    async def _run():
+        frames = await _collect(await stream_module.proxy_stream("http://rule:8030", "/play/riddle/1", "t"), limit=2)
+        await asyncio.sleep(0.01)
+        return frames
+
+    frames = asyncio.run(_run())
+    assert frames == [b"data: 0\n\n", b"data: 1\n\n"]
+    assert body.closed
+    assert stream_module.stream_stats.active == 0
+
+
+def test_unconsumed_stream_does_not_hold_a_half_open_probe():
+    from utils.upstream_guard import BreakerState
+
+    _install(_UpstreamBody([b"data: 1\n\n"]))
+    guard = stream_module.upstream_guards.get(stream_module.upstream_name("http://rule:8030"))
+    guard.breaker.state = BreakerState.HALF_OPEN
+    guard.breaker._probes_in_flight = 0
+
+    async def _run():
+        # 응답 시작 전에 클라이언트가 끊겨 본문이 한 번도 소비되지 않은 경우
+        for _ in range(guard.breaker.policy.half_open_calls + 1):
+            await stream_module.proxy_stream("http://rule:8030", "/play/riddle/1", "t")
+
+    try:
+        asyncio.run(_run())
+        assert guard.breaker._probes_in_flight == 0
+        guard.check()
+    finally:
+        guard.breaker.state = BreakerState.CLOSED
+
+
+def test_cancelled_pump_with_full_queue_does_not_leak(monkeypatch):
+    monkeypatch.setattr(stream_module, "SSE_QUEUE_SIZE", 1)
+    _install(_UpstreamBody([b"data: %d\n\n" % i for i in range(100)]))
+
+    async def _run():
+        frames = await _collect(await stream_module.proxy_stream("http://rule:8030", "/play/riddle/1", "t"), limit=1)
+        await asyncio.sleep(0.05)
+        leftover = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        return frames, leftover
+
+    frames, leftover = asyncio.run(_run())
+    assert frames == [b"data: 0\n\n"]
+    assert leftover == []
@@ -0,0 +1,111 @@
+import asyncio
+import os
+
+import pytest
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils.redis_batcher import RedisBatcher
+
+
+class _Pipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def execute_command(self, *args):
+        self.commands.append(args)
+        return self
+
+    async def execute(self, raise_on_error=True):
+        self.redis.round_trips.append(self.commands)
+        if self.redis.down:
+            raise ConnectionError("redis down")
+        results = []
+        for name, key, *rest in self.commands:
+            if name == "SETEX":
+                self.redis.data[key] = rest[1]
+                results.append(True)
+            elif name == "GET":
+                results.append(self.redis.data.get(key))
+            else:
+                results.append(ValueError(f"unknown command {name}"))
+        return results
+
+
+class _Redis:
+    def __init__(self):
+        self.data = {}
+        self.round_trips = []
+        self.down = False
+
+    def pipeline(self, transaction=True):
+        assert transaction is False
+        return _Pipeline(self)
+
+
+def _batcher(max_batch=128):
+    batcher = RedisBatcher(max_batch=max_batch)
+    batcher.attach_redis(_Redis())
+    return batcher
+
+
+def test_concurrent_commands_share_one_round_trip():
+    batcher = _batcher()
+
+    async def _run():
+        await asyncio.gather(*(batcher.execute("SETEX", f"refresh_token:{i}", 60, f"t{i}") for i in range(10)))
+        return await batcher.execute("GET", "refresh_token:3")
+
+    assert asyncio.run(_run()) == "t3"
+    assert [len(trip) for trip in batcher.redis.round_trips] == [10, 1]
+    assert batcher.snapshot()["largest_batch"] == 10
+
+
+def test_large_bursts_are_split_at_max_batch():
+    batcher = _batcher(max_batch=3)
+
+    async def _run():
+        return await asyncio.gather(*(batcher.execute("SETEX", f"k{i}", 60, f"v{i}") for i in range(5)))
+
+    assert asyncio.run(_run()) == [True] * 5
+    assert [len(trip) for trip in batcher.redis.round_trips] == [3, 2]
+
+
+def test_command_error_only_fails_its_caller():
+    batcher = _batcher()
+
+    async def _run():
+        return await asyncio.gather(
+            batcher.execute("SETEX", "a", 60, "1"),
+            batcher.execute("HGETALL", "a"),
+            return_exceptions=True,
+        )
+
+    ok, failed = asyncio.run(_run())
+    assert ok is True
+    assert isinstance(failed, ValueError)
+
+
+def test_connection_failure_reaches_every_waiting_caller():
+    batcher = _batcher()
+    batcher.redis.down = True
+
+    async def _run():
+        return await asyncio.gather(batcher.execute("GET", "a"), batcher.execute("GET", "b"), return_exceptions=True)
+
+    results = asyncio.run(_run())
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert batcher.stats.errors == 1
+
+
+def test_unattached_batcher_refuses_commands():
+    with pytest.raises(RuntimeError):
+        asyncio.run(RedisBatcher().execute("GET", "a"))
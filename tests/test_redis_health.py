@@ -0,0 +1,48 @@
+import asyncio
+import os
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils.redis_health import RedisHealthMonitor
+
+
+class _Redis:
+    def __init__(self):
+        self.down = False
+        self.pings = 0
+
+    async def ping(self):
+        self.pings += 1
+        if self.down:
+            raise ConnectionError("redis down")
+        return True
+
+
+def test_background_check_tracks_failure_and_recovery():
+    redis = _Redis()
+    monitor = RedisHealthMonitor(interval=1.0)
+    monitor.redis = redis
+
+    assert asyncio.run(monitor.check()) is True
+    redis.down = True
+    assert asyncio.run(monitor.check()) is False
+    assert asyncio.run(monitor.check()) is False
+    assert monitor.snapshot()["consecutive_failures"] == 2
+    redis.down = False
+    assert asyncio.run(monitor.check()) is True
+    assert monitor.consecutive_failures == 0 and monitor.healthy
+
+
+def test_monitor_pings_on_its_own_schedule():
+    redis = _Redis()
+    monitor = RedisHealthMonitor(interval=0.01)
+
+    async def _run():
+        monitor.start(redis)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+    asyncio.run(_run())
+    assert redis.pings >= 2
+    assert monitor.snapshot()["healthy"] is True
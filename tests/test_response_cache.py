@@ -0,0 +1,141 @@
+import asyncio
+import os
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils import proxy_request as proxy_module
+from utils.response_cache import CacheEntry, CachePolicy, CacheScope, LruByteCache, response_cache
+
+
+class _MockResponse:
+    def __init__(self, body: bytes):
+        self.status_code = 200
+        self.content = body
+        self.headers = {"content-type": "application/json"}
+
+
+class _CountingClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def request(self, **kwargs):
+        self.calls += 1
+        return _MockResponse(b'{"status": "success", "data": {"n": %d}}' % self.calls)
+
+
+def _entry(size: int) -> CacheEntry:
+    return CacheEntry(body=b"x" * size, content_type="application/json", fresh_until=0, stale_until=0)
+
+
+def test_lru_evicts_by_byte_size():
+    lru = LruByteCache(max_bytes=800)
+    lru.set("a", _entry(100))
+    lru.set("b", _entry(100))
+    lru.get("a")
+    for i in range(7):
+        lru.set(f"c{i}", _entry(100))
+
+    assert lru.current_bytes <= 800
+    assert lru.get("a") is not None
+    assert lru.get("b") is None
+    assert lru.set("huge", _entry(500)) is False
+
+
+def test_cached_get_skips_upstream_on_hit():
+    response_cache.local.clear()
+    client = _CountingClient()
+    proxy_module.http_holder.client = client
+    policy = CachePolicy(ttl=60)
+
+    async def _run():
+        first = await proxy_module.proxy_request("GET", "http://rule:8030", "/info/world", "t1", cache=policy)
+        second = await proxy_module.proxy_request("GET", "http://rule:8030", "/info/world", "t2", cache=policy)
+        return first, second
+
+    first, second = asyncio.run(_run())
+    assert first == second == {"status": "success", "data": {"n": 1}}
+    assert client.calls == 1
+
+
+def test_user_scope_separates_tokens():
+    response_cache.local.clear()
+    client = _CountingClient()
+    proxy_module.http_holder.client = client
+    policy = CachePolicy(ttl=60, scope=CacheScope.USER)
+
+    async def _run():
+        await proxy_module.proxy_request("GET", "http://rule:8030", "/user/1", "t1", cache=policy)
+        await proxy_module.proxy_request("GET", "http://rule:8030", "/user/1", "t2", cache=policy)
+
+    asyncio.run(_run())
+    assert client.calls == 2
+
+
+def test_stale_entry_is_served_while_revalidating():
+    response_cache.local.clear()
+    client = _CountingClient()
+    proxy_module.http_holder.client = client
+    policy = CachePolicy(ttl=0, stale_ttl=60)
+
+    async def _run():
+        first = await proxy_module.proxy_request("GET", "http://rule:8030", "/info/npc/1", "t", cache=policy)
+        stale = await proxy_module.proxy_request("GET", "http://rule:8030", "/info/npc/1", "t", cache=policy)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        return first, stale
+
+    first, stale = asyncio.run(_run())
+    assert stale == first
+    assert client.calls == 2
+
+
+def test_global_cache_hit_still_requires_a_locally_verified_token(monkeypatch):
+    import time
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from jose import jwt
+
+    from info.info_router import info_router
+    from utils import claims as claims_module
+
+    monkeypatch.setattr(claims_module, "SECRET_KEY", "test-secret")
+    monkeypatch.setattr(claims_module, "ALGORITHM", "HS256")
+    response_cache.local.clear()
+    client = _CountingClient()
+    proxy_module.http_holder.client = client
+    app = FastAPI()
+    app.include_router(info_router)
+    http = TestClient(app)
+    valid = jwt.encode({"sub": "7", "exp": int(time.time()) + 60}, "test-secret", algorithm="HS256")
+
+    # 유효한 토큰으로 캐시를 채운 뒤에도, 위조된 토큰에는 캐시된 본문을 돌려주지 않아야 합니다.
+    assert http.get("/info/world", headers={"Authorization": f"Bearer {valid}"}).status_code == 200
+    response = http.get("/info/world", headers={"Authorization": "Bearer not-a-jwt"})
+
+    assert response.status_code == 401
+    assert client.calls == 1
+
+
+def test_concurrent_misses_with_different_tokens_do_not_share_a_flight():
+    response_cache.local.clear()
+
+    class _SlowClient(_CountingClient):
+        async def request(self, **kwargs):
+            await asyncio.sleep(0.01)
+            return await super().request(**kwargs)
+
+    client = _SlowClient()
+    proxy_module.http_holder.client = client
+    policy = CachePolicy(ttl=60)
+
+    async def _run():
+        # 검증되지 않은 토큰이 다른 사용자의 인증으로 진행 중인 호출에 합류하지 않아야 합니다.
+        await asyncio.gather(
+            proxy_module.proxy_request("GET", "http://rule:8030", "/info/npc/9", "t1", cache=policy),
+            proxy_module.proxy_request("GET", "http://rule:8030", "/info/npc/9", "forged", cache=policy),
+        )
+
+    asyncio.run(_run())
+    assert client.calls == 2
@@ -0,0 +1,93 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import HTTPException
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from configs.upstreams import UpstreamPolicy
+from utils import retry_policy as retry_module
+from utils.retry_policy import RetryBudget, RetryPolicy, call_with_retry
+from utils.upstream_guard import UpstreamGuard, UpstreamRejected
+
+FAST = RetryPolicy(base_delay=0.0, max_delay=0.0)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_budget(monkeypatch):
+    monkeypatch.setattr(retry_module, "retry_budget", RetryBudget(ratio=0.1, min_per_second=5))
+
+
+def _guard() -> UpstreamGuard:
+    return UpstreamGuard("test", UpstreamPolicy())
+
+
+def _flaky(failures: int, status_code: int = 503):
+    calls = {"count": 0}
+
+    async def _attempt():
+        calls["count"] += 1
+        if calls["count"] <= failures:
+            raise HTTPException(status_code=status_code, detail="upstream")
+        return "ok"
+
+    return _attempt, calls
+
+
+def test_transient_failure_is_retried_until_success():
+    attempt, calls = _flaky(failures=2)
+
+    assert asyncio.run(call_with_retry(FAST, _guard(), attempt)) == "ok"
+    assert calls["count"] == 3
+
+
+def test_non_retryable_status_and_guard_rejection_are_not_retried():
+    attempt, calls = _flaky(failures=1, status_code=404)
+    with pytest.raises(HTTPException):
+        asyncio.run(call_with_retry(FAST, _guard(), attempt))
+    assert calls["count"] == 1
+
+    rejected = {"count": 0}
+
+    async def _rejected():
+        rejected["count"] += 1
+        raise UpstreamRejected(status_code=503, detail="open")
+
+    with pytest.raises(UpstreamRejected):
+        asyncio.run(call_with_retry(FAST, _guard(), _rejected))
+    assert rejected["count"] == 1
+
+
+def test_non_get_requires_explicit_idempotency():
+    assert RetryPolicy().applies_to("GET")
+    assert not RetryPolicy().applies_to("POST")
+    assert RetryPolicy(idempotent=True).applies_to("POST")
+
+
+def test_exhausted_budget_stops_retries(monkeypatch):
+    budget = RetryBudget(ratio=0.0, min_per_second=0)
+    budget.tokens = 0
+    monkeypatch.setattr(retry_module, "retry_budget", budget)
+    attempt, calls = _flaky(failures=2)
+
+    with pytest.raises(HTTPException):
+        asyncio.run(call_with_retry(FAST, _guard(), attempt))
+    assert calls["count"] == 1
+    assert budget.snapshot()["exhausted"] == 1
+
+
+def test_slow_primary_is_hedged_and_faster_response_wins():
+    policy = RetryPolicy(hedge=True, hedge_fallback_delay=0.01)
+    started = []
+
+    async def _attempt():
+        started.append(len(started))
+        if len(started) == 1:
+            await asyncio.sleep(1)
+            return "slow"
+        return "fast"
+
+    assert asyncio.run(call_with_retry(policy, _guard(), _attempt)) == "fast"
+    assert len(started) == 2
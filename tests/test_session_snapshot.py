@@ -0,0 +1,55 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import HTTPException
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from state import snapshot_service
+from state.dtos.state_dtos import SnapshotSection
+
+
+def test_sections_selector_accepts_comma_and_repeated_values():
+    assert snapshot_service.parse_sections(None) == list(SnapshotSection)
+    assert snapshot_service.parse_sections(["npcs,enemies", "npcs", "items"]) == [
+        SnapshotSection.NPCS,
+        SnapshotSection.ENEMIES,
+        SnapshotSection.ITEMS,
+    ]
+    with pytest.raises(HTTPException) as exc:
+        snapshot_service.parse_sections(["npcs,unknown"])
+    assert exc.value.status_code == 422
+
+
+def test_snapshot_fans_out_concurrently_and_keeps_partial_failures(monkeypatch):
+    in_flight = {"now": 0, "peak": 0}
+
+    async def _fake_proxy(method, base_url, path, token=None, **kwargs):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if path.endswith("/enemies"):
+            raise HTTPException(status_code=503, detail="state-manager down")
+        return {"status": "success", "data": {"path": path}}
+
+    monkeypatch.setattr(snapshot_service, "proxy_request", _fake_proxy)
+    sections = list(SnapshotSection)
+    snapshot = asyncio.run(snapshot_service.build_session_snapshot("s1", "t", sections))
+
+    assert in_flight["peak"] == len(sections)
+    assert snapshot.sections[SnapshotSection.NPCS] == {"path": "/state/session/s1/npcs"}
+    assert SnapshotSection.ENEMIES not in snapshot.sections
+    assert snapshot.errors[SnapshotSection.ENEMIES].status_code == 503
+
+
+def test_snapshot_raises_when_every_section_fails(monkeypatch):
+    async def _fake_proxy(method, base_url, path, token=None, **kwargs):
+        raise HTTPException(status_code=404, detail="세션 없음")
+
+    monkeypatch.setattr(snapshot_service, "proxy_request", _fake_proxy)
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(snapshot_service.build_session_snapshot("s1", "t", [SnapshotSection.SESSION]))
+    assert exc.value.status_code == 404
@@ -0,0 +1,91 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import HTTPException
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils import proxy_request as proxy_module
+from utils.single_flight import SingleFlight
+
+
+class _MockResponse:
+    def __init__(self, status_code: int, body):
+        self.status_code = status_code
+        self._body = body
+        self.text = ""
+
+    def json(self):
+        return self._body
+
+
+class _SlowClient:
+    def __init__(self, status_code: int = 200, body=None):
+        self.calls = 0
+        self.status_code = status_code
+        self.body = body if body is not None else {"ok": True}
+
+    async def request(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return _MockResponse(self.status_code, self.body)
+
+
+def test_concurrent_identical_gets_share_one_upstream_call():
+    client = _SlowClient()
+    proxy_module.http_holder.client = client
+
+    async def _run():
+        calls = [proxy_module.proxy_request("GET", "http://state:8040", "/state/scenario/s1", "t") for _ in range(20)]
+        return await asyncio.gather(*calls)
+
+    results = asyncio.run(_run())
+    assert results == [{"ok": True}] * 20
+    assert client.calls == 1
+
+
+def test_different_tokens_are_not_coalesced_without_global_cache():
+    client = _SlowClient()
+    proxy_module.http_holder.client = client
+
+    async def _run():
+        await asyncio.gather(
+            proxy_module.proxy_request("GET", "http://state:8040", "/state/session/1", "t1"),
+            proxy_module.proxy_request("GET", "http://state:8040", "/state/session/1", "t2"),
+        )
+
+    asyncio.run(_run())
+    assert client.calls == 2
+
+
+def test_upstream_error_propagates_to_every_waiter():
+    client = _SlowClient(status_code=502, body={"detail": "bad gateway"})
+    proxy_module.http_holder.client = client
+
+    async def _run():
+        calls = [proxy_module.proxy_request("GET", "http://state:8040", "/state/scenarios", "t") for _ in range(5)]
+        return await asyncio.gather(*calls, return_exceptions=True)
+
+    results = asyncio.run(_run())
+    assert client.calls == 1
+    assert all(isinstance(r, HTTPException) and r.status_code == 502 for r in results)
+
+
+def test_waiter_cancellation_does_not_cancel_shared_call():
+    flights = SingleFlight()
+
+    async def _run():
+        async def _work():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        first = asyncio.ensure_future(flights.do("k", _work))
+        second = asyncio.ensure_future(flights.do("k", _work))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(_run()) == "done"
+    assert flights.snapshot()["coalescing_ratio"] == pytest.approx(0.5)
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from utils.sql_registry import SqlRegistry
+
+
+def test_loads_every_domain_query_by_name_header():
+    registry = SqlRegistry().load()
+
+    query = registry.get("auth", "get_user_for_auth")
+    assert query.key == "auth.get_user_for_auth"
+    assert "FROM users" in query.text
+    assert {q.key for q in registry} >= {"auth.create_user", "info.get_items", "info.count_items"}
+
+
+def test_get_returns_the_same_object_without_rereading(tmp_path):
+    queries = tmp_path / "info" / "queries"
+    queries.mkdir(parents=True)
+    (queries / "get_items.sql").write_text("-- name: get_items\nSELECT 1;\n")
+    registry = SqlRegistry(str(tmp_path)).load()
+
+    first = registry.get("info", "get_items")
+    (queries / "get_items.sql").write_text("-- name: get_items\nSELECT 2;\n")
+
+    assert registry.get("info", "get_items") is first
+    with pytest.raises(KeyError):
+        registry.get("info", "missing")
+
+
+@pytest.mark.parametrize(
+    "files",
+    [
+        {"a.sql": "SELECT 1;"},
+        {"a.sql": "-- name: same\nSELECT 1;", "b.sql": "-- name: same\nSELECT 2;"},
+    ],
+)
+def test_missing_or_duplicate_names_fail_at_load(tmp_path, files):
+    queries = tmp_path / "auth" / "queries"
+    queries.mkdir(parents=True)
+    for filename, text in files.items():
+        (queries / filename).write_text(text)
+
+    with pytest.raises(ValueError):
+        SqlRegistry(str(tmp_path)).load()
@@ -0,0 +1,76 @@
+import asyncio
+import os
+
+import pytest
+from fastapi import HTTPException
+
+os.environ.setdefault("APP_PORT", "8010")
+os.environ.setdefault("REMOTE_HOST", "localhost")
+
+from configs.upstreams import UpstreamPolicy
+from utils import proxy_request as proxy_module
+from utils.upstream_guard import AimdLimiter, BreakerState, CircuitBreaker, UpstreamGuard, upstream_guards
+
+
+class _MockResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.text = ""
+
+    def json(self):
+        return {"detail": "upstream"}
+
+
+def test_breaker_opens_on_failure_rate_and_recovers_through_half_open():
+    policy = UpstreamPolicy(minimum_calls=4, window_size=4, open_seconds=0.0, half_open_calls=1)
+    breaker = CircuitBreaker(policy)
+
+    for ok in (True, False, False, True):
+        breaker.record(ok, probe=breaker.allow())
+    assert breaker.state == BreakerState.OPEN
+
+    probe = breaker.allow()
+    assert probe is True
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert breaker.allow() is None
+
+    breaker.record(True, probe)
+    assert breaker.state == BreakerState.CLOSED
+
+
+def test_open_breaker_fails_fast_with_retry_after():
+    guard = UpstreamGuard("gm", UpstreamPolicy(minimum_calls=1, window_size=1, open_seconds=30.0))
+    guard.release(guard.acquire(), ok=False)
+
+    with pytest.raises(HTTPException) as exc:
+        guard.acquire()
+    assert exc.value.status_code == 503
+    assert int(exc.value.headers["Retry-After"]) > 0
+
+
+def test_aimd_limiter_rejects_over_limit_and_backs_off():
+    limiter = AimdLimiter(UpstreamPolicy(initial_limit=2, min_limit=1, slow_call_seconds=1.0))
+    assert limiter.try_acquire() and limiter.try_acquire()
+    assert limiter.try_acquire() is False
+
+    limiter.release(ok=True, latency=5.0)
+    assert limiter.limit < 2
+
+
+def test_proxy_request_counts_5xx_as_upstream_failures():
+    class _Client:
+        async def request(self, **kwargs):
+            return _MockResponse(502)
+
+    proxy_module.http_holder.client = _Client()
+    guard = upstream_guards.get("breaker-test:1")
+
+    async def _call():
+        with pytest.raises(HTTPException):
+            await proxy_module.proxy_request("POST", "http://breaker-test:1", "/x", "t", json={})
+
+    for _ in range(guard.breaker.policy.minimum_calls):
+        asyncio.run(_call())
+
+    assert guard.breaker.state == BreakerState.OPEN
+    assert guard.limiter.in_flight == 0